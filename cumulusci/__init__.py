@@ -1,8 +1,8 @@
+import importlib.abc
+import importlib.machinery
 import os
 import sys
 
-from simple_salesforce import api, bulk
-
 __import__("pkg_resources").declare_namespace("cumulusci")
 
 __location__ = os.path.dirname(os.path.realpath(__file__))
@@ -13,5 +13,41 @@ with open(os.path.join(__location__, "version.txt")) as f:
 if sys.version_info < (3, 8):  # pragma: no cover
     raise Exception("CumulusCI requires Python 3.8+.")
 
-api.OrderedDict = dict
-bulk.OrderedDict = dict
+
+# simple_salesforce parses responses into OrderedDicts; we want plain dicts.
+# Its modules are patched when they are first imported rather than imported
+# here, so that importing cumulusci (e.g. to start the CLI) stays fast.
+SIMPLE_SALESFORCE_MODULES = ("simple_salesforce.api", "simple_salesforce.bulk")
+
+
+def _patch_simple_salesforce_module(module):
+    module.OrderedDict = dict
+
+
+class _PatchingLoader(importlib.abc.Loader):
+    def __init__(self, loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        _patch_simple_salesforce_module(module)
+
+
+class _SimpleSalesforcePatcher(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in SIMPLE_SALESFORCE_MODULES:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _PatchingLoader(spec.loader)
+        return spec
+
+
+if any(name in sys.modules for name in SIMPLE_SALESFORCE_MODULES):
+    for name in SIMPLE_SALESFORCE_MODULES:
+        _patch_simple_salesforce_module(__import__(name, fromlist=["_"]))
+else:
+    sys.meta_path.insert(0, _SimpleSalesforcePatcher())
@@ -1,15 +1,12 @@
 import code
 import contextlib
+import importlib
 import pdb
 import runpy
 import sys
 import traceback
 
 import click
-import requests
-import rich
-from rich.console import Console
-from rich.markup import escape
 
 import cumulusci
 from cumulusci.core.debug import set_debug_mode
@@ -18,20 +15,12 @@ from cumulusci.utils import get_cci_upgrade_command
 from cumulusci.utils.http.requests_utils import init_requests_trust
 from cumulusci.utils.logging import tee_stdout_stderr
 
-from .error import error
-from .flow import flow
 from .logger import get_tempfile_logger, init_logger
-from .org import org
-from .plan import plan
-from .project import project
-from .robot import robot
-from .runtime import CliRuntime, pass_runtime
-from .service import service
-from .task import task
 from .utils import (
     check_latest_version,
     get_installed_version,
     get_latest_final_version,
+    pass_runtime,
     warn_if_no_long_paths,
 )
 
@@ -41,6 +30,41 @@ SUGGEST_ERROR_COMMAND = (
 
 USAGE_ERRORS = (CumulusCIUsageError, click.UsageError)
 
+# Top level groups, imported when they are first used so that the modules
+# (and everything they import) of other commands don't slow down startup.
+# For the same reason, this module imports the runtime, rich and requests
+# only where they are used.
+LAZY_SUBCOMMANDS = {
+    "error": "cumulusci.cli.error:error",
+    "flow": "cumulusci.cli.flow:flow",
+    "org": "cumulusci.cli.org:org",
+    "plan": "cumulusci.cli.plan:plan",
+    "project": "cumulusci.cli.project:project",
+    "robot": "cumulusci.cli.robot:robot",
+    "service": "cumulusci.cli.service:service",
+    "task": "cumulusci.cli.task:task",
+}
+
+
+class LazyGroup(click.Group):
+    """A click group that imports its subcommands on demand."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name):
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        return getattr(importlib.import_module(module_name), attribute)
+
 
 #
 # Root command
@@ -52,6 +76,8 @@ def main(args=None):
 
     This wraps the `click` library in order to do some initialization and centralized error handling.
     """
+    from .runtime import CliRuntime
+
     with contextlib.ExitStack() as stack:
         args = args or sys.argv
 
@@ -90,6 +116,8 @@ def main(args=None):
             try:
                 cli(args[1:], standalone_mode=False, obj=runtime)
             except click.Abort:  # Keyboard interrupt
+                from rich.console import Console
+
                 console = Console()
                 show_debug_info() if debug else console.print("\n[red bold]Aborted!")
                 sys.exit(1)
@@ -115,6 +143,10 @@ def handle_exception(
     """Displays error of appropriate message back to user, prompts user to investigate further
     with `cci error` commands, and writes the traceback to the latest logfile.
     """
+    import requests
+    from rich.console import Console
+    from rich.markup import escape
+
     error_console = Console(stderr=True)
     if isinstance(error, requests.exceptions.ConnectionError):
         connection_error_message(error_console)
@@ -136,7 +168,7 @@ def handle_exception(
         error_console.print_exception()
 
 
-def connection_error_message(console: Console):
+def connection_error_message(console):
     message = (
         "We encountered an error with your internet connection. "
         "Please check your connection and try the last cci command again."
@@ -151,6 +183,8 @@ def show_debug_info():
 
 
 def show_version_info():
+    import rich
+
     console = rich.get_console()
     console.print(f"CumulusCI version: {cumulusci.__version__} ({sys.argv[0]})")
     console.print(f"Python version: {sys.version.split()[0]} ({sys.executable})")
@@ -174,6 +208,8 @@ def show_version_info():
 
 def display_release_notes_link(latest_version: str) -> None:
     """Provide a link to the latest CumulusCI Release Notes"""
+    import rich
+
     release_notes_link = (
         f"https://github.com/SFDO-Tooling/CumulusCI/releases/tag/v{latest_version}"
     )
@@ -192,7 +228,7 @@ def version_info_wrapper(
     ctx.exit()
 
 
-@click.group("main", help="")
+@click.group("main", help="", cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.option(  # based on https://click.palletsprojects.com/en/8.1.x/options/#callbacks-and-eager-options
     "--version",
     is_flag=True,
@@ -230,15 +266,3 @@ def shell(runtime, script=None, python=None):
         exec(python, variables)
     else:
         code.interact(local=variables)
-
-
-# Top Level Groups
-
-cli.add_command(error)
-cli.add_command(project)
-cli.add_command(org)
-cli.add_command(service)
-cli.add_command(task)
-cli.add_command(flow)
-cli.add_command(plan)
-cli.add_command(robot)
@@ -4,9 +4,6 @@ import os
 import sys
 import tempfile
 
-import requests
-from rich.logging import RichHandler
-
 try:
     import colorama
 except ImportError:
@@ -16,6 +13,7 @@ except ImportError:
 
 def init_logger(debug=False):
     """Initialize the logger"""
+    from rich.logging import RichHandler
 
     logger = logging.getLogger(__name__.split(".")[0])
     for handler in logger.handlers:  # pragma: no cover
@@ -36,6 +34,8 @@ def init_logger(debug=False):
     logger.propagate = False
 
     if debug:  # pragma: no cover
+        import requests
+
         # Referenced from:
         # https://github.com/urllib3/urllib3/blob/cd55f2fe98df4d499ab5c826433ee4995d3f6a60/src/urllib3/__init__.py#L48
         def add_rich_logger(
@@ -1,4 +1,3 @@
-import functools
 import os
 import sys
 from logging import getLogger
@@ -8,7 +7,7 @@ import click
 import keyring
 import pkg_resources
 
-from cumulusci.cli.utils import get_installed_version
+from cumulusci.cli.utils import get_installed_version, pass_runtime  # noqa: F401
 from cumulusci.core.exceptions import ConfigError, KeychainKeyNotFound, OrgNotFound
 from cumulusci.core.runtime import BaseCumulusCI
 from cumulusci.core.utils import import_global
@@ -167,24 +166,3 @@ class CliRuntime(BaseCumulusCI):
 
 # for backwards-compatibility
 CliConfig = CliRuntime
-
-
-def pass_runtime(func=None, require_project=True, require_keychain=False):
-    """Decorator which passes the CCI runtime object as the first arg to a click command."""
-
-    def decorate(func):
-        @click.pass_context
-        def new_func(ctx, *args, **kw):
-            runtime = ctx.obj
-            if require_project and runtime.project_config is None:
-                raise runtime.project_config_error
-            if require_keychain:
-                runtime._load_keychain()
-            func(runtime, *args, **kw)
-
-        return functools.update_wrapper(new_func, func)
-
-    if func is None:
-        return decorate
-    else:
-        return decorate(func)
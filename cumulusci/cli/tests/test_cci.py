@@ -2,6 +2,8 @@ import contextlib
 import io
 import os
 import shutil
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest import mock
@@ -23,6 +25,21 @@ from cumulusci.utils import temporary_dir
 MagicMock = mock.MagicMock()
 CONSOLE = mock.Mock()
 
+# Modules which importing the CLI must not import, as they are slow to
+# import and not needed by every command
+HEAVY_MODULES = [
+    "cumulusci.core.config",
+    "cumulusci.core.flowrunner",
+    "github3",
+    "lxml",
+    "requests",
+    "rich",
+    "robot",
+    "simple_salesforce",
+    "snowfakery",
+    "sqlalchemy",
+]
+
 
 @pytest.fixture(autouse=True)
 def env_config():
@@ -47,7 +64,7 @@ def env_config():
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
 @mock.patch("cumulusci.cli.cci.init_logger")
 @mock.patch("cumulusci.cli.cci.check_latest_version")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 @mock.patch("cumulusci.cli.cci.cli")
 def test_main(
     cli,
@@ -71,7 +88,7 @@ def test_main(
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
 @mock.patch("cumulusci.cli.cci.init_logger")
 @mock.patch("cumulusci.cli.cci.check_latest_version")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 @mock.patch("cumulusci.cli.cci.cli")
 @mock.patch("pdb.post_mortem")
 @mock.patch("sys.exit")
@@ -104,7 +121,7 @@ def test_main__debug(
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
 @mock.patch("cumulusci.cli.cci.init_logger")
 @mock.patch("cumulusci.cli.cci.check_latest_version")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 @mock.patch("cumulusci.cli.cci.cli")
 @mock.patch("pdb.post_mortem")
 def test_main__cci_show_stacktraces(
@@ -154,7 +171,7 @@ def test_main__abort(
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
 @mock.patch("cumulusci.cli.cci.init_logger")
 @mock.patch("cumulusci.cli.cci.check_latest_version")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 @mock.patch("cumulusci.cli.cci.cli")
 @mock.patch("pdb.post_mortem")
 @mock.patch("sys.exit")
@@ -191,7 +208,7 @@ def test_main__error(
 
 @mock.patch("cumulusci.cli.cci.tee_stdout_stderr")
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 def test_main__CliRuntime_error(CliRuntime, get_tempfile_logger, tee):
     CliRuntime.side_effect = CumulusCIException("something happened")
     get_tempfile_logger.return_value = mock.Mock(), "tempfile.log"
@@ -211,7 +228,7 @@ def test_main__CliRuntime_error(CliRuntime, get_tempfile_logger, tee):
 @mock.patch("cumulusci.cli.cci.init_logger")  # side effects break other tests
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
 @mock.patch("cumulusci.cli.cci.tee_stdout_stderr")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 @mock.patch("sys.exit", MagicMock())
 def test_handle_org_name(
     CliRuntime, tee_stdout_stderr, get_tempfile_logger, init_logger
@@ -244,7 +261,7 @@ def test_handle_org_name(
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
 @mock.patch("cumulusci.cli.cci.tee_stdout_stderr")
 @mock.patch("sys.exit")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 def test_cci_org_default__no_orgname(
     CliRuntime, exit, tee_stdout_stderr, get_tempfile_logger, init_logger
 ):
@@ -267,7 +284,7 @@ def test_cci_org_default__no_orgname(
 @mock.patch("cumulusci.tasks.salesforce.Deploy.__call__", mock.Mock())
 @mock.patch("sys.exit", mock.Mock())
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 @mock.patch("cumulusci.tasks.salesforce.Deploy.__init__")
 def test_cci_run_task_options__with_dash(
     Deploy,
@@ -299,7 +316,7 @@ def test_cci_run_task_options__with_dash(
 @mock.patch("cumulusci.tasks.salesforce.Deploy.__call__", mock.Mock())
 @mock.patch("sys.exit", mock.Mock())
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 @mock.patch("cumulusci.tasks.salesforce.Deploy.__init__")
 def test_cci_run_task_options__old_style_with_dash(
     Deploy,
@@ -462,14 +479,61 @@ def test_shell__no_project(interact):
 
 
 def test_cover_command_groups():
-    run_click_command(cci.project)
-    run_click_command(cci.org)
-    run_click_command(cci.task)
-    run_click_command(cci.flow)
-    run_click_command(cci.service)
+    for name in ("project", "org", "task", "flow", "service"):
+        run_click_command(cci.cli.get_command(None, name))
     # no assertion; this test is for coverage of empty methods
 
 
+def test_lazy_subcommands():
+    assert cci.cli.list_commands(None) == [
+        "error",
+        "flow",
+        "org",
+        "plan",
+        "project",
+        "robot",
+        "service",
+        "shell",
+        "task",
+        "version",
+    ]
+    from cumulusci.cli.org import org
+
+    assert cci.cli.get_command(None, "org") is org
+    assert cci.cli.get_command(None, "bogus") is None
+
+
+def test_import_time():
+    # Importing the CLI must not import the modules of every command,
+    # nor the heavy dependencies which only some of them use.
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import cumulusci.cli.cci"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    imported = {line.split("|")[2].strip() for line in output.splitlines()[1:]}
+
+    lazy_modules = [path.split(":")[0] for path in cci.LAZY_SUBCOMMANDS.values()]
+    for module in lazy_modules + HEAVY_MODULES:
+        assert module not in imported
+
+
+def test_import__simple_salesforce_patched():
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import cumulusci; from simple_salesforce import api, bulk; "
+            "print(api.OrderedDict is dict, bulk.OrderedDict is dict)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output.split() == ["True", "True"]
+
+
 @mock.patch(
     "cumulusci.cli.runtime.CliRuntime.get_org",
     lambda *args, **kwargs: (MagicMock(), MagicMock()),
@@ -520,7 +584,7 @@ def mock_validate_debug(value):
 @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
 @mock.patch("cumulusci.cli.cci.init_logger")
 @mock.patch("cumulusci.cli.cci.check_latest_version")
-@mock.patch("cumulusci.cli.cci.CliRuntime")
+@mock.patch("cumulusci.cli.runtime.CliRuntime")
 @mock.patch("cumulusci.cli.cci.show_version_info")
 def test_dash_dash_version(
     show_version_info,
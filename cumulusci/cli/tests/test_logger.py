@@ -6,9 +6,8 @@ from ..logger import get_tempfile_logger, init_logger
 
 
 class TestLogger:
-    @patch("cumulusci.cli.logger.requests")
     @patch("cumulusci.cli.logger.logging")
-    def test_init_logger(self, logging, requests):
+    def test_init_logger(self, logging):
         logger = Mock(handlers=["leftover"])
         logging.getLogger.return_value = logger
         init_logger()
@@ -1,4 +1,5 @@
 import contextlib
+import functools
 import os
 import re
 import sys
@@ -7,11 +8,8 @@ from collections import defaultdict
 
 import click
 import pkg_resources
-import requests
-from rich.console import Console
 
 from cumulusci import __version__
-from cumulusci.core.config import UniversalConfig
 from cumulusci.utils import get_cci_upgrade_command
 from cumulusci.utils.http.requests_utils import safe_json_from_response
 
@@ -35,9 +33,31 @@ def group_items(items):
     return groups
 
 
+def pass_runtime(func=None, require_project=True, require_keychain=False):
+    """Decorator which passes the CCI runtime object as the first arg to a click command."""
+
+    def decorate(func):
+        @click.pass_context
+        def new_func(ctx, *args, **kw):
+            runtime = ctx.obj
+            if require_project and runtime.project_config is None:
+                raise runtime.project_config_error
+            if require_keychain:
+                runtime._load_keychain()
+            func(runtime, *args, **kw)
+
+        return functools.update_wrapper(new_func, func)
+
+    if func is None:
+        return decorate
+    else:
+        return decorate(func)
+
+
 @contextlib.contextmanager
 def timestamp_file():
     """Opens a file for tracking the time of the last version check"""
+    from cumulusci.core.config import UniversalConfig
 
     config_dir = UniversalConfig.default_cumulusci_dir()
     timestamp_file = os.path.join(config_dir, "cumulus_timestamp")
@@ -65,6 +85,8 @@ def is_final_release(version: str) -> bool:
 def get_latest_final_version():
     """return the latest version of cumulusci in pypi, be defensive"""
     # use the pypi json api https://wiki.python.org/moin/PyPIJSON
+    import requests
+
     res = safe_json_from_response(
         requests.get("https://pypi.org/pypi/cumulusci/json", timeout=5)
     )
@@ -81,6 +103,8 @@ def get_latest_final_version():
 
 def check_latest_version():
     """checks for the latest version of cumulusci from pypi, max once per hour"""
+    import requests
+
     check = True
 
     with timestamp_file() as f:
@@ -134,7 +158,11 @@ def win32_long_paths_enabled() -> bool:
     return is_enabled == 1
 
 
-def warn_if_no_long_paths(console: Console = Console()) -> None:
+def warn_if_no_long_paths(console=None) -> None:
     """Print a warning to the user if long paths are not enabled."""
     if sys.platform.startswith("win") and not win32_long_paths_enabled():
+        if console is None:
+            from rich.console import Console
+
+            console = Console()
         console.print(WIN_LONG_PATH_WARNING)
@@ -21,6 +21,7 @@ class FlowConfig(BaseConfig):
     description: str
     steps: dict
     group: str
+    batch_metadata_etl: bool
     checks: list
     project_config: "BaseProjectConfig"
     title: str
@@ -1,5 +1,6 @@
 import os
 import re
+import time
 from collections import defaultdict, namedtuple
 from contextlib import contextmanager
 from datetime import date, datetime
@@ -69,6 +70,13 @@ class OrgConfig(BaseConfig):
     # make sure it can be mocked for tests
     OAuth2Client = OAuth2Client
 
+    # Salesforce doesn't tell us when an access token expires. Sessions time out
+    # after a period of inactivity that can be set as low as 15 minutes, so a
+    # token issued more recently than that is safe to reuse without a refresh.
+    access_token_max_age = 15 * 60
+    # Info loaded by refresh_oauth_token which must be cached to reuse a token
+    refreshed_info_keys = ("userinfo", "org_type")
+
     def __init__(self, config: dict, name: str, keychain=None, global_org=False):
         self.keychain = keychain
         self.global_org = global_org
@@ -80,6 +88,7 @@ class OrgConfig(BaseConfig):
         self._installed_packages = None
         self._is_person_accounts_enabled = None
         self._multiple_currencies_is_enabled = False
+        self._org_sobject = None
 
         super().__init__(config)
 
@@ -111,9 +120,29 @@ class OrgConfig(BaseConfig):
                 info = self._refresh_token(keychain, connected_app)
             if info != self.config:
                 self.config.update(info)
+            self.config["access_token_issued_at"] = time.time()
         self._load_userinfo()
         self._load_orginfo()
 
+    def refresh_oauth_token_if_needed(self, keychain):
+        """Refresh the access token unless a recently issued one can be reused.
+
+        The token is reused along with the user and org info already cached in
+        the org config if it was issued less than `access_token_max_age`
+        seconds ago. Since the org config is stored in the keychain, a token
+        refreshed by one task or cci process is reused by the next.
+        """
+        if not self._can_reuse_access_token():
+            self.refresh_oauth_token(keychain)
+
+    def _can_reuse_access_token(self):
+        issued_at = self.config.get("access_token_issued_at")
+        if not issued_at or not self.config.get("access_token"):
+            return False
+        if any(key not in self.config for key in self.refreshed_info_keys):
+            return False
+        return 0 <= time.time() - issued_at < self.access_token_max_age
+
     @contextmanager
     def save_if_changed(self):
         orig_config = self.config.copy()
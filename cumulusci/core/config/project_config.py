@@ -38,11 +38,7 @@ from cumulusci.core.source import GitHubSource, LocalFolderSource, NullSource
 from cumulusci.core.utils import merge_config
 from cumulusci.utils.fileutils import open_fs_resource
 from cumulusci.utils.git import current_branch, git_path, parse_repo_url, split_repo_url
-from cumulusci.utils.yaml.cumulusci_yml import (
-    GitHubSourceModel,
-    LocalFolderSourceModel,
-    cci_safe_load,
-)
+from cumulusci.utils.yaml.cumulusci_yml import GitHubSourceModel, LocalFolderSourceModel
 
 
 class ProjectConfigPropertiesMixin(BaseConfig):
@@ -125,23 +121,29 @@ class BaseProjectConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
                 f"The file {self.config_filename} was not found in the repo root: {repo_root}. Are you in a CumulusCI Project directory?"
             )
 
+        cache = self.universal_config_obj.config_cache
+
         # Load the project's yaml config file
-        project_config = cci_safe_load(self.config_project_path, logger=self.logger)
+        project_config, project_digest = cache.load_yaml(
+            self.config_project_path, logger=self.logger
+        )
 
         if project_config:
             self.config_project.update(project_config)
 
         # Load the local project yaml config file if it exists
+        local_digest = ""
         if self.config_project_local_path:
-            local_config = cci_safe_load(
+            local_config, local_digest = cache.load_yaml(
                 self.config_project_local_path, logger=self.logger
             )
             if local_config:
                 self.config_project_local.update(local_config)
 
         # merge in any additional yaml that was passed along
+        additional_digest = ""
         if self.additional_yaml:
-            additional_yaml_config = cci_safe_load(
+            additional_yaml_config, additional_digest = cache.load_yaml(
                 StringIO(self.additional_yaml),
                 self.config_project_path,
                 logger=self.logger,
@@ -149,15 +151,25 @@ class BaseProjectConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
             if additional_yaml_config:
                 self.config_additional_yaml.update(additional_yaml_config)
 
-        self.config = merge_config(
-            {
-                "universal_config": self.config_universal,
-                "global_config": self.config_global,
-                "project_config": self.config_project,
-                "project_local_config": self.config_project_local,
-                "additional_yaml": self.config_additional_yaml,
-            }
-        )
+        def merge():
+            return merge_config(
+                {
+                    "universal_config": self.config_universal,
+                    "global_config": self.config_global,
+                    "project_config": self.config_project,
+                    "project_local_config": self.config_project_local,
+                    "additional_yaml": self.config_additional_yaml,
+                }
+            )
+
+        universal_digests = self.universal_config_obj.config_digests
+        if universal_digests:
+            self.config = cache.merged(
+                universal_digests + [project_digest, local_digest, additional_digest],
+                merge,
+            )
+        else:
+            self.config = merge()
 
         self._validate_config()
 
@@ -223,4 +223,5 @@ class ScratchOrgConfig(SfdxOrgConfig):
         self.config["username"] = None
         self.config["date_created"] = None
         self.config["instance_url"] = None
+        self.config.pop("sfdx_info", None)
         self.save()
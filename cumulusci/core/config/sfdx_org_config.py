@@ -1,11 +1,15 @@
 import datetime
+import hashlib
 import json
+import tempfile
 from json.decoder import JSONDecodeError
+from pathlib import Path
 
 from cumulusci.core.config import OrgConfig
-from cumulusci.core.exceptions import SfdxOrgException
+from cumulusci.core.exceptions import OrgNotFound, SfdxOrgException
 from cumulusci.core.sfdx import sfdx
 from cumulusci.utils import get_git_config
+from cumulusci.utils.fileutils import lock_file
 
 nl = "\n"  # fstrings can't contain backslashes
 
@@ -13,6 +17,12 @@ nl = "\n"  # fstrings can't contain backslashes
 class SfdxOrgConfig(OrgConfig):
     """Org config which loads from sfdx keychain"""
 
+    # Number of seconds org info from the Salesforce CLI is reused before
+    # the access token is refreshed.
+    sfdx_info_max_age = 3600
+    # refresh_oauth_token doesn't load the userinfo
+    refreshed_info_keys = ("org_type",)
+
     @property
     def sfdx_info(self):
         if hasattr(self, "_sfdx_info"):
@@ -25,6 +35,56 @@ class SfdxOrgConfig(OrgConfig):
         username = self.config.get("username")
         assert username is not None, "SfdxOrgConfig must have a username"
 
+        if self._load_cached_sfdx_info():
+            return self._sfdx_info
+        return self._get_sfdx_info()
+
+    def _refresh_shared_sfdx_info(self, keychain):
+        """Get org info from the Salesforce CLI and store it in the keychain.
+
+        Other cci processes using the same org then reuse it from the keychain
+        until it expires. The lock makes concurrent processes wait for a
+        single call to sfdx instead of each making their own."""
+        with lock_file(self._sfdx_info_lock_path):
+            try:
+                stored_config = keychain.get_org(self.name).config
+            except OrgNotFound:
+                stored_config = {}
+            for key in ("sfdx_info", "sfdx_info_date"):
+                if stored_config.get(key):
+                    self.config[key] = stored_config[key]
+            if not self._load_cached_sfdx_info():
+                self.sfdx_info
+                keychain.set_org(self, self.global_org)
+
+    def _load_cached_sfdx_info(self):
+        cached = self.config.get("sfdx_info")
+        cached_date = self.config.get("sfdx_info_date")
+        if not cached or not cached_date:
+            return False
+        if cached["username"] != self.config.get("username"):
+            return False
+        age = datetime.datetime.utcnow() - cached_date
+        if not 0 <= age.total_seconds() < self.sfdx_info_max_age:
+            return False
+        self._sfdx_info = cached
+        self._sfdx_info_date = cached_date
+        self.config.update(
+            {
+                key: value
+                for key, value in cached.items()
+                if key not in ("created_date", "expiration_date")
+            }
+        )
+        return True
+
+    @property
+    def _sfdx_info_lock_path(self):
+        key = hashlib.sha256(self.config["username"].encode("utf-8")).hexdigest()
+        return Path(tempfile.gettempdir()) / f"cumulusci-sfdx-{key[:16]}.lock"
+
+    def _get_sfdx_info(self):
+        username = self.config["username"]
         self.logger.info(f"Getting org info from Salesforce CLI for {username}")
 
         # Call force:org:display and parse output to get instance_url and
@@ -73,6 +133,8 @@ class SfdxOrgConfig(OrgConfig):
                 "expiration_date": org_info["result"].get("expirationDate"),
             }
         )
+        self.config["sfdx_info"] = sfdx_info
+        self.config["sfdx_info_date"] = self._sfdx_info_date
         return sfdx_info
 
     @property
@@ -201,13 +263,26 @@ class SfdxOrgConfig(OrgConfig):
         if hasattr(self, "_sfdx_info"):
             # Cache the sfdx_info for 1 hour to avoid unnecessary calls out to sfdx CLI
             delta = datetime.datetime.utcnow() - self._sfdx_info_date
-            if delta.total_seconds() > 3600:
+            if delta.total_seconds() > self.sfdx_info_max_age:
                 del self._sfdx_info
+                self.config.pop("sfdx_info", None)
 
                 # Force a token refresh
                 self.force_refresh_oauth_token()
 
         # Get org info via sfdx force:org:display
+        # The keychain of Snowfakery workers can't load orgs, so those
+        # refresh the org info on their own
+        if (
+            hasattr(keychain, "get_org")
+            and self.config.get("username")
+            and not self._load_cached_sfdx_info()
+        ):
+            self._refresh_shared_sfdx_info(keychain)
         self.sfdx_info
+        # The token is as old as the org info from the Salesforce CLI
+        self.config["access_token_issued_at"] = self._sfdx_info_date.replace(
+            tzinfo=datetime.timezone.utc
+        ).timestamp()
         # Get additional org info by querying API
         self._load_orginfo()
@@ -913,6 +913,35 @@ class TestOrgConfig:
         assert client_config.client_id == "OTHER_ID"
         refresh_token.assert_called_once_with(mock.sentinel.refresh_token)
 
+    @mock.patch("cumulusci.core.config.OrgConfig.OAuth2Client")
+    def test_refresh_oauth_token_if_needed(self, OAuth2Client):
+        config = OrgConfig(
+            {
+                "refresh_token": mock.sentinel.refresh_token,
+                "instance_url": "http://instance_url_111.com",
+            },
+            "test",
+        )
+        project_config = BaseProjectConfig(UniversalConfig())
+        keychain = BaseProjectKeychain(project_config, None)
+
+        def load_info():
+            config.config.update({"userinfo": {}, "org_type": "Developer Edition"})
+
+        config._load_userinfo = mock.Mock(side_effect=load_info)
+        config._load_orginfo = mock.Mock()
+        refresh_token = mock.Mock(return_value={"access_token": "asdf"})
+        OAuth2Client.return_value = mock.Mock(refresh_token=refresh_token)
+
+        config.refresh_oauth_token_if_needed(keychain)
+        config.refresh_oauth_token_if_needed(keychain)
+        refresh_token.assert_called_once_with(mock.sentinel.refresh_token)
+        config._load_orginfo.assert_called_once()
+
+        config.config["access_token_issued_at"] -= config.access_token_max_age
+        config.refresh_oauth_token_if_needed(keychain)
+        assert refresh_token.call_count == 2
+
     @responses.activate
     def test_load_user_info__bad_json(self):
         config = OrgConfig(
@@ -2,6 +2,7 @@ import io
 import os
 import shutil
 import tempfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest import mock
@@ -18,11 +19,13 @@ from cumulusci.core.config import (
 )
 from cumulusci.core.exceptions import (
     NotInProject,
+    OrgNotFound,
     ProjectConfigNotFound,
     ScratchOrgException,
     ServiceNotConfigured,
     SfdxOrgException,
 )
+from cumulusci.core.keychain.subprocess_keychain import SubprocessKeychain
 from cumulusci.utils import cd, temporary_dir
 
 __location__ = os.path.dirname(os.path.realpath(__file__))
@@ -88,6 +91,20 @@ class TestUniversalConfig:
         expected_config["tasks"]["newtesttask"]["description"] = "test description"
         assert config.config == expected_config
 
+    def test_load_universal_config__from_snapshot(self, mock_class):
+        mock_class.return_value = self.tempdir_home
+        UniversalConfig.config = None
+        expected_config = UniversalConfig().config
+
+        UniversalConfig.config = None
+        with mock.patch(
+            "cumulusci.utils.yaml.config_cache.cci_safe_load"
+        ) as cci_safe_load:
+            config = UniversalConfig()
+        cci_safe_load.assert_not_called()
+        assert config.config == expected_config
+        assert list((self.tempdir_home / ".cumulusci/config_cache").glob("*.pickle"))
+
 
 @mock.patch("pathlib.Path.home")
 class TestBaseProjectConfig:
@@ -729,6 +746,138 @@ class TestScratchOrgConfig:
         config.force_refresh_oauth_token.assert_called_once()
         assert config._sfdx_info
 
+    def test_refresh_oauth_token_if_needed(self, Command):
+        result = b"""{
+    "result": {
+        "instanceUrl": "url",
+        "accessToken": "access!token",
+        "username": "test"
+    }
+}"""
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(result), stderr=io.BytesIO(b""), returncode=0
+        )
+        config = ScratchOrgConfig({"username": "test", "created": True}, "test")
+
+        def load_orginfo():
+            config.config["org_type"] = "Developer Edition"
+
+        config._load_orginfo = mock.Mock(side_effect=load_orginfo)
+
+        config.refresh_oauth_token_if_needed(keychain=None)
+        config.refresh_oauth_token_if_needed(keychain=None)
+
+        Command.assert_called_once()
+        config._load_orginfo.assert_called_once()
+        assert 0 <= time.time() - config.config["access_token_issued_at"] < 60
+
+    def test_sfdx_info__cached(self, Command):
+        sfdx_info = {
+            "access_token": "access!token",
+            "instance_url": "url",
+            "org_id": "access",
+            "username": "test",
+            "created_date": "1970-01-01T00:00:00Z",
+            "expiration_date": "1970-01-08",
+        }
+        config = ScratchOrgConfig(
+            {
+                "username": "test",
+                "created": True,
+                "sfdx_info": sfdx_info,
+                "sfdx_info_date": datetime.utcnow() - timedelta(minutes=5),
+            },
+            "test",
+        )
+
+        assert config.sfdx_info is sfdx_info
+        assert config.config["access_token"] == "access!token"
+        Command.assert_not_called()
+
+        result = b"""{
+    "result": {
+        "instanceUrl": "url",
+        "accessToken": "access!token2",
+        "username": "test"
+    }
+}"""
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(result), stderr=io.BytesIO(b""), returncode=0
+        )
+        config.config["sfdx_info_date"] -= timedelta(hours=1)
+        del config._sfdx_info
+        assert config.access_token == "access!token2"
+        Command.assert_called_once()
+
+    def test_refresh_oauth_token__shared_cache(self, Command):
+        stored_config = ScratchOrgConfig(
+            {
+                "username": "test",
+                "created": True,
+                "sfdx_info": {"access_token": "access!token", "username": "test"},
+                "sfdx_info_date": datetime.utcnow(),
+            },
+            "test",
+        )
+        keychain = mock.Mock()
+        keychain.get_org.return_value = stored_config
+        config = ScratchOrgConfig({"username": "test", "created": True}, "test")
+        config._load_orginfo = mock.Mock()
+
+        config.refresh_oauth_token(keychain)
+
+        assert config.access_token == "access!token"
+        Command.assert_not_called()
+        keychain.set_org.assert_not_called()
+
+    def test_refresh_oauth_token__stores_shared_cache(self, Command):
+        result = b"""{
+    "result": {
+        "instanceUrl": "url",
+        "accessToken": "access!token",
+        "username": "test"
+    }
+}"""
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(result), stderr=io.BytesIO(b""), returncode=0
+        )
+        keychain = mock.Mock()
+        keychain.get_org.side_effect = OrgNotFound
+        config = ScratchOrgConfig({"username": "test", "created": True}, "test")
+        config._load_orginfo = mock.Mock()
+
+        config.refresh_oauth_token(keychain)
+
+        keychain.set_org.assert_called_once_with(config, False)
+        assert config.config["sfdx_info"]["access_token"] == "access!token"
+        assert config.config["sfdx_info_date"]
+
+    def test_refresh_oauth_token__subprocess_keychain(self, Command):
+        result = b"""{
+    "result": {
+        "instanceUrl": "url",
+        "accessToken": "access!token2",
+        "username": "test"
+    }
+}"""
+        Command.return_value = mock.Mock(
+            stdout=io.BytesIO(result), stderr=io.BytesIO(b""), returncode=0
+        )
+        config = ScratchOrgConfig(
+            {
+                "username": "test",
+                "created": True,
+                "sfdx_info": {"access_token": "access!token", "username": "test"},
+                "sfdx_info_date": datetime.utcnow() - timedelta(hours=2),
+            },
+            "test",
+        )
+        config._load_orginfo = mock.Mock()
+
+        config.refresh_oauth_token(SubprocessKeychain())
+
+        assert config.access_token == "access!token2"
+
     def test_choose_devhub(self, Command):
         mock_keychain = mock.Mock()
         mock_keychain.get_service.return_value = ServiceConfig(
@@ -7,7 +7,7 @@ from cumulusci.core.config.project_config import (
     ProjectConfigPropertiesMixin,
 )
 from cumulusci.core.utils import merge_config
-from cumulusci.utils.yaml.cumulusci_yml import cci_safe_load
+from cumulusci.utils.yaml.config_cache import ConfigCache
 
 __location__ = os.path.dirname(os.path.realpath(__file__))
 
@@ -19,6 +19,8 @@ class UniversalConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
     cli: dict
 
     config = None
+    # identify the YAML that config was loaded from
+    config_digests = None
     config_filename = "cumulusci.yml"
     project_config_class = BaseProjectConfig
     universal_config_obj = None
@@ -70,19 +72,32 @@ class UniversalConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
         if UniversalConfig.config is not None:
             return
 
+        cache = self.config_cache
+
         # load the universal config
-        UniversalConfig.config_universal = cci_safe_load(self.config_universal_path)
+        UniversalConfig.config_universal, universal_digest = cache.load_yaml(
+            self.config_universal_path
+        )
 
         # Load the local config
         if self.config_global_path:
-            config = cci_safe_load(self.config_global_path)
+            config, global_digest = cache.load_yaml(self.config_global_path)
         else:
-            config = {}
+            config, global_digest = {}, ""
         UniversalConfig.config_global = config
-
-        UniversalConfig.config = merge_config(
-            {
-                "universal_config": UniversalConfig.config_universal,
-                "global_config": UniversalConfig.config_global,
-            }
+        UniversalConfig.config_digests = [universal_digest, global_digest]
+
+        UniversalConfig.config = cache.merged(
+            UniversalConfig.config_digests,
+            lambda: merge_config(
+                {
+                    "universal_config": UniversalConfig.config_universal,
+                    "global_config": UniversalConfig.config_global,
+                }
+            ),
         )
+
+    @property
+    def config_cache(self) -> ConfigCache:
+        """Snapshots of parsed configuration files, shared by all projects"""
+        return ConfigCache(self.cumulusci_config_dir / "config_cache")
@@ -53,7 +53,9 @@ Option values/overrides can be passed in at a number of levels, in increasing or
 
 import copy
 import logging
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from distutils.version import LooseVersion
 from operator import attrgetter
 from typing import (
@@ -69,6 +71,7 @@ from typing import (
     Union,
 )
 
+from jinja2 import TemplateSyntaxError, nodes
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 
 from cumulusci.core.config import FlowConfig, TaskConfig
@@ -259,7 +262,9 @@ class TaskRunner:
 
         :return: StepResult
         """
+        return self.run_task(self.create_task(**options))
 
+    def create_task(self, **options) -> "BaseTask":
         # Resolve ^^task_name.return_value style option syntax
         task_config = self.step.task_config.copy()
         task_config["options"] = task_config.get("options", {}).copy()
@@ -267,7 +272,7 @@ class TaskRunner:
 
         task_config["options"].update(options)
 
-        task = self.step.task_class(
+        return self.step.task_class(
             self.step.project_config,
             TaskConfig(task_config),
             org_config=self.org_config,
@@ -275,6 +280,9 @@ class TaskRunner:
             stepnum=self.step.step_num,
             flow=self.flow,
         )
+
+    def run_task(self, task: "BaseTask") -> StepResult:
+        """Run the step's task, created with create_task()."""
         self._log_options(task)
         exc = None
         try:
@@ -347,6 +355,17 @@ class FlowCoordinator:
 
         self.skip = skip or []
         self.results = []
+        self._batch = None
+        self._batched_tasks = {}
+        # Results of batched steps waiting for the batch to deploy
+        self._batched_results = []
+        # `when` of steps evaluated ahead of running them, see _batch_continues
+        self._when_results = {}
+        # Org data shared by the preflight tasks run by this flow
+        self.preflight_snapshots = {}
+        # Tasks run for preflight checks may run in parallel threads,
+        # but callbacks are not expected to be thread-safe.
+        self._callbacks_lock = threading.Lock()
 
         self.logger = self._init_logger()
         self.steps = self._init_steps()
@@ -501,33 +520,140 @@ class FlowCoordinator:
             self._rule(fill="*", new_line=True)
             return
 
-        if step.when:
-            jinja2_context = {
-                "project_config": step.project_config,
-                "org_config": self.org_config,
-            }
-            expr = jinja2_env.compile_expression(step.when)
-            value = expr(**jinja2_context)
-            if not value:
-                self.logger.info(
-                    f"Skipping task {step.task_name} (skipped unless {step.when})"
-                )
-                return
+        when = self._when_results.pop(step, None)
+        if when is None:
+            when = self._evaluate_when(step)
+        if not when:
+            self.logger.info(
+                f"Skipping task {step.task_name} (skipped unless {step.when})"
+            )
+            return
 
         self._rule(fill="-")
         self.logger.info(f"Running task: {step.task_name}")
         self._rule(fill="-", new_line=True)
 
         self.callbacks.pre_task(step)
-        result = TaskRunner.from_flow(self, step).run_step()
-        self.callbacks.post_task(step, result)
-
-        self.results.append(
-            result
-        )  # add even a failed result to the result set for the post flow
+        runner = TaskRunner.from_flow(self, step)
+        task = self._batched_tasks.pop(step, None)
+        if task is None and self.flow_config.batch_metadata_etl:
+            task = self._start_batch(step)
+        result = runner.run_task(task) if task is not None else runner.run_step()
+        if self._batch is not None and task in self._batch.tasks:
+            exception = self._end_batched_step(step, result)
+        else:
+            exception = self._report_results([(step, result)])
+
+        if exception:
+            raise exception  # PY3: raise an exception type we control *from* this exception instead?
+
+    def _report_results(self, results: List[Tuple[StepSpec, StepResult]]):
+        """Report the results of steps which have finished, and return the
+        exception of the first one which failed without allow_failure."""
+        for step, result in results:
+            self.callbacks.post_task(step, result)
+            self.results.append(
+                result
+            )  # add even a failed result to the result set for the post flow
+        return next(
+            (
+                result.exception
+                for step, result in results
+                if result.exception and not step.allow_failure
+            ),
+            None,
+        )
 
-        if result.exception and not step.allow_failure:
-            raise result.exception  # PY3: raise an exception type we control *from* this exception instead?
+    def _evaluate_when(self, step: StepSpec) -> bool:
+        if not step.when:
+            return True
+        jinja2_context = {
+            "project_config": step.project_config,
+            "org_config": self.org_config,
+        }
+        expr = jinja2_env.compile_expression(step.when)
+        return bool(expr(**jinja2_context))
+
+    def _start_batch(self, step: StepSpec) -> Optional["BaseTask"]:
+        """Create the tasks of this step and of the steps after it that can
+        run as a batch with it (e.g. metadata ETL tasks sharing one retrieve
+        and deploy), and return the task of this step.
+
+        Returns None if the step's task doesn't support batches."""
+        batch_class = getattr(step.task_class, "batch_class", None)
+        if batch_class is None or _uses_return_values(step):
+            return None
+        batch = batch_class()
+        task = TaskRunner.from_flow(self, step).create_task()
+        if not batch.add(task):
+            return task
+        for next_step in self.steps[self.steps.index(step) + 1 :]:
+            if next_step.skip:
+                continue
+            if getattr(
+                next_step.task_class, "batch_class", None
+            ) is not batch_class or _uses_return_values(next_step):
+                break
+            next_task = TaskRunner.from_flow(self, next_step).create_task()
+            if not batch.add(next_task):
+                break
+            self._batched_tasks[next_step] = next_task
+        if len(batch.tasks) > 1:
+            self.logger.info(
+                f"Running {len(batch.tasks)} tasks as a batch: "
+                + ", ".join(t.name for t in batch.tasks)
+            )
+            batch.start()
+            self._batch = batch
+        return task
+
+    def _end_batched_step(self, step: StepSpec, result: StepResult):
+        """Keep the result of a batched step until the batch has deployed.
+
+        The batch deploys in the last of its steps which runs, or in a step
+        which fails, so that the changes of the steps before it are kept as
+        they would have been without the batch."""
+        self._batched_results.append((step, result))
+        if not result.exception:
+            try:
+                if self._batch_continues(step):
+                    return None
+            except Exception:
+                self._deploy_batch()
+                raise
+        return self._deploy_batch()
+
+    def _batch_continues(self, step: StepSpec) -> bool:
+        """Whether another step of the batch will run after this one.
+
+        The `when` of the following steps is evaluated here, at the point
+        the flow gets to them, and kept for _run_step."""
+        for next_step in self.steps[self.steps.index(step) + 1 :]:
+            if next_step.skip:
+                continue
+            if next_step not in self._batched_tasks:
+                return False
+            self._when_results[next_step] = self._evaluate_when(next_step)
+            if self._when_results[next_step]:
+                return True
+        return False
+
+    def _deploy_batch(self):
+        """Let the batch deploy the changes of its steps which have run, then
+        report their results. A failed deploy fails each of those steps."""
+        results, self._batched_results = self._batched_results, []
+        try:
+            self._batch.finish()
+        except Exception as e:
+            self.logger.error(
+                "Exception in deploying the batch of "
+                + ", ".join(step.path for step, _ in results)
+            )
+            results = [
+                (step, result if result.exception else result._replace(exception=e))
+                for step, result in results
+            ]
+        return self._report_results(results)
 
     def _init_logger(self) -> logging.Logger:
         """
@@ -740,7 +866,7 @@ class FlowCoordinator:
 
         # attempt to refresh the token, this can throw...
         with self.org_config.save_if_changed():
-            self.org_config.refresh_oauth_token(self.project_config.keychain)
+            self.org_config.refresh_oauth_token_if_needed(self.project_config.keychain)
 
     def resolve_return_value_options(self, options):
         """Handle dynamic option value lookups in the format ^^task_name.attr"""
@@ -763,6 +889,9 @@ class PreflightFlowCoordinator(FlowCoordinator):
     preflight_results: DefaultDict[Optional[str], List[dict]]
     _task_caches: Dict[BaseProjectConfig, "TaskCache"]
 
+    # Number of tasks referenced by checks that are run at the same time
+    max_workers = 8
+
     def run(self, org_config: OrgConfig):
         self.org_config = org_config
         self.callbacks.pre_flow(self)
@@ -780,7 +909,16 @@ class PreflightFlowCoordinator(FlowCoordinator):
         self.preflight_results = defaultdict(list)
         # Expose for test access
         self._task_caches = {self.project_config: TaskCache(self, self.project_config)}
+        # Create a cache for each project config used by a step.
+        # This accommodates cross-project preflight checks.
+        for step in self.steps:
+            if step.project_config not in self._task_caches:
+                self._task_caches[step.project_config] = TaskCache(
+                    self, step.project_config
+                )
         try:
+            self._prefetch_check_tasks()
+
             # flow-level checks
             jinja2_context = {
                 "tasks": self._task_caches[self.project_config],
@@ -795,13 +933,6 @@ class PreflightFlowCoordinator(FlowCoordinator):
             # Step-level checks
             for step in self.steps:
                 jinja2_context["project_config"] = step.project_config
-                # Create a cache for this project config, if not present
-                # and not equal to the root project config.
-                # This accommodates cross-project preflight checks.
-                if step.project_config not in self._task_caches:
-                    self._task_caches[step.project_config] = TaskCache(
-                        self, step.project_config
-                    )
                 jinja2_context["tasks"] = self._task_caches[step.project_config]
                 for check in step.task_config.get("checks", []):
                     result = self.evaluate_check(check, jinja2_context)
@@ -810,6 +941,48 @@ class PreflightFlowCoordinator(FlowCoordinator):
         finally:
             self.callbacks.post_flow(self)
 
+    def _prefetch_check_tasks(self):
+        """Run the distinct task calls referenced by all checks concurrently.
+
+        Checks are then evaluated against the warmed task caches. Only calls
+        whose options are all literals, and which are evaluated whatever
+        the results of other parts of the check, are run up front; any
+        others are run when their check is evaluated, if they are needed.
+        """
+        checks = [
+            (self._task_caches[self.project_config], check)
+            for check in self.flow_config.checks or []
+        ]
+        for step in self.steps:
+            checks.extend(
+                (self._task_caches[step.project_config], check)
+                for check in step.task_config.get("checks", [])
+            )
+
+        calls = {}
+        for cache, check in checks:
+            for task_name, options in _get_task_calls(check["when"]):
+                if task_name not in cache.project_config.tasks:
+                    continue
+                try:
+                    key = (id(cache), cache.cache_key(task_name, options))
+                except TypeError:  # unhashable option value
+                    continue
+                calls[key] = (cache, task_name, options)
+        if len(calls) < 2:
+            return
+
+        def run_task(call):
+            cache, task_name, options = call
+            try:
+                getattr(cache, task_name)(**options)
+            except Exception as e:
+                self.logger.debug(f"Could not run {task_name} ahead of its check: {e}")
+
+        self.logger.info(f"Running {len(calls)} tasks referenced by checks")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(run_task, calls.values()))
+
     def evaluate_check(
         self, check: dict, jinja2_context: Dict[str, Any]
     ) -> Optional[dict]:
@@ -842,6 +1015,12 @@ class TaskCache:
     def __getattr__(self, task_name: str):
         return CachedTaskRunner(self, task_name)
 
+    @staticmethod
+    def cache_key(task_name: str, options: dict) -> Tuple[str, Tuple[Any]]:
+        key = (task_name, tuple(sorted(options.items())))
+        hash(key)
+        return key
+
 
 class CachedTaskRunner:
     """Runs a task and caches the result in a TaskCache"""
@@ -854,7 +1033,7 @@ class CachedTaskRunner:
         self.task_name = task_name
 
     def __call__(self, **options: dict) -> Any:
-        cache_key = (self.task_name, tuple(sorted(options.items())))
+        cache_key = self.cache.cache_key(self.task_name, options)
         if cache_key in self.cache.results:
             return self.cache.results[cache_key].return_values
 
@@ -867,11 +1046,56 @@ class CachedTaskRunner:
             task_class=task_class,
             project_config=self.cache.project_config,
         )
-        self.cache.flow.callbacks.pre_task(step)
-        result = TaskRunner(step, self.cache.flow.org_config, self.cache.flow).run_step(
-            **options
-        )
-        self.cache.flow.callbacks.post_task(step, result)
+        flow = self.cache.flow
+        with flow._callbacks_lock:
+            flow.callbacks.pre_task(step)
+        result = TaskRunner(step, flow.org_config, flow).run_step(**options)
+        with flow._callbacks_lock:
+            flow.callbacks.post_task(step, result)
 
         self.cache.results[cache_key] = result
         return result.return_values
+
+
+def _uses_return_values(step: StepSpec) -> bool:
+    return "^^" in str(step.task_config.get("options", {}))
+
+
+def _get_task_calls(expression: str) -> List[Tuple[str, dict]]:
+    """Find the calls like `tasks.name(option=value)` in a jinja2 expression
+    whose options are all literal values, and which are always evaluated:
+    not those on the right of `and` or `or`, or in a branch of `if`."""
+    try:
+        ast = jinja2_env.parse(f"{{{{ {expression} }}}}")
+    except TemplateSyntaxError:
+        return []
+    calls = []
+    _find_task_calls(ast, calls)
+    return calls
+
+
+def _find_task_calls(node: nodes.Node, calls: List[Tuple[str, dict]]):
+    if isinstance(node, (nodes.And, nodes.Or)):
+        _find_task_calls(node.left, calls)
+        return
+    if isinstance(node, nodes.CondExpr):
+        _find_task_calls(node.test, calls)
+        return
+    for child in node.iter_child_nodes():
+        _find_task_calls(child, calls)
+    if not isinstance(node, nodes.Call):
+        return
+    target = node.node
+    if not (
+        isinstance(target, nodes.Getattr)
+        and isinstance(target.node, nodes.Name)
+        and target.node.name == "tasks"
+    ):
+        return
+    if node.args or node.dyn_args or node.dyn_kwargs:
+        return
+    try:
+        options = {kwarg.key: kwarg.value.as_const() for kwarg in node.kwargs}
+    except nodes.Impossible:
+        return
+    calls.append((target.attr, options))
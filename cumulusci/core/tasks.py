@@ -271,6 +271,10 @@ class BaseSalesforceTask(BaseTask):
     name = "BaseSalesforceTask"
     salesforce_task = True
 
+    # Flows may run tasks for the same org in parallel threads, which must
+    # not refresh the token or save the org config at the same time.
+    _credentials_lock = threading.Lock()
+
     def _get_client_name(self):
         try:
             app = self.project_config.keychain.get_service("connectedapp")
@@ -282,8 +286,8 @@ class BaseSalesforceTask(BaseTask):
         raise NotImplementedError("Subclasses should provide their own implementation")
 
     def _update_credentials(self):
-        with self.org_config.save_if_changed():
-            self.org_config.refresh_oauth_token(self.project_config.keychain)
+        with self._credentials_lock, self.org_config.save_if_changed():
+            self.org_config.refresh_oauth_token_if_needed(self.project_config.keychain)
 
     def _validate_and_inject_namespace_prefixes(
         self,
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
@@ -11,10 +12,12 @@ from cumulusci.core.exceptions import (
     TaskNotFoundError,
 )
 from cumulusci.core.flowrunner import (
+    FlowCallback,
     FlowCoordinator,
     PreflightFlowCoordinator,
     StepSpec,
     TaskRunner,
+    _get_task_calls,
 )
 from cumulusci.core.tasks import BaseTask
 from cumulusci.core.tests.utils import MockLoggingHandler
@@ -52,6 +55,45 @@ class _SfdcTask(BaseTask):
         return -1
 
 
+class _Batch:
+    def __init__(self):
+        self.tasks = []
+        self.started = False
+        self.finished = False
+
+    def add(self, task):
+        if task.options.get("unbatchable"):
+            return False
+        self.tasks.append(task)
+        return True
+
+    def start(self):
+        self.started = True
+        for task in self.tasks:
+            task.batch = self
+
+    def finish(self):
+        self.finished = True
+
+
+class _BatchedTask(BaseTask):
+    batch_class = _Batch
+    batch = None
+    task_options = {
+        "response": {"description": "the response to return"},
+        "unbatchable": {"description": "Refuse to join a batch"},
+        "flag": {"description": "Set a flag in the project config"},
+    }
+
+    def _run_task(self):
+        if self.options.get("flag"):
+            self.project_config.config[self.options["flag"]] = True
+        if self.options.get("response") == "fail":
+            raise Exception("Task failed")
+        self.return_values = {"batch": self.batch}
+        return self.options.get("response")
+
+
 class AbstractFlowCoordinatorTest:
     @classmethod
     def setup_class(cls):
@@ -114,6 +156,10 @@ class TestSimpleTestFlowCoordinator(AbstractFlowCoordinatorTest):
                 "description": "An sfdc task",
                 "class_path": "cumulusci.core.tests.test_flowrunner._SfdcTask",
             },
+            "batched": {
+                "description": "A task that can run in a batch",
+                "class_path": "cumulusci.core.tests.test_flowrunner._BatchedTask",
+            },
         }
         self.project_config.config["flows"] = {
             "nested_flow": {
@@ -410,6 +456,170 @@ class TestSimpleTestFlowCoordinator(AbstractFlowCoordinatorTest):
         assert any(flow_config.description in s for s in self.flow_log["info"])
         assert {"name": "supername"} == flow.results[0].return_values
 
+    def test_run__batch(self):
+        flow_config = FlowConfig(
+            {
+                "batch_metadata_etl": True,
+                "steps": {
+                    1: {"task": "batched"},
+                    2: {"task": "batched", "when": "False"},
+                    3: {"task": "batched"},
+                    4: {"task": "pass_name"},
+                    5: {"task": "batched"},
+                    6: {"task": "batched", "options": {"response": "^^batched.x"}},
+                    7: {"task": "batched"},
+                    8: {"task": "batched", "options": {"unbatchable": True}},
+                },
+            }
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        with mock.patch.object(
+            TaskRunner,
+            "create_task",
+            autospec=True,
+            side_effect=TaskRunner.create_task,
+        ) as create_task:
+            flow.run(self.org_config)
+
+        batches = [r.return_values.get("batch") for r in flow.results]
+        assert batches[0] is batches[1] and batches[0].started
+        assert batches[0].finished
+        assert len(batches[0].tasks) == 3  # step 2 joins but is skipped
+        assert batches[3] is None  # alone before a step using return values
+        assert batches[4] is batches[5] is None  # joins nothing, breaks the batch
+        assert batches[6] is None
+        assert len(create_task.mock_calls) == 9
+        assert (
+            "Running 3 tasks as a batch: batched, batched, batched"
+            in self.flow_log["info"]
+        )
+
+        flow_config.config["batch_metadata_etl"] = False
+        flow = FlowCoordinator(self.project_config, flow_config)
+        flow.run(self.org_config)
+        assert not any(r.return_values.get("batch") for r in flow.results)
+
+    def test_run__batch_finished(self):
+        """Batches finish in the last of their steps which runs, before the
+        results of their steps are reported."""
+        flow_config = FlowConfig(
+            {
+                "batch_metadata_etl": True,
+                "steps": {
+                    1: {"task": "batched", "options": {"flag": "stop"}},
+                    2: {
+                        "task": "batched",
+                        "when": "not project_config.config.get('stop')",
+                    },
+                    3: {"task": "pass_name"},
+                    4: {"task": "batched"},
+                    5: {"task": "batched"},
+                },
+            }
+        )
+        callbacks = mock.Mock(wraps=FlowCallback())
+        flow = FlowCoordinator(self.project_config, flow_config, callbacks=callbacks)
+        finished_after = []
+        with mock.patch.object(
+            _Batch,
+            "finish",
+            autospec=True,
+            side_effect=lambda batch: finished_after.append(len(flow.results)),
+        ):
+            flow.run(self.org_config)
+
+        assert len(flow.results) == 4
+        assert finished_after == [0, 2]
+        assert [c[0] for c in callbacks.method_calls] == [
+            "pre_flow",
+            "pre_task",
+            "post_task",
+            "pre_task",
+            "post_task",
+            "pre_task",
+            "pre_task",
+            "post_task",
+            "post_task",
+            "post_flow",
+        ]
+
+    def test_run__batch_when_not_evaluated_early(self):
+        """Steps join a batch whatever their condition, which is evaluated
+        once, when the flow gets to them."""
+        flow_config = FlowConfig(
+            {
+                "batch_metadata_etl": True,
+                "steps": {
+                    1: {"task": "batched", "options": {"flag": "ran"}},
+                    2: {"task": "batched", "when": "project_config.config.get('ran')"},
+                    3: {
+                        "task": "pass_name",
+                        "when": "project_config.config.get('ran')",
+                    },
+                },
+            }
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        with mock.patch.object(
+            FlowCoordinator,
+            "_evaluate_when",
+            autospec=True,
+            side_effect=FlowCoordinator._evaluate_when,
+        ) as evaluate_when:
+            flow.run(self.org_config)
+
+        assert len(flow.results) == 3
+        batch = flow.results[0].return_values["batch"]
+        assert batch is flow.results[1].return_values["batch"] is not None
+        evaluated = [c.args[1] for c in evaluate_when.mock_calls]
+        assert evaluated.count(flow.steps[1]) == 1
+        assert evaluated.count(flow.steps[2]) == 1
+
+    def test_run__batch_deploy_fails(self):
+        """A failed deploy fails the steps of the batch"""
+        flow_config = FlowConfig(
+            {
+                "batch_metadata_etl": True,
+                "steps": {
+                    1: {"task": "batched", "ignore_failure": True},
+                    2: {"task": "batched", "ignore_failure": True},
+                    3: {"task": "pass_name"},
+                },
+            }
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        error = Exception("Deploy failed")
+        with mock.patch.object(_Batch, "finish", side_effect=error):
+            flow.run(self.org_config)
+
+            assert [r.exception for r in flow.results] == [error, error, None]
+
+            del flow_config.config["steps"][2]["ignore_failure"]
+            flow = FlowCoordinator(self.project_config, flow_config)
+            with pytest.raises(Exception, match="Deploy failed"):
+                flow.run(self.org_config)
+            assert len(flow.results) == 2
+
+    def test_run__batch_task_fails(self):
+        """A failed task deploys the changes of the steps before it"""
+        flow_config = FlowConfig(
+            {
+                "batch_metadata_etl": True,
+                "steps": {
+                    1: {"task": "batched"},
+                    2: {"task": "batched", "options": {"response": "fail"}},
+                    3: {"task": "batched"},
+                },
+            }
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        with mock.patch.object(_Batch, "finish") as finish:
+            with pytest.raises(Exception, match="Task failed"):
+                flow.run(self.org_config)
+
+        finish.assert_called_once()
+        assert len(flow.results) == 2
+
     def test_run__nested_flow(self):
         """Flows can run inside other flows"""
         self.project_config.config["flows"]["test"] = {
@@ -683,6 +893,64 @@ class TestPreflightFlowCoordinatorTest(AbstractFlowCoordinatorTest):
             "1/1": [{"status": "error", "message": None}],
         } == flow.preflight_results
 
+    def test_run__prefetches_check_tasks(self):
+        flow_config = FlowConfig(
+            {
+                "checks": [
+                    {
+                        "when": "tasks.log(level='info', line='plan')",
+                        "action": "error",
+                    }
+                ],
+                "steps": {
+                    1: {
+                        "task": "log",
+                        "options": {"level": "info", "line": "step"},
+                        "checks": [
+                            {
+                                "when": "tasks.log(level='info', line='step') "
+                                "or tasks.log(level='info', line='skipped')",
+                                "action": "error",
+                            },
+                        ],
+                    }
+                },
+            }
+        )
+        flow = PreflightFlowCoordinator(self.project_config, flow_config)
+        with mock.patch(
+            "cumulusci.core.flowrunner.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor, mock.patch.object(
+            TaskRunner, "run_step", autospec=True, wraps=TaskRunner.run_step
+        ) as run_step:
+            flow.run(self.org_config)
+
+        executor.assert_called_once_with(max_workers=flow.max_workers)
+        assert run_step.call_count == 2
+        results = flow._task_caches[flow.project_config].results
+        assert ("log", (("level", "info"), ("line", "plan"))) in results
+        assert ("log", (("level", "info"), ("line", "step"))) in results
+        # not needed to evaluate the check
+        assert ("log", (("level", "info"), ("line", "skipped"))) not in results
+
+
+def test_get_task_calls():
+    assert _get_task_calls(
+        "tasks.foo(a=1, b=['x']) and not tasks.bar() or org_config.scratch"
+    ) == [("foo", {"a": 1, "b": ["x"]})]
+    assert _get_task_calls("tasks.foo() if tasks.bar() > 1 else tasks.baz()") == [
+        ("bar", {})
+    ]
+    assert _get_task_calls("not tasks.foo().x or tasks.bar() in [tasks.baz()]") == [
+        ("foo", {})
+    ]
+    assert _get_task_calls("tasks.foo(a=1) == tasks.bar(a=2)") == [
+        ("foo", {"a": 1}),
+        ("bar", {"a": 2}),
+    ]
+    assert _get_task_calls("tasks.foo(a=org_config.username)") == []
+    assert _get_task_calls("tasks.foo(") == []
+
 
 @pytest.fixture
 def task_runner():
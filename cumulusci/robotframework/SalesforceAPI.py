@@ -1,10 +1,20 @@
-from simple_salesforce.exceptions import SalesforceResourceNotFound
+import logging
+import time
+from itertools import groupby
+
+from salesforce_bulk import SalesforceBulk
 
 from cumulusci.core.template_utils import format_str
 from cumulusci.robotframework.base_library import BaseLibrary
 
 # https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_create.htm
 SF_COLLECTION_INSERTION_LIMIT = 200
+# https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_delete.htm
+SF_COLLECTION_DELETION_LIMIT = 200
+# Larger groups of session records are deleted with the Bulk API
+SF_BULK_DELETION_THRESHOLD = 2000
+# Errors for records that no longer exist, so don't need to be deleted
+SF_NOT_FOUND_ERRORS = ("ENTITY_IS_DELETED", "INVALID_CROSS_REFERENCE_KEY", "NOT_FOUND")
 STATUS_KEY = ("status",)
 
 
@@ -20,21 +30,103 @@ class SalesforceAPI(BaseLibrary):
 
         (Only records specifically recorded using the Store Session Record
         keyword are deleted.)
+
+        Records are deleted in the reverse of the order they were stored.
+        Consecutive records of the same type are deleted together, up to
+        200 at a time, or with the Bulk API when there are 2000 or more.
         """
         self._session_records.reverse()
         self.builtin.log("Deleting {} records".format(len(self._session_records)))
-        for record in self._session_records[:]:
+        for obj_type, records in groupby(
+            self._session_records[:], key=lambda record: record["type"]
+        ):
+            records = list(records)
+            if len(records) >= SF_BULK_DELETION_THRESHOLD:
+                self._bulk_delete_session_records(obj_type, records)
+                continue
+            for start in range(0, len(records), SF_COLLECTION_DELETION_LIMIT):
+                self._delete_session_record_batch(
+                    records[start : start + SF_COLLECTION_DELETION_LIMIT]
+                )
+
+    def _delete_session_record_batch(self, records):
+        for record in records:
             self.builtin.log("  Deleting {type} {id}".format(**record))
-            try:
-                self.salesforce_delete(record["type"], record["id"])
-            except SalesforceResourceNotFound:
+        try:
+            results = [
+                (
+                    result["success"],
+                    [
+                        (error.get("statusCode"), error["message"])
+                        for error in result["errors"]
+                    ],
+                )
+                for result in self.cumulusci.sf.restful(
+                    "composite/sobjects",
+                    method="DELETE",
+                    params={
+                        "ids": ",".join(record["id"] for record in records),
+                        "allOrNone": "false",
+                    },
+                )
+            ]
+        except Exception as e:
+            results = [(False, [(None, str(e))])] * len(records)
+        self._process_deletion_results(records, results)
+
+    def _bulk_delete_session_records(self, obj_type, records):
+        # Imported here to keep sqlalchemy out of suites that don't need it
+        from cumulusci.tasks.bulkdata.step import (
+            DataApi,
+            DataOperationStatus,
+            DataOperationType,
+            get_dml_operation,
+        )
+
+        self.builtin.log(
+            "  Deleting {} {} records with the Bulk API".format(len(records), obj_type)
+        )
+        try:
+            operation = get_dml_operation(
+                sobject=obj_type,
+                operation=DataOperationType.DELETE,
+                fields=["Id"],
+                api_options={},
+                context=_DmlContext(self.cumulusci),
+                volume=len(records),
+                api=DataApi.BULK,
+            )
+            with operation:
+                operation.load_records([record["id"]] for record in records)
+            if operation.job_result.status not in (
+                DataOperationStatus.SUCCESS,
+                DataOperationStatus.ROW_FAILURE,
+            ):
+                raise Exception(", ".join(operation.job_result.job_errors))
+            results = [
+                (
+                    result.success,
+                    [] if result.success else [_parse_bulk_error(result.error)],
+                )
+                for result in operation.get_results()
+            ]
+        except Exception as e:
+            results = [(False, [(None, str(e))])] * len(records)
+        self._process_deletion_results(records, results)
+
+    def _process_deletion_results(self, records, results):
+        for record, (success, errors) in zip(records, results):
+            if success:
+                self._session_records.remove(record)
+            elif any(status_code in SF_NOT_FOUND_ERRORS for status_code, _ in errors):
                 self.builtin.log("    {type} {id} is already deleted".format(**record))
-            except Exception as e:
+            else:
                 self.builtin.log(
                     "    {type} {id} could not be deleted:".format(**record),
                     level="WARN",
                 )
-                self.builtin.log("      {}".format(e), level="WARN")
+                for _, message in errors:
+                    self.builtin.log("      {}".format(message), level="WARN")
 
     def get_latest_api_version(self):
         """Return the API version used by the current org"""
@@ -176,6 +268,123 @@ class SalesforceAPI(BaseLibrary):
 
         return objs
 
+    def generate_and_insert_test_data(self, obj_name, number_to_create, **fields):
+        """Generate and insert any number of test records.
+
+        The fields are templates, just as for *Generate Test Data*, but
+        the records are streamed straight into the org instead of being
+        returned. Small volumes are inserted with the REST collections
+        API and larger volumes (2000 records or more) with the Bulk API.
+
+        The Ids of the new records are stored as session records, to be
+        deleted by *Delete Session Records*, and a list of them is
+        returned. The number of records inserted per second is written
+        to the log.
+
+        Example:
+
+        | @{contact ids}=  Generate And Insert Test Data  Contact  20000
+        | ...  FirstName={{fake.first_name}}
+        | ...  LastName=User {{number}}
+
+        """
+        number_to_create = int(number_to_create)
+        field_names = list(fields)
+        records = (
+            [format_str(fields[name], {"number": i}) for name in field_names]
+            for i in range(number_to_create)
+        )
+        return self._insert_records(obj_name, field_names, records, number_to_create)
+
+    def salesforce_bulk_insert(self, objects):
+        """Inserts any number of records that were created with *Generate Test Data*.
+
+        This works like *Salesforce Collection Insert* without its 200
+        record limit: the Bulk API is used for 2000 records or more. All
+        of the objects must be of the same type.
+
+        The new Ids are stored in the objects, which are returned, and
+        as session records, to be deleted by *Delete Session Records*.
+
+        Example:
+
+        | @{objects}=  Generate Test Data  Contact  5000
+        | ...  FirstName=User {{number}}
+        | ...  LastName={{fake.last_name}}
+        | Salesforce Bulk Insert  ${objects}
+
+        """
+        if not objects:
+            return objects
+        obj_names = {obj["attributes"]["type"] for obj in objects}
+        assert len(obj_names) == 1, "All objects should be of the same type"
+        assert not any(
+            obj.get("id") for obj in objects
+        ), "Insertable objects should not have IDs"
+        field_names = []
+        for obj in objects:
+            field_names.extend(
+                name for name in obj if name not in field_names and name != "attributes"
+            )
+        records = ([obj.get(name) for name in field_names] for obj in objects)
+        ids = self._insert_records(obj_names.pop(), field_names, records, len(objects))
+        for obj, record_id in zip(objects, ids):
+            obj["id"] = record_id
+        return objects
+
+    def _insert_records(self, obj_name, field_names, records, volume):
+        # Imported here to keep sqlalchemy out of suites that don't insert
+        from cumulusci.tasks.bulkdata.step import (
+            DataOperationStatus,
+            DataOperationType,
+            get_dml_operation,
+        )
+
+        start = time.monotonic()
+        operation = get_dml_operation(
+            sobject=obj_name,
+            operation=DataOperationType.INSERT,
+            fields=field_names,
+            api_options={},
+            context=_DmlContext(self.cumulusci),
+            volume=volume,
+        )
+        with operation:
+            operation.load_records(records)
+
+        if operation.job_result.status not in (
+            DataOperationStatus.SUCCESS,
+            DataOperationStatus.ROW_FAILURE,
+        ):
+            raise AssertionError(
+                "Unable to insert {} records: {}".format(
+                    obj_name, ", ".join(operation.job_result.job_errors)
+                )
+            )
+
+        ids = []
+        errors = []
+        for idx, result in enumerate(operation.get_results()):
+            if result.success:
+                ids.append(result.id)
+            else:
+                errors.append("Error on Object {}: {}".format(idx, result.error))
+        self._session_records.extend({"type": obj_name, "id": id} for id in ids)
+
+        elapsed = time.monotonic() - start
+        self.builtin.log(
+            "Inserted {} {} records in {:.2f} seconds ({:.1f} records per second)".format(
+                len(ids), obj_name, elapsed, len(ids) / elapsed if elapsed else 0
+            )
+        )
+        if errors:
+            raise AssertionError(
+                "{} of {} {} records could not be inserted. {}".format(
+                    len(errors), volume, obj_name, errors[0]
+                )
+            )
+        return ids
+
     def remove_session_record(self, obj_type, obj_id):
         """Remove a record from the list of records that should be automatically removed."""
         try:
@@ -414,3 +623,22 @@ class SalesforceAPI(BaseLibrary):
         """
         self.builtin.log("Storing {} {} to session records".format(obj_type, obj_id))
         self._session_records.append({"type": obj_type, "id": obj_id})
+
+
+def _parse_bulk_error(error):
+    """Split a Bulk API error (STATUS_CODE:message:fields) into code and message."""
+    status_code, _, message = error.partition(":")
+    return status_code, message or error
+
+
+class _DmlContext:
+    """The connections and logger that bulkdata DML operations expect of a task."""
+
+    def __init__(self, cumulusci):
+        self.sf = cumulusci.sf
+        self.bulk = SalesforceBulk(
+            host=cumulusci.org.instance_url.replace("https://", "").rstrip("/"),
+            sessionId=cumulusci.org.access_token,
+            API_version=self.sf.sf_version,
+        )
+        self.logger = logging.getLogger(__name__)
@@ -6,6 +6,7 @@ from Browser.utils.data_types import KeyAction, PageLoadStates
 from robot.utils import timestr_to_secs
 
 from cumulusci.robotframework.base_library import BaseLibrary
+from cumulusci.robotframework.browser_sessions import BrowserSessionPool
 from cumulusci.robotframework.faker_mixin import FakerMixin
 from cumulusci.robotframework.utils import (
     WAIT_FOR_AURA_SCRIPT,
@@ -58,7 +59,12 @@ class SalesforcePlaywright(FakerMixin, BaseLibrary):
         self.salesforce_api.delete_session_records()
 
     def open_test_browser(
-        self, size=None, useralias=None, wait=True, record_video=None
+        self,
+        size=None,
+        useralias=None,
+        wait=True,
+        record_video=None,
+        reuse_session=False,
     ):
         """Open a new Playwright browser, context, and page to the default org.
 
@@ -74,9 +80,18 @@ class SalesforcePlaywright(FakerMixin, BaseLibrary):
         keyword is logged.
 
         This keyword automatically calls the browser keyword `Wait until network is idle`.
+
+        Set `reuse_session` to True to save the cookies and local storage of
+        a browser once it has logged in, so that later calls for the same
+        user, from this or other suites and processes of the test run, can
+        start out logged in. Saved sessions are kept in the project's .cci
+        directory, not the output directory. A saved session is only reused
+        for an hour and, if the org no longer accepts it, the browser logs in
+        again.
         """
 
         wait = self.builtin.convert_to_boolean(wait)
+        reuse_session = self.builtin.convert_to_boolean(reuse_session)
         default_size = self.builtin.get_variable_value(
             "${DEFAULT BROWSER SIZE}", "1280x1024"
         )
@@ -105,17 +120,38 @@ class SalesforcePlaywright(FakerMixin, BaseLibrary):
             record_video = {"dir": "../video"}
         width, height = size.split("x", 1)
 
+        org = self.cumulusci.org
+        session_key = f"{org.instance_url} {useralias or org.username}"
+        storage_state = self._session_pool.get(session_key) if reuse_session else None
+
         browser_id = self.browser.new_browser(browser=browser_enum, headless=headless)
         context_id = self.browser.new_context(
-            viewport={"width": width, "height": height}, recordVideo=record_video
+            viewport={"width": width, "height": height},
+            recordVideo=record_video,
+            storageState=storage_state,
         )
         self.browser.set_browser_timeout("15 seconds")
-        page_details = self.browser.new_page(login_url)
+        if storage_state:
+            self.builtin.log(f"Reusing saved browser session {storage_state}")
+            page_details = self.browser.new_page(org.instance_url)
+            if self.browser.get_element_count("#login_form"):
+                self.builtin.log("The saved browser session has expired; logging in")
+                self.browser.go_to(login_url)
+                storage_state = None
+        else:
+            page_details = self.browser.new_page(login_url)
 
         if wait:
             self.wait_until_salesforce_is_ready(login_url)
+            if reuse_session and not storage_state:
+                self._session_pool.save(session_key, self.browser.save_storage_state())
         return browser_id, context_id, page_details
 
+    @property
+    def _session_pool(self):
+        cache_dir = self.cumulusci.project_config.cache_dir
+        return BrowserSessionPool(cache_dir / "robot" / "browser_sessions")
+
     @capture_screenshot_on_error
     def wait_until_loading_is_complete(self, locator=None, timeout="15 seconds"):
         """Wait for a lightning page to load.
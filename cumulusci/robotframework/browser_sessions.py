@@ -0,0 +1,70 @@
+"""Browser sessions saved by Open Test Browser for later browsers to reuse.
+
+A saved session is a Playwright storage state file, which holds live session
+cookies for an org. Sessions are kept in the project's cache directory rather
+than the robot output directory, which CI systems commonly publish.
+"""
+
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from cumulusci.utils.fileutils import lock_file
+
+# Number of seconds a saved browser session may be reused
+SESSION_MAX_AGE = 60 * 60
+
+
+class BrowserSessionPool:
+    """Storage states of logged in browsers, keyed by org and user.
+
+    The pool is shared by the suites and pabot processes of a test run
+    through an index file guarded by a lock file."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.index_path = self.directory / "sessions.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the storage state file of a recently saved session, if any."""
+        with self._lock():
+            session = self._read_index().get(key)
+        if session and _is_fresh(session) and Path(session["storage_state"]).exists():
+            return session["storage_state"]
+        return None
+
+    def save(self, key: str, storage_state) -> str:
+        """Move a storage state file into the pool and index it under `key`.
+
+        Returns the new path of the file. Expired sessions are removed."""
+        path = self.directory / f"{uuid.uuid4().hex}.json"
+        with self._lock():
+            shutil.move(str(storage_state), path)
+            os.chmod(path, 0o600)
+            sessions = self._read_index()
+            sessions[key] = {"storage_state": str(path), "saved": time.time()}
+            sessions = {k: s for k, s in sessions.items() if _is_fresh(s)}
+            self.index_path.write_text(json.dumps(sessions))
+
+            kept = {s["storage_state"] for s in sessions.values()}
+            for old in self.directory.glob("*.json"):
+                if old != self.index_path and str(old) not in kept:
+                    old.unlink()
+        return str(path)
+
+    def _lock(self):
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        return lock_file(self.index_path.with_suffix(".lock"))
+
+    def _read_index(self) -> dict:
+        if self.index_path.exists():
+            return json.loads(self.index_path.read_text())
+        return {}
+
+
+def _is_fresh(session: dict) -> bool:
+    return time.time() - session["saved"] < SESSION_MAX_AGE
@@ -0,0 +1,58 @@
+import json
+import stat
+from pathlib import Path
+from unittest import mock
+
+from cumulusci.robotframework import browser_sessions
+from cumulusci.robotframework.browser_sessions import BrowserSessionPool
+
+
+def _storage_state(tmp_path, name="state.json"):
+    path = tmp_path / name
+    path.write_text('{"cookies": []}')
+    return path
+
+
+class TestBrowserSessionPool:
+    def test_save_and_get(self, tmp_path):
+        pool = BrowserSessionPool(tmp_path / "sessions")
+        assert pool.get("org user") is None
+
+        saved = pool.save("org user", _storage_state(tmp_path))
+
+        assert pool.get("org user") == saved
+        assert pool.get("org other") is None
+        assert not (tmp_path / "state.json").exists()
+        assert stat.S_IMODE((tmp_path / "sessions").stat().st_mode) == 0o700
+        assert stat.S_IMODE(Path(saved).stat().st_mode) == 0o600
+
+    def test_save__replaces_session(self, tmp_path):
+        pool = BrowserSessionPool(tmp_path / "sessions")
+        first = pool.save("org user", _storage_state(tmp_path))
+        second = pool.save("org user", _storage_state(tmp_path))
+
+        assert pool.get("org user") == second
+        assert not Path(first).exists()
+
+    def test_get__expired(self, tmp_path):
+        pool = BrowserSessionPool(tmp_path / "sessions")
+        pool.save("org user", _storage_state(tmp_path))
+
+        with mock.patch.object(browser_sessions, "SESSION_MAX_AGE", -1):
+            assert pool.get("org user") is None
+
+    def test_get__missing_file(self, tmp_path):
+        pool = BrowserSessionPool(tmp_path / "sessions")
+        Path(pool.save("org user", _storage_state(tmp_path))).unlink()
+
+        assert pool.get("org user") is None
+
+    def test_save__removes_expired(self, tmp_path):
+        pool = BrowserSessionPool(tmp_path / "sessions")
+        old = pool.save("org old", _storage_state(tmp_path))
+        with mock.patch.object(browser_sessions, "SESSION_MAX_AGE", -1):
+            new = pool.save("org new", _storage_state(tmp_path))
+
+        assert not Path(old).exists()
+        assert not Path(new).exists()
+        assert json.loads(pool.index_path.read_text()) == {}
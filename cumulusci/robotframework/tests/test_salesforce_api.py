@@ -0,0 +1,270 @@
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from cumulusci.robotframework.SalesforceAPI import SalesforceAPI
+from cumulusci.tasks.bulkdata.step import (
+    DataOperationJobResult,
+    DataOperationResult,
+    DataOperationStatus,
+)
+
+
+class TestKeyword_delete_session_records:
+    def setup_method(self):
+        self.lib = SalesforceAPI()
+        self.lib._builtin = mock.Mock()
+
+    def test_delete_session_records__batches_by_type(self):
+        for i in range(3):
+            self.lib.store_session_record("Account", f"001{i}")
+        self.lib.store_session_record("Contact", "0030")
+        self.lib.store_session_record("Account", "0013")
+
+        with mock.patch.object(SalesforceAPI, "cumulusci") as cumulusci:
+            cumulusci.sf.restful.side_effect = lambda path, method, params: [
+                {"id": id, "success": True, "errors": []}
+                for id in params["ids"].split(",")
+            ]
+            self.lib.delete_session_records()
+
+        assert [c.kwargs["params"]["ids"] for c in cumulusci.sf.restful.mock_calls] == [
+            "0013",
+            "0030",
+            "0012,0011,0010",
+        ]
+        assert self.lib._session_records == []
+
+    def test_delete_session_records__chunks_large_batches(self):
+        for i in range(201):
+            self.lib.store_session_record("Account", f"001{i}")
+
+        with mock.patch.object(SalesforceAPI, "cumulusci") as cumulusci:
+            cumulusci.sf.restful.side_effect = lambda path, method, params: [
+                {"id": id, "success": True, "errors": []}
+                for id in params["ids"].split(",")
+            ]
+            self.lib.delete_session_records()
+
+        assert [
+            len(c.kwargs["params"]["ids"].split(","))
+            for c in cumulusci.sf.restful.mock_calls
+        ] == [200, 1]
+
+    def test_delete_session_records__errors(self):
+        self.lib.store_session_record("Account", "0010")
+        self.lib.store_session_record("Account", "0011")
+        self.lib.store_session_record("Account", "0012")
+        self.lib.store_session_record("Account", "0013")
+
+        with mock.patch.object(SalesforceAPI, "cumulusci") as cumulusci:
+            cumulusci.sf.restful.return_value = [
+                {
+                    "success": False,
+                    "errors": [
+                        {
+                            "statusCode": "INVALID_CROSS_REFERENCE_KEY",
+                            "message": "invalid cross reference id",
+                        }
+                    ],
+                },
+                {"id": "0012", "success": True, "errors": []},
+                {
+                    "success": False,
+                    "errors": [
+                        {"statusCode": "ENTITY_IS_DELETED", "message": "deleted"}
+                    ],
+                },
+                {
+                    "success": False,
+                    "errors": [
+                        {"statusCode": "DELETE_FAILED", "message": "Is referenced"}
+                    ],
+                },
+            ]
+            self.lib.delete_session_records()
+
+        self.lib._builtin.log.assert_any_call("    Account 0013 is already deleted")
+        self.lib._builtin.log.assert_any_call("    Account 0011 is already deleted")
+        self.lib._builtin.log.assert_any_call(
+            "    Account 0010 could not be deleted:", level="WARN"
+        )
+        self.lib._builtin.log.assert_any_call("      Is referenced", level="WARN")
+        assert [r["id"] for r in self.lib._session_records] == ["0013", "0011", "0010"]
+
+    def test_delete_session_records__request_fails(self):
+        self.lib.store_session_record("Account", "0010")
+
+        with mock.patch.object(SalesforceAPI, "cumulusci") as cumulusci:
+            cumulusci.sf.restful.side_effect = Exception("Server unavailable")
+            self.lib.delete_session_records()
+
+        self.lib._builtin.log.assert_any_call(
+            "    Account 0010 could not be deleted:", level="WARN"
+        )
+        self.lib._builtin.log.assert_any_call("      Server unavailable", level="WARN")
+
+    @mock.patch("cumulusci.robotframework.SalesforceAPI.SalesforceBulk")
+    @mock.patch("cumulusci.tasks.bulkdata.step.get_dml_operation")
+    def test_delete_session_records__bulk(self, get_dml_operation, SalesforceBulk):
+        self.lib.store_session_record("Contact", "0030")
+        for i in range(2000):
+            self.lib.store_session_record("Account", f"001{i}")
+        operation = mock.MagicMock()
+        operation.__enter__.return_value = operation
+        operation.job_result = DataOperationJobResult(
+            DataOperationStatus.ROW_FAILURE, [], 2000, 2
+        )
+        operation.get_results.return_value = iter(
+            [
+                DataOperationResult(
+                    None, False, "ENTITY_IS_DELETED:entity is deleted:--"
+                ),
+                DataOperationResult(None, False, "DELETE_FAILED:Is referenced:--"),
+            ]
+            + [DataOperationResult(f"001{i}", True, None) for i in range(1997, -1, -1)]
+        )
+        get_dml_operation.return_value = operation
+
+        with mock.patch.object(SalesforceAPI, "cumulusci") as cumulusci:
+            cumulusci.sf.restful.return_value = [
+                {"id": "0030", "success": True, "errors": []}
+            ]
+            self.lib.delete_session_records()
+
+        assert get_dml_operation.call_args.kwargs["sobject"] == "Account"
+        assert get_dml_operation.call_args.kwargs["fields"] == ["Id"]
+        records = list(operation.load_records.call_args.args[0])
+        assert records[:2] == [["0011999"], ["0011998"]]
+        cumulusci.sf.restful.assert_called_once()
+        self.lib._builtin.log.assert_any_call("    Account 0011999 is already deleted")
+        self.lib._builtin.log.assert_any_call(
+            "    Account 0011998 could not be deleted:", level="WARN"
+        )
+        self.lib._builtin.log.assert_any_call("      Is referenced:--", level="WARN")
+        assert [r["id"] for r in self.lib._session_records] == ["0011999", "0011998"]
+
+    @mock.patch("cumulusci.robotframework.SalesforceAPI.SalesforceBulk")
+    @mock.patch("cumulusci.tasks.bulkdata.step.get_dml_operation")
+    def test_delete_session_records__bulk_job_fails(
+        self, get_dml_operation, SalesforceBulk
+    ):
+        for i in range(2000):
+            self.lib.store_session_record("Account", f"001{i}")
+        operation = mock.MagicMock()
+        operation.__enter__.return_value = operation
+        operation.job_result = DataOperationJobResult(
+            DataOperationStatus.JOB_FAILURE, ["Job aborted"], 0, 0
+        )
+        get_dml_operation.return_value = operation
+
+        with mock.patch.object(SalesforceAPI, "cumulusci"):
+            self.lib.delete_session_records()
+
+        self.lib._builtin.log.assert_any_call("      Job aborted", level="WARN")
+        assert len(self.lib._session_records) == 2000
+
+
+class TestKeyword_generate_and_insert_test_data:
+    def setup_method(self):
+        self.lib = SalesforceAPI()
+        self.lib._builtin = mock.Mock()
+
+    def _operation(self, results, status=DataOperationStatus.SUCCESS):
+        operation = mock.MagicMock()
+        operation.__enter__.return_value = operation
+        operation.job_result = DataOperationJobResult(status, [], len(results), 0)
+        operation.get_results.return_value = iter(results)
+        return operation
+
+    @mock.patch("cumulusci.robotframework.SalesforceAPI.SalesforceBulk")
+    @mock.patch("cumulusci.tasks.bulkdata.step.get_dml_operation")
+    def test_generate_and_insert_test_data(self, get_dml_operation, SalesforceBulk):
+        operation = self._operation(
+            [DataOperationResult(f"003{i}", True, None) for i in range(3)]
+        )
+        get_dml_operation.return_value = operation
+
+        with mock.patch.object(SalesforceAPI, "cumulusci"):
+            ids = self.lib.generate_and_insert_test_data(
+                "Contact", "3", LastName="User {{number}}", Age="{{10 + number}}"
+            )
+
+        assert ids == ["0030", "0031", "0032"]
+        assert get_dml_operation.call_args.kwargs["fields"] == ["LastName", "Age"]
+        assert get_dml_operation.call_args.kwargs["volume"] == 3
+        records = operation.load_records.call_args.args[0]
+        assert list(records) == [["User 0", "10"], ["User 1", "11"], ["User 2", "12"]]
+        assert self.lib._session_records == [
+            {"type": "Contact", "id": id} for id in ids
+        ]
+        assert "records per second" in self.lib._builtin.log.call_args.args[0]
+
+    @mock.patch("cumulusci.robotframework.SalesforceAPI.SalesforceBulk")
+    @mock.patch("cumulusci.tasks.bulkdata.step.get_dml_operation")
+    def test_generate_and_insert_test_data__row_errors(
+        self, get_dml_operation, SalesforceBulk
+    ):
+        get_dml_operation.return_value = self._operation(
+            [
+                DataOperationResult("0030", True, None),
+                DataOperationResult(None, False, "REQUIRED_FIELD_MISSING"),
+            ],
+            DataOperationStatus.ROW_FAILURE,
+        )
+
+        with mock.patch.object(SalesforceAPI, "cumulusci"):
+            with pytest.raises(AssertionError, match="1 of 2 Contact records"):
+                self.lib.generate_and_insert_test_data("Contact", 2)
+
+        assert self.lib._session_records == [{"type": "Contact", "id": "0030"}]
+
+    @mock.patch("cumulusci.robotframework.SalesforceAPI.SalesforceBulk")
+    @mock.patch("cumulusci.tasks.bulkdata.step.get_dml_operation")
+    def test_generate_and_insert_test_data__job_failure(
+        self, get_dml_operation, SalesforceBulk
+    ):
+        operation = self._operation([], DataOperationStatus.JOB_FAILURE)
+        operation.job_result = operation.job_result._replace(job_errors=["Timed out"])
+        get_dml_operation.return_value = operation
+
+        with mock.patch.object(SalesforceAPI, "cumulusci"):
+            with pytest.raises(AssertionError, match="Timed out"):
+                self.lib.generate_and_insert_test_data("Contact", 2)
+
+    @mock.patch("cumulusci.robotframework.SalesforceAPI.SalesforceBulk")
+    @mock.patch("cumulusci.tasks.bulkdata.step.get_dml_operation")
+    def test_salesforce_bulk_insert(self, get_dml_operation, SalesforceBulk):
+        operation = self._operation(
+            [DataOperationResult(f"001{i}", True, None) for i in range(2)]
+        )
+        get_dml_operation.return_value = operation
+        objects = [
+            {"attributes": {"type": "Account"}, "Name": "A"},
+            {"attributes": {"type": "Account"}, "Name": "B", "Rating": "Hot"},
+        ]
+
+        with mock.patch.object(SalesforceAPI, "cumulusci"):
+            result = self.lib.salesforce_bulk_insert(objects)
+
+        assert [obj["id"] for obj in result] == ["0010", "0011"]
+        assert get_dml_operation.call_args.kwargs["sobject"] == "Account"
+        assert list(operation.load_records.call_args.args[0]) == [
+            ["A", None],
+            ["B", "Hot"],
+        ]
+
+
+def test_import__no_bulkdata():
+    # Suites which only use the REST keywords shouldn't pay for sqlalchemy
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, cumulusci.robotframework.SalesforceAPI; "
+            "assert 'sqlalchemy' not in sys.modules",
+        ],
+        check=True,
+    )
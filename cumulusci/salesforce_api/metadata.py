@@ -7,10 +7,12 @@ based on mrbelvedere/mpinstaller/mdapi.py
 #   - add docstrings
 #   - look at https://github.com/rholder/retrying
 
+import atexit
 import base64
 import http.client
 import io
 import re
+import threading
 import time
 from collections import defaultdict
 from xml.sax.saxutils import escape
@@ -29,6 +31,7 @@ from cumulusci.salesforce_api.exceptions import (
     MetadataParseError,
 )
 from cumulusci.utils import parse_api_datetime, zip_subfolder
+from cumulusci.utils.xml import lxml_parse_string
 
 # If pyOpenSSL is installed, make sure it's not used for requests
 # (it's not needed in the verisons of Python we support)
@@ -43,6 +46,46 @@ INVALID_CROSS_REF_ERROR = "INVALID_CROSS_REFERENCE_KEY: No package named"
 
 retry_policy = Retry(backoff_factor=0.3)
 
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_mdapi_session(instance_url):
+    """Return the keep-alive session used for Metadata API calls to an instance.
+
+    Sessions are shared by all calls in the process, so that status polls
+    during a long deploy reuse a pooled connection instead of opening a new
+    one (and paying for a TLS handshake) each time. There is one session
+    per instance, and they are closed when the process exits."""
+    with _sessions_lock:
+        session = _sessions.get(instance_url)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(max_retries=retry_policy))
+            _sessions[instance_url] = session
+        return session
+
+
+def discard_mdapi_session(instance_url, session):
+    """Close a session whose pooled connections the server has dropped, so
+    that the next call for the instance gets a new one."""
+    with _sessions_lock:
+        if _sessions.get(instance_url) is session:
+            del _sessions[instance_url]
+    session.close()
+
+
+def close_mdapi_sessions():
+    """Close the sessions of all instances."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_mdapi_sessions)
+
 
 class BaseMetadataApiCall(object):
     check_interval = 1
@@ -58,6 +101,14 @@ class BaseMetadataApiCall(object):
         self.task = task
         self.status = None
         self.check_num = 1
+        # Counts and timings of the SOAP requests made by this call.
+        # server_time is the time spent waiting for response headers.
+        self.metrics = {
+            "requests": 0,
+            "request_time": 0.0,
+            "server_time": 0.0,
+            "poll_wait_time": 0.0,
+        }
         self.api_version = (
             api_version
             if api_version
@@ -67,6 +118,7 @@ class BaseMetadataApiCall(object):
     def __call__(self):
         self.task.logger.info("Pending")
         response = self._get_response()
+        self._log_metrics()
         if self.status != "Failed":
             try:
                 return self._process_response(response)
@@ -106,22 +158,52 @@ class BaseMetadataApiCall(object):
         # Insert the session id
         session_id = self.task.org_config.access_token
         auth_envelope = envelope.replace("###SESSION_ID###", session_id)
-        session = requests.Session()
-        http_adapter = HTTPAdapter(max_retries=retry_policy)
-        session.mount("https://", http_adapter)
-        response = session.post(
-            self._build_endpoint_url(),
-            headers=headers,
-            data=auth_envelope.encode("utf-8"),
-        )
-        faultcode = parseString(response.content).getElementsByTagName("faultcode")
+        endpoint = self._build_endpoint_url()
+        instance_url = self.task.org_config.instance_url
+        session = get_mdapi_session(instance_url)
+        start = time.monotonic()
+        try:
+            response = session.post(
+                endpoint,
+                headers=headers,
+                data=auth_envelope.encode("utf-8"),
+            )
+        except requests.exceptions.ConnectionError:
+            # The server may have closed the pooled keep-alive connections.
+            # urllib3 doesn't retry POSTs, so try once more with a new session.
+            discard_mdapi_session(instance_url, session)
+            response = get_mdapi_session(instance_url).post(
+                endpoint,
+                headers=headers,
+                data=auth_envelope.encode("utf-8"),
+            )
+        self.metrics["requests"] += 1
+        self.metrics["request_time"] += time.monotonic() - start
+        self.metrics["server_time"] += response.elapsed.total_seconds()
+
         # refresh = False can be passed to prevent a loop if refresh fails
         if refresh is None:
             refresh = True
-        if faultcode:
+        if self._is_soap_fault(response):
             return self._handle_soap_error(headers, envelope, refresh, response)
         return response
 
+    def _is_soap_fault(self, response):
+        # Only responses that mention a faultcode element need to be parsed;
+        # the rest are parsed once, by whichever method processes them.
+        if b"<faultcode" not in response.content:
+            return False
+        tree = lxml_parse_string(response.content)
+        return next(tree.iter("faultcode"), None) is not None
+
+    def _log_metrics(self):
+        metrics = self.metrics
+        self.task.logger.debug(
+            f"Metadata API: {metrics['requests']} requests took "
+            f"{metrics['request_time']:.2f}s ({metrics['server_time']:.2f}s "
+            f"waiting for the server, {metrics['poll_wait_time']:.2f}s between polls)"
+        )
+
     def _get_element_value(self, dom, tag):
         result = dom.getElementsByTagName(tag)
         if result and result[0].firstChild:
@@ -157,6 +239,7 @@ class BaseMetadataApiCall(object):
                 self.check_num += 1
 
                 time.sleep(check_interval)
+                self.metrics["poll_wait_time"] += check_interval
             # Fetch the final result and return
             if self.soap_envelope_result:
                 envelope = self._build_envelope_result()
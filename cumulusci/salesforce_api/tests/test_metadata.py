@@ -2,9 +2,11 @@ import datetime
 import http.client
 import io
 from collections import defaultdict
+from unittest import mock
 from xml.dom.minidom import parseString
 
 import pytest
+import requests
 import responses
 from requests import Response
 
@@ -23,6 +25,8 @@ from cumulusci.salesforce_api.metadata import (
     ApiRetrievePackaged,
     ApiRetrieveUnpackaged,
     BaseMetadataApiCall,
+    close_mdapi_sessions,
+    get_mdapi_session,
 )
 from cumulusci.salesforce_api.package_zip import (
     BasePackageZipBuilder,
@@ -424,6 +428,71 @@ class TestBaseTestMetadataApi:
         resp = api._get_response()
 
         assert resp.content == response_result
+        assert api.metrics["requests"] == 3
+
+    @responses.activate
+    def test_call_mdapi__reuses_session(self):
+        org_config = {
+            "instance_url": "https://na12.salesforce.com",
+            "id": "https://login.salesforce.com/id/00D000000000000ABC/005000000000000ABC",
+            "access_token": "0123456789",
+        }
+        task = self._create_task(org_config=org_config)
+        api = self._create_instance(task)
+        response = b'<?xml version="1.0" encoding="UTF-8"?><foo>bar</foo>'
+        self._mock_call_mdapi(api, response)
+
+        with mock.patch(
+            "cumulusci.salesforce_api.metadata.get_mdapi_session",
+            wraps=get_mdapi_session,
+        ) as get_session:
+            api._call_mdapi({}, "")
+            api._call_mdapi({}, "")
+
+        assert get_session.call_count == 2
+        assert get_mdapi_session("https://na12.salesforce.com") is get_mdapi_session(
+            "https://na12.salesforce.com"
+        )
+        assert get_mdapi_session(
+            "https://na12.salesforce.com"
+        ) is not get_mdapi_session("https://na13.salesforce.com")
+        assert api.metrics["requests"] == 2
+        assert api.metrics["server_time"] >= 0
+
+    @responses.activate
+    def test_call_mdapi__stale_connection(self):
+        org_config = {
+            "instance_url": "https://na12.salesforce.com",
+            "id": "https://login.salesforce.com/id/00D000000000000ABC/005000000000000ABC",
+            "access_token": "0123456789",
+        }
+        task = self._create_task(org_config=org_config)
+        api = self._create_instance(task)
+        responses.add(
+            method=responses.POST,
+            url=api._build_endpoint_url(),
+            body=requests.exceptions.ConnectionError("Connection aborted."),
+        )
+        response = b'<?xml version="1.0" encoding="UTF-8"?><foo>bar</foo>'
+        self._mock_call_mdapi(api, response)
+        stale_session = get_mdapi_session("https://na12.salesforce.com")
+
+        with mock.patch.object(stale_session, "close") as close:
+            assert api._call_mdapi({}, "").content == response
+
+        close.assert_called_once()
+        assert len(responses.calls) == 2
+        assert get_mdapi_session("https://na12.salesforce.com") is not stale_session
+        assert api.metrics["requests"] == 1
+
+    def test_close_mdapi_sessions(self):
+        session = get_mdapi_session("https://na12.salesforce.com")
+
+        with mock.patch.object(session, "close") as close:
+            close_mdapi_sessions()
+
+        close.assert_called_once()
+        assert get_mdapi_session("https://na12.salesforce.com") is not session
 
     @responses.activate
     def test_get_response_status_loop_twice(self):
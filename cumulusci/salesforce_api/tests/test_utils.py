@@ -1,9 +1,14 @@
 from json import JSONDecodeError
 from unittest.mock import Mock, patch
 
+import pytest
+import responses
+from simple_salesforce.exceptions import SalesforceExpiredSession
+
 from cumulusci import __version__
 from cumulusci.core.config import OrgConfig
 from cumulusci.core.exceptions import ServiceNotConfigured
+from cumulusci.core.tasks import BaseSalesforceTask
 from cumulusci.salesforce_api.utils import get_simple_salesforce_connection
 
 
@@ -107,3 +112,92 @@ def test_sf_api_retries(mock_http_response):
             pass
 
         assert 2 == _make_request.call_count
+
+
+@responses.activate
+def test_connection__refreshes_expired_session():
+    org_config = OrgConfig(
+        {
+            "instance_url": "https://orgname.my.salesforce.com",
+            "access_token": "EXPIRED",
+        },
+        "test",
+    )
+
+    def refresh_oauth_token(keychain):
+        assert BaseSalesforceTask._credentials_lock.locked()
+        org_config.config["access_token"] = "FRESH"
+
+    org_config.refresh_oauth_token = Mock(side_effect=refresh_oauth_token)
+    org_config.save = Mock()
+    proj_config = Mock()
+    proj_config.keychain.get_service.side_effect = ServiceNotConfigured
+    proj_config.project__package__api_version = "51.0"
+    url = "https://orgname.my.salesforce.com/services/data/v51.0/sobjects"
+    responses.add("GET", url, status=401, json=[{"errorCode": "INVALID_SESSION_ID"}])
+    responses.add("GET", url, json={"sobjects": []})
+
+    sf = get_simple_salesforce_connection(proj_config, org_config)
+    assert sf.describe() == {"sobjects": []}
+
+    org_config.refresh_oauth_token.assert_called_once_with(proj_config.keychain)
+    org_config.save.assert_called_once()
+    assert responses.calls[1].request.headers["Authorization"] == "Bearer FRESH"
+    assert sf.headers["Authorization"] == "Bearer FRESH"
+
+
+@responses.activate
+def test_connection__session_refreshed_by_other_thread():
+    org_config = OrgConfig(
+        {
+            "instance_url": "https://orgname.my.salesforce.com",
+            "access_token": "EXPIRED",
+        },
+        "test",
+    )
+    org_config.refresh_oauth_token = Mock()
+    proj_config = Mock()
+    proj_config.keychain.get_service.side_effect = ServiceNotConfigured
+    proj_config.project__package__api_version = "51.0"
+    url = "https://orgname.my.salesforce.com/services/data/v51.0/sobjects"
+    responses.add("GET", url, status=401, json=[{"errorCode": "INVALID_SESSION_ID"}])
+    responses.add("GET", url, json={"sobjects": []})
+
+    lock = Mock()
+
+    def refresh_in_other_thread():
+        org_config.config["access_token"] = "FRESH"
+
+    lock.__enter__ = Mock(side_effect=refresh_in_other_thread)
+    lock.__exit__ = Mock(return_value=None)
+
+    sf = get_simple_salesforce_connection(proj_config, org_config)
+    with patch.object(BaseSalesforceTask, "_credentials_lock", lock):
+        assert sf.describe() == {"sobjects": []}
+
+    org_config.refresh_oauth_token.assert_not_called()
+    assert responses.calls[1].request.headers["Authorization"] == "Bearer FRESH"
+
+
+@responses.activate
+def test_connection__refreshes_expired_session_once():
+    org_config = OrgConfig(
+        {
+            "instance_url": "https://orgname.my.salesforce.com",
+            "access_token": "BOGUS",
+        },
+        "test",
+    )
+    org_config.refresh_oauth_token = Mock()
+    proj_config = Mock()
+    proj_config.keychain.get_service.side_effect = ServiceNotConfigured
+    proj_config.project__package__api_version = "51.0"
+    url = "https://orgname.my.salesforce.com/services/data/v51.0/sobjects"
+    responses.add("GET", url, status=401, json=[{"errorCode": "INVALID_SESSION_ID"}])
+
+    sf = get_simple_salesforce_connection(proj_config, org_config)
+    with pytest.raises(SalesforceExpiredSession):
+        sf.describe()
+
+    org_config.refresh_oauth_token.assert_called_once()
+    assert len(responses.calls) == 2
@@ -41,6 +41,9 @@ def get_simple_salesforce_connection(
     sf.headers.setdefault(CALL_OPTS_HEADER_KEY, "client={}".format(client_name))
     sf.session.mount("http://", adapter)
     sf.session.mount("https://", adapter)
+    sf.session.hooks["response"].append(
+        _refresh_expired_session(sf, project_config, org_config)
+    )
 
     if base_url:
         base_url = (
@@ -49,3 +52,34 @@ def get_simple_salesforce_connection(
         sf.base_url += base_url
 
     return sf
+
+
+def _refresh_expired_session(sf, project_config, org_config):
+    """Return a response hook that refreshes the org's access token and
+    resends the request when Salesforce rejects it as unauthorized.
+
+    This lets tasks reuse a previously issued access token and only
+    refresh it once it actually turns out to be expired."""
+
+    def hook(response, *args, **kwargs):
+        if response.status_code != 401 or getattr(
+            response.request, "_session_refreshed", False
+        ):
+            return
+        from cumulusci.core.tasks import BaseSalesforceTask
+
+        authorization = response.request.headers.get("Authorization")
+        with BaseSalesforceTask._credentials_lock:
+            # Another thread may have refreshed the token while we waited
+            if authorization == f"Bearer {org_config.access_token}":
+                with org_config.save_if_changed():
+                    org_config.refresh_oauth_token(project_config.keychain)
+        sf.session_id = org_config.access_token
+        sf.headers["Authorization"] = f"Bearer {org_config.access_token}"
+
+        request = response.request.copy()
+        request.headers["Authorization"] = f"Bearer {org_config.access_token}"
+        request._session_refreshed = True
+        return sf.session.send(request, **kwargs)
+
+    return hook
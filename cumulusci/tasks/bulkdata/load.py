@@ -1,9 +1,14 @@
+import copy
+import functools
 import tempfile
+import threading
 import typing as T
+import weakref
 from collections import defaultdict
 from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import MagicMock
+from uuid import uuid4
 
 from sqlalchemy import Column, MetaData, Table, Unicode, create_engine, func, inspect
 from sqlalchemy.ext.automap import automap_base
@@ -45,6 +50,29 @@ from cumulusci.tasks.bulkdata.utils import (
 )
 from cumulusci.tasks.salesforce import BaseSalesforceApiTask
 
+_shared_load_states = weakref.WeakValueDictionary()
+
+
+class SharedLoadState:
+    """Setup which LoadData tasks running in the same process can share.
+
+    The Snowfakery task loads many portions of generated data into one org
+    with the same mapping. Loader tasks given the id of the same state
+    validate the mapping against the org only once and reuse its API
+    connections instead of opening new ones for every portion."""
+
+    def __init__(self):
+        self.id = uuid4().hex
+        self.lock = threading.RLock()
+        self.mappings = {}
+        self.connections = {}
+        _shared_load_states[self.id] = self
+
+
+def get_shared_load_state(state_id: T.Optional[str]) -> T.Optional[SharedLoadState]:
+    """Return the shared state with this id, if it exists in this process."""
+    return _shared_load_states.get(state_id) if state_id else None
+
 
 class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
     """Perform Bulk API operations to load data defined by a mapping from a local store into an org."""
@@ -90,6 +118,12 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         },
     }
     row_warning_limit = 10
+    # Called with the result of each step as soon as it finishes,
+    # e.g. by parallel workers reporting to the Snowfakery task.
+    progress_reporter: T.Optional[T.Callable[[dict], None]] = None
+    # Id of a SharedLoadState whose validated mapping and API connections
+    # should be reused, set by the Snowfakery task's loader workers.
+    shared_state_id: T.Optional[str] = None
 
     def _init_options(self, kwargs):
         super(LoadData, self)._init_options(kwargs)
@@ -116,6 +150,29 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
             self.options.get("set_recently_viewed", True)
         )
 
+    @property
+    def shared_state(self) -> T.Optional[SharedLoadState]:
+        # Only available when the state was created in this process;
+        # otherwise the task sets itself up from scratch.
+        return get_shared_load_state(self.shared_state_id)
+
+    def _init_api(self, base_url=None):
+        return self._get_shared_connection(
+            base_url, functools.partial(super()._init_api, base_url)
+        )
+
+    def _init_bulk(self):
+        return self._get_shared_connection("bulk", super()._init_bulk)
+
+    def _get_shared_connection(self, name, factory):
+        if not self.shared_state:
+            return factory()
+        key = (self.org_config.instance_url, self.org_config.access_token, name)
+        with self.shared_state.lock:
+            if key not in self.shared_state.connections:
+                self.shared_state.connections[key] = factory()
+            return self.shared_state.connections[key]
+
     def _init_dataset(self):
         """Find the dataset paths to use with the following sequence:
         1. If `org_shape_match_only` is True (defaults False),
@@ -225,6 +282,10 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
                 results[name] = StepResultInfo(
                     mapping.sf_object, result, mapping.record_type
                 )
+                if self.progress_reporter:
+                    self.progress_reporter(
+                        {"step_results": {name: results[name].simplify()}}
+                    )
         if self.options["set_recently_viewed"]:
             try:
                 self.logger.info("Setting records to 'recently viewed'.")
@@ -593,16 +654,35 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         if not mapping_file_path:
             raise TaskOptionsError("Mapping file path required")
 
-        self.mapping = parse_from_yaml(mapping_file_path)
+        if not self.shared_state:
+            self.mapping = self._parse_and_validate_mapping(mapping_file_path)
+            return
+
+        key = (
+            Path(mapping_file_path).read_bytes(),
+            self.options["inject_namespaces"],
+            self.options["drop_missing_schema"],
+        )
+        with self.shared_state.lock:
+            if key not in self.shared_state.mappings:
+                self.shared_state.mappings[key] = self._parse_and_validate_mapping(
+                    mapping_file_path
+                )
+        # Later steps adjust the mapping, so every task gets its own copy.
+        self.mapping = copy.deepcopy(self.shared_state.mappings[key])
+
+    def _parse_and_validate_mapping(self, mapping_file_path):
+        mapping = parse_from_yaml(mapping_file_path)
 
         validate_and_inject_mapping(
-            mapping=self.mapping,
+            mapping=mapping,
             sf=self.sf,
             namespace=self.project_config.project__package__namespace,
             data_operation=DataOperationType.INSERT,
             inject_namespaces=self.options["inject_namespaces"],
             drop_missing=self.options["drop_missing_schema"],
         )
+        return mapping
 
     def _expand_mapping(self):
         """Walk the mapping and generate any required 'after' steps
@@ -223,6 +223,7 @@ class Snowfakery(BaseSalesforceApiTask):
         self.start_time = time.time()
         self.recipe = Path(self.options.get("recipe"))
         self.sobject_counts = defaultdict(RunningTotals)
+        self.reported_steps = defaultdict(set)
         self._init_channel_configs(self.recipe)
 
     ## Todo: Consider when this process runs longer than 2 Hours,
@@ -257,13 +258,16 @@ class Snowfakery(BaseSalesforceApiTask):
             # Retrieve OrgRecordCounts code from
             # https://github.com/SFDO-Tooling/CumulusCI/commit/7d703c44b94e8b21f165e5538c2249a65da0a9eb#diff-54676811961455410c30d9c9405a8f3b9d12a6222a58db9d55580a2da3cfb870R147
 
-            self._loop(
-                template_path,
-                working_directory,
-                None,
-                portions,
-            )
-            self.finish()
+            try:
+                self._loop(
+                    template_path,
+                    working_directory,
+                    None,
+                    portions,
+                )
+                self.finish()
+            finally:
+                self.queue_manager.shutdown()
 
     def _setup_channels_and_queues(self, working_directory):
         """Set up all of the channels and queues.
@@ -347,6 +351,7 @@ class Snowfakery(BaseSalesforceApiTask):
         upload_status = self.get_upload_status(
             portions.next_batch_size,
         )
+        last_display = 0
 
         while not portions.done(upload_status.total_sets_working_on_or_uploaded):
             if self.debug_mode:
@@ -359,15 +364,20 @@ class Snowfakery(BaseSalesforceApiTask):
                 portions,
                 self.get_upload_status,
             )
-            self.update_running_totals()
-            self.print_running_totals()
-
-            time.sleep(WAIT_TIME)
+            # Wake up as soon as a loader reports a result, so that new
+            # work is scheduled and failures are noticed without waiting
+            # out a fixed interval.
+            self.update_running_totals(timeout=WAIT_TIME)
+            display = time.time() - last_display >= WAIT_TIME
+            if display:
+                last_display = time.time()
+                self.print_running_totals()
 
             upload_status = self._report_status(
                 portions.batch_size,
                 org_record_counts_thread,
                 template_path,
+                display=display,
             )
 
         return upload_status
@@ -377,19 +387,20 @@ class Snowfakery(BaseSalesforceApiTask):
         batch_size,
         org_record_counts_thread,
         template_path,
+        display=True,
     ):
         """Let the user know what is going on."""
-        self.logger.info(
-            "\n********** PROGRESS *********",
-        )
-
         upload_status = self.get_upload_status(
             batch_size or 0,
         )
 
-        self.logger.info(upload_status._display(detailed=self.debug_mode))
+        if display:
+            self.logger.info(
+                "\n********** PROGRESS *********",
+            )
+            self.logger.info(upload_status._display(detailed=self.debug_mode))
 
-        if upload_status.sets_failed:
+        if display and upload_status.sets_failed:
             # TODO: this is not sufficiently tested.
             #       commenting it out doesn't break tests
             self.log_failures()
@@ -404,26 +415,41 @@ class Snowfakery(BaseSalesforceApiTask):
 
         return upload_status
 
-    def update_running_totals(self) -> None:
+    def update_running_totals(self, timeout: float = 0) -> None:
         """Read and collate result reports from sub-processes/sub-threads
 
-        This is a realtime reporting channel which could, in theory, be updated
-        before sub-tasks finish. Currently no sub-tasks are coded to do that.
+        Loaders report the result of each step as soon as it finishes,
+        and then all of their results again when they finish. Steps
+        which were already counted are skipped in the final report.
 
-        The logical next step is to allow LoadData to monitor steps one by
-        one or even batches one by one.
-
-        Note that until we implement that, we are paying the complexity
-        cost of a real-time channel but not getting the benefits of it.
+        If `timeout` is given, wait up to that many seconds for the first
+        report.
         """
         while True:
             try:
-                results = self.queue_manager.get_results_report()
+                results = self.queue_manager.get_results_report(
+                    block=bool(timeout), timeout=timeout or None
+                )
             except Empty:
                 break
-            if "results" in results and "step_results" in results["results"]:
+            timeout = 0
+            directory = results.get("directory")
+            if results.get("status") == "progress":
+                step_results = results["results"]["step_results"]
+                self.reported_steps[directory].update(step_results)
                 self.update_running_totals_from_load_step_results(results["results"])
+            elif "results" in results and "step_results" in results["results"]:
+                reported = self.reported_steps.pop(directory, ())
+                step_results = {
+                    name: result
+                    for name, result in results["results"]["step_results"].items()
+                    if name not in reported
+                }
+                self.update_running_totals_from_load_step_results(
+                    {"step_results": step_results}
+                )
             elif "error" in results:
+                self.reported_steps.pop(directory, None)
                 self.logger.warning(f"Error in load: {results}")
             else:  # pragma: no cover
                 self.logger.warning(f"Unexpected message from subtask: {results}")
@@ -517,9 +543,13 @@ class Snowfakery(BaseSalesforceApiTask):
 
         Useful for debugging but also for making decisions about what to do next."""
 
-        return self.queue_manager.get_upload_status(
+        upload_status = self.queue_manager.get_upload_status(
             batch_size, self.sets_finished_while_generating_template
         )
+        return upload_status._replace(
+            rows_loaded=sum(t.successes for t in self.sobject_counts.values()),
+            row_errors=sum(t.errors for t in self.sobject_counts.values()),
+        )
 
     @contextmanager
     def workingdir_or_tempdir(self, working_directory: T.Optional[T.Union[Path, str]]):
@@ -10,7 +10,7 @@ from pathlib import Path
 import cumulusci.core.exceptions as exc
 from cumulusci.core.config import OrgConfig
 from cumulusci.tasks.bulkdata.generate_from_yaml import GenerateDataFromYaml
-from cumulusci.tasks.bulkdata.load import LoadData
+from cumulusci.tasks.bulkdata.load import LoadData, SharedLoadState
 from cumulusci.utils.parallel.task_worker_queues.parallel_worker_queue import (
     WorkerQueue,
     WorkerQueueConfig,
@@ -26,6 +26,9 @@ LOAD_QUEUE_SIZE = 15
 # more loader workers than generators because they spend so much time
 # waiting for responses. 4:1 is an experimentally derived ratio
 WORKER_TO_LOADER_RATIO = 4
+# workers are reused for this many portions before being replaced,
+# which saves starting a process and setting up its configs per portion
+JOBS_PER_WORKER = 50
 
 
 class SnowfakeryChannelManager:
@@ -161,6 +164,11 @@ class SnowfakeryChannelManager:
     def elapsed_seconds(self):
         return time.time() - self.start_time
 
+    def shutdown(self):
+        """Let idle workers exit"""
+        for channel in self.channels:
+            channel.shutdown()
+
     def failure_descriptions(self) -> T.List[str]:
         """Log failures from sub-processes to main process"""
         ret = []
@@ -173,17 +181,12 @@ class SnowfakeryChannelManager:
             channel.tick()
         return all([channel.check_finished() for channel in self.channels])
 
-    def get_results_report(self, block=False):
+    def get_results_report(self, block=False, timeout=None):
         """
-        This is a realtime reporting channel which could, in theory, be updated
-        before sub-tasks finish. Currently no sub-tasks are coded to do that.
-
-        The logical next step is to allow LoadData to monitor steps one by
-        one or even batches one by one.
-
-        Note that until we implement that, we are paying the complexity
-        cost of a real-time channel but not getting the benefits of it."""
-        return self.results_reporter.get(block=block)
+        This is a realtime reporting channel. Loaders put the results
+        of each step on it as soon as the step finishes, and all of their
+        results once they are done. Failed sub-tasks report their error."""
+        return self.results_reporter.get(block=block, timeout=timeout)
 
 
 class Channel:
@@ -242,6 +245,7 @@ class Channel:
             make_task_options=data_generator_opts_callback,
             queue_size=0,
             num_workers=self.num_generator_workers,
+            max_jobs_per_worker=JOBS_PER_WORKER,
         )
         # datagen queues do not get a result reporter because
         # a) we are less curious about how many records have
@@ -251,6 +255,12 @@ class Channel:
         # is a challenge.
         self.data_gen_q = WorkerQueue(data_gen_q_config, self.filesystem_lock)
 
+        # Loaders are threads, so they can share the validated mapping and
+        # API connections instead of setting them up for every portion.
+        # The portions themselves stay on disk so that they can be
+        # inspected and reloaded if a load fails.
+        self.shared_load_state = SharedLoadState()
+
         load_data_q_config = WorkerQueueConfig(
             project_config=self.project_config,
             org_config=self.org_config,
@@ -261,8 +271,10 @@ class Channel:
             name="data_load",
             task_class=LoadData,
             make_task_options=self.subtask_configurator.data_loader_opts,
+            task_attributes={"shared_state_id": self.shared_load_state.id},
             queue_size=LOAD_QUEUE_SIZE,
             num_workers=self.num_loader_workers,
+            max_jobs_per_worker=JOBS_PER_WORKER,
             rename_directory=self.data_loader_new_directory_name,
         )
         self.load_data_q = WorkerQueue(
@@ -303,7 +315,7 @@ class Channel:
             )
             self.job_counter += 1
             batch_size = portions.next_batch(
-                upload_status.total_sets_working_on_or_uploaded
+                upload_status.total_sets_working_on_or_uploaded, upload_status
             )
             if not batch_size:
                 self.logger.info("All scheduled portions generated and being uploaded")
@@ -368,15 +380,19 @@ class Channel:
         errors = [error_from_dir(failure_dir) for failure_dir in failure_dirs]
         return [error for error in errors if error is not None]
 
+    def shutdown(self):
+        self.data_gen_q.shutdown()
+        self.load_data_q.shutdown()
+
     def check_finished(self) -> bool:
         self.data_gen_q.tick()
         with self.filesystem_lock:
             still_running = (
                 len(
-                    self.data_gen_q.workers
+                    self.data_gen_q.busy_workers
                     + self.data_gen_q.queued_job_dirs
                     + self.data_gen_q.inprogress_jobs
-                    + self.load_data_q.workers
+                    + self.load_data_q.busy_workers
                     + self.load_data_q.inprogress_jobs
                     + self.load_data_q.queued_job_dirs
                 )
@@ -422,6 +438,9 @@ class UploadStatus(T.NamedTuple):
     inprogress_loader_jobs: int
     data_gen_free_workers: int
     channels: int
+    # rows the org has reported as loaded or failed
+    rows_loaded: int = 0
+    row_errors: int = 0
 
     @property
     def total_in_flight(self):
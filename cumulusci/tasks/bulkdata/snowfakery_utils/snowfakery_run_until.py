@@ -2,6 +2,16 @@ import typing as T
 
 from cumulusci.core import exceptions as exc
 
+# How much portions grow when nothing suggests otherwise
+GROWTH_FACTOR = 1.1
+# How much portions grow when loaders are waiting for data
+IDLE_GROWTH_FACTOR = 1.5
+# Rates measured in the first seconds of a run say more about startup
+# costs than about the org, so they are ignored until then.
+MEASUREMENT_WARMUP_SECONDS = 30
+# How much the share of rows failing to load must rise before portions shrink
+ROW_ERROR_RATE_MARGIN = 0.01
+
 
 class RunUntilBase:
     # subclasses need to fill in these two fields
@@ -114,6 +124,9 @@ class PortionGenerator:
         self.min_batch_size = min_batch_size
         self.max_batch_size = max_batch_size
         self.next_batch_size = min_batch_size
+        self.failed_portions = 0
+        self.rows_reported = 0
+        self.row_errors = 0
 
     def done(self, sets_created_so_far):
         return self.gap(sets_created_so_far) <= 0
@@ -121,12 +134,15 @@ class PortionGenerator:
     def gap(self, sets_created_so_far):
         return self.target - sets_created_so_far
 
-    def next_batch(self, sets_created_so_far: int):
+    def next_batch(self, sets_created_so_far: int, upload_status=None):
         """Batch size starts at min_batch_size and grows toward max_batch_size
         unless the count gets there first
 
         The reason we grow is to try to engage the org's loader queue earlier
         than we would if we waited for the first big batch to be generated.
+
+        If an UploadStatus is passed, the growth of later batches follows
+        the measured throughput (see `_next_batch_size`).
         """
         self.sets_created = sets_created_so_far
         # don't generate more records than needed to reach our target
@@ -137,5 +153,71 @@ class PortionGenerator:
         )
         # don't generate fewer than zero
         self.batch_size = max(self.batch_size, 0)
-        self.next_batch_size = int(self.next_batch_size * 1.1)
+        self.next_batch_size = self._next_batch_size(upload_status)
         return self.batch_size
+
+    def _next_batch_size(self, upload_status) -> int:
+        """Pick the size of the next batch from how the org is keeping up.
+
+        * After a portion fails to load, or when a larger share of the
+          rows reported since the last portion failed than before, the
+          size is halved, so that failures throw away less work.
+        * Until the run has gone on for MEASUREMENT_WARMUP_SECONDS, the
+          size grows by GROWTH_FACTOR.
+        * If loaders are idle waiting for data, the size grows faster.
+        * If the org would still be loading the queued portions by the
+          time the next one is generated, the size is held: a bigger
+          portion would only wait longer in the queue.
+        """
+        size = self.next_batch_size
+        if upload_status is None:
+            return int(size * GROWTH_FACTOR)
+
+        row_errors_rising = self._row_error_rate_rising(upload_status)
+        if upload_status.sets_failed > self.failed_portions or row_errors_rising:
+            self.failed_portions = upload_status.sets_failed
+            return max(size // 2, self.min_batch_size)
+
+        if upload_status.elapsed_seconds < MEASUREMENT_WARMUP_SECONDS:
+            return int(size * GROWTH_FACTOR)
+
+        if not upload_status.sets_queued_for_loading:
+            loaders_idle = (
+                upload_status.inprogress_loader_jobs
+                < upload_status.max_num_loader_workers
+            )
+            growth = IDLE_GROWTH_FACTOR if loaders_idle else GROWTH_FACTOR
+            return min(int(size * growth), self.max_batch_size)
+
+        # Portions are waiting for a loader. Compare how long the org will
+        # take to work through them with how long the next portion takes
+        # to generate.
+        elapsed = upload_status.elapsed_seconds
+        generation_rate = (
+            upload_status.sets_queued_for_loading
+            + upload_status.sets_being_loaded
+            + upload_status.sets_finished
+        ) / elapsed
+        upload_rate = upload_status.sets_finished / elapsed
+        if not upload_rate:
+            return size
+        seconds_to_load_queue = upload_status.sets_queued_for_loading / upload_rate
+        seconds_to_generate = size / generation_rate
+        if seconds_to_load_queue > seconds_to_generate:
+            return size
+        return min(int(size * GROWTH_FACTOR), self.max_batch_size)
+
+    def _row_error_rate_rising(self, upload_status) -> bool:
+        """Did the rows reported since the last call fail more often than
+        the rows reported before them?"""
+        rows_reported = upload_status.rows_loaded + upload_status.row_errors
+        new_rows = rows_reported - self.rows_reported
+        new_errors = upload_status.row_errors - self.row_errors
+        previous_rate = (
+            self.row_errors / self.rows_reported if self.rows_reported else 0
+        )
+        self.rows_reported = rows_reported
+        self.row_errors = upload_status.row_errors
+        if new_rows <= 0:
+            return False
+        return new_errors / new_rows > previous_rate + ROW_ERROR_RATE_MARGIN
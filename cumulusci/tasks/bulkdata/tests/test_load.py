@@ -18,6 +18,7 @@ from sqlalchemy import Column, Table, Unicode, create_engine
 from cumulusci.core.exceptions import BulkDataException, TaskOptionsError
 from cumulusci.salesforce_api.org_schema import get_org_schema
 from cumulusci.tasks.bulkdata import LoadData
+from cumulusci.tasks.bulkdata.load import SharedLoadState
 from cumulusci.tasks.bulkdata.mapping_parser import MappingLookup, MappingStep
 from cumulusci.tasks.bulkdata.step import (
     BulkApiDmlOperation,
@@ -151,6 +152,39 @@ class TestLoadData:
             MappingStep(sf_object="two", fields={})
         )
 
+    def test_run_task__progress_reporter(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "set_recently_viewed": False,
+                }
+            },
+        )
+        task._init_db = mock.Mock(return_value=nullcontext())
+        task._init_mapping = mock.Mock()
+        task._expand_mapping = mock.Mock()
+        task.mapping = {}
+        task.mapping["Insert Households"] = MappingStep(sf_object="one", fields={})
+        task.mapping["Insert Contacts"] = MappingStep(sf_object="two", fields={})
+        task.after_steps = {}
+        task._execute_step = mock.Mock(
+            return_value=DataOperationJobResult(DataOperationStatus.SUCCESS, [], 3, 0)
+        )
+        task.progress_reporter = mock.Mock()
+        task()
+
+        assert [
+            list(c.args[0]["step_results"]) for c in task.progress_reporter.mock_calls
+        ] == [["Insert Households"], ["Insert Contacts"]]
+        last_report = task.progress_reporter.mock_calls[1].args[0]
+        assert (
+            last_report["step_results"]["Insert Contacts"]
+            == task.return_values["step_results"]["Insert Contacts"]
+        )
+
     def test_run_task__after_steps(self):
         task = _make_task(
             LoadData,
@@ -554,6 +588,43 @@ class TestLoadData:
             drop_missing=True,
         )
 
+    @mock.patch("cumulusci.tasks.bulkdata.load.validate_and_inject_mapping")
+    def test_init_mapping_and_connections__shared_state(
+        self, validate_and_inject_mapping
+    ):
+        base_path = os.path.dirname(__file__)
+        shared_state = SharedLoadState()
+        tasks = [
+            _make_task(
+                LoadData,
+                {
+                    "options": {
+                        "database_url": "sqlite://",
+                        "mapping": os.path.join(base_path, self.mapping_file),
+                    }
+                },
+            )
+            for _ in range(2)
+        ]
+        for t in tasks:
+            t.shared_state_id = shared_state.id
+            t._init_task()
+            t._init_mapping()
+
+        validate_and_inject_mapping.assert_called_once()
+        assert tasks[0].mapping == tasks[1].mapping
+        assert tasks[0].mapping is not tasks[1].mapping
+        assert tasks[0].sf is tasks[1].sf
+        assert tasks[0].bulk is tasks[1].bulk
+        assert tasks[0].tooling is tasks[1].tooling
+        assert tasks[0].sf is not tasks[0].tooling
+
+    def test_shared_state__unknown(self):
+        t = _make_task(LoadData, {"options": {"database_url": "sqlite://"}})
+        assert t.shared_state is None
+        t.shared_state_id = "missing"
+        assert t.shared_state is None
+
     @responses.activate
     def test_expand_mapping_creates_after_steps(self):
         base_path = os.path.dirname(__file__)
@@ -1,9 +1,10 @@
 import re
 import typing as T
-from collections import Counter
+from collections import Counter, defaultdict
 from contextlib import contextmanager
 from itertools import cycle
 from pathlib import Path
+from queue import Empty
 from tempfile import TemporaryDirectory
 from threading import Lock, Thread
 from unittest import mock
@@ -19,6 +20,10 @@ from cumulusci.tasks.bulkdata.snowfakery import (
     Snowfakery,
     SnowfakeryWorkingDirectory,
 )
+from cumulusci.tasks.bulkdata.snowfakery_utils.queue_manager import UploadStatus
+from cumulusci.tasks.bulkdata.snowfakery_utils.snowfakery_run_until import (
+    PortionGenerator,
+)
 from cumulusci.tasks.bulkdata.tests.integration_test_utils import ensure_accounts
 from cumulusci.tasks.bulkdata.tests.utils import _make_task
 from cumulusci.tasks.salesforce.BaseSalesforceApiTask import BaseSalesforceApiTask
@@ -328,6 +333,9 @@ class TestSnowfakery:
         assert not Process.mock_calls
 
     @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    @mock.patch(
+        "cumulusci.tasks.bulkdata.snowfakery_utils.queue_manager.JOBS_PER_WORKER", 1
+    )
     def test_small(
         self, mock_load_data, threads_instead_of_processes, create_task_fixture
     ):
@@ -349,6 +357,9 @@ class TestSnowfakery:
             assert call.task_config.config["options"]["drop_missing_schema"] is True
 
     @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    @mock.patch(
+        "cumulusci.tasks.bulkdata.snowfakery_utils.queue_manager.JOBS_PER_WORKER", 1
+    )
     def test_multi_part(
         self, threads_instead_of_processes, mock_load_data, create_task_fixture
     ):
@@ -366,6 +377,30 @@ class TestSnowfakery:
         )
         for call in mock_load_data.mock_calls:
             assert call.task_config.config["options"]["drop_missing_schema"] is False
+        # Loads after the first one run in the channel's loader threads,
+        # which share their setup
+        shared_states = {
+            getattr(call, "shared_state_id", None)
+            for call in mock_load_data.mock_calls[1:]
+        }
+        assert len(shared_states) == 1 and None not in shared_states
+
+    @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    def test_multi_part__pooled_workers(
+        self, threads_instead_of_processes, mock_load_data, create_task_fixture
+    ):
+        task = create_task_fixture(
+            Snowfakery,
+            {
+                "recipe": sample_yaml,
+                "run_until_recipe_repeated": 15,
+                "num_processes": 1,
+            },
+        )
+        task()
+        assert len(mock_load_data.mock_calls) > 3
+        # a single generator process ran every portion after the first
+        assert len(threads_instead_of_processes.mock_calls) == 1
 
     @mock.patch(
         "cumulusci.utils.parallel.task_worker_queues.parallel_worker_queue.WorkerQueue.Process",
@@ -576,6 +611,50 @@ class TestSnowfakery:
                 task()
         assert "XYZZY" in str(logger.mock_calls)
 
+    def test_update_running_totals__progress(self, create_task):
+        task = create_task(Snowfakery, {"recipe": sample_yaml})
+        step = {
+            "sobject": "Account",
+            "record_type": None,
+            "status": "Success",
+            "job_errors": [],
+            "records_processed": 5,
+            "total_row_errors": 1,
+        }
+        reports = [
+            {
+                "status": "progress",
+                "results": {"step_results": {"Insert Account": step}},
+                "directory": "1_5",
+            },
+            {
+                "status": "success",
+                "results": {
+                    "step_results": {
+                        "Insert Account": step,
+                        "Insert Contact": {**step, "sobject": "Contact"},
+                    }
+                },
+                "directory": "1_5",
+            },
+        ]
+        task.sobject_counts = defaultdict(RunningTotals)
+        task.reported_steps = defaultdict(set)
+        task.queue_manager = mock.Mock()
+        task.queue_manager.get_results_report.side_effect = reports + [Empty()]
+
+        task.update_running_totals(timeout=1)
+
+        # the final report doesn't count the step that was already reported
+        assert task.sobject_counts["Account"].successes == 4
+        assert task.sobject_counts["Account"].errors == 1
+        assert task.sobject_counts["Contact"].successes == 4
+        assert not task.reported_steps
+        # only the first read waits for a report
+        assert [c.kwargs for c in task.queue_manager.get_results_report.mock_calls] == [
+            {"block": True, "timeout": 1}
+        ] + [{"block": False, "timeout": None}] * 2
+
     def test_running_totals_repr(self):
         r = RunningTotals()
         r.errors = 12
@@ -1145,3 +1224,109 @@ class TestSnowfakery:
     #         self._run_snowfakery_and_inspect_mapping(
     #             generator_yaml=simple_snowfakery_yaml, loading_rules=str(loading_rules)
     #         )
+
+
+def upload_status(**kwargs):
+    values = {
+        "batch_size": 100,
+        "sets_being_generated": 0,
+        "sets_queued_to_be_generated": 0,
+        "sets_being_loaded": 0,
+        "sets_queued_for_loading": 0,
+        "sets_finished": 0,
+        "target_count": 10_000,
+        "max_num_loader_workers": 4,
+        "max_num_generator_workers": 1,
+        "elapsed_seconds": 100,
+        "sets_failed": 0,
+        "inprogress_generator_jobs": 0,
+        "inprogress_loader_jobs": 0,
+        "data_gen_free_workers": 1,
+        "channels": 1,
+    }
+    values.update(kwargs)
+    return UploadStatus(**values)
+
+
+class TestPortionGenerator:
+    def test_next_batch__fixed_growth(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        assert portions.next_batch(0) == 100
+        assert portions.next_batch(100) == 110
+
+    def test_next_batch__never_exceeds_gap(self):
+        portions = PortionGenerator(150, 100, 1_000)
+        assert portions.next_batch(0) == 100
+        assert portions.next_batch(100) == 50
+
+    def test_next_batch__loaders_idle(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        portions.next_batch(0, upload_status(inprogress_loader_jobs=1))
+        assert portions.next_batch_size == 150
+
+    def test_next_batch__loaders_busy(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        portions.next_batch(0, upload_status(inprogress_loader_jobs=4))
+        assert portions.next_batch_size == 110
+
+    def test_next_batch__org_falls_behind(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        # 1000 sets generated, 100 loaded in 100 seconds
+        status = upload_status(
+            sets_queued_for_loading=800,
+            sets_being_loaded=100,
+            sets_finished=100,
+            inprogress_loader_jobs=4,
+        )
+        portions.next_batch(0, status)
+        assert portions.next_batch_size == 100
+
+    def test_next_batch__org_keeps_up(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        status = upload_status(
+            sets_queued_for_loading=50,
+            sets_being_loaded=400,
+            sets_finished=1_000,
+            inprogress_loader_jobs=4,
+        )
+        portions.next_batch(0, status)
+        assert portions.next_batch_size == 110
+
+    def test_next_batch__warming_up(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        portions.next_batch(0, upload_status(elapsed_seconds=5))
+        assert portions.next_batch_size == 110
+
+    def test_next_batch__nothing_loaded_yet(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        portions.next_batch(0, upload_status(sets_queued_for_loading=100))
+        assert portions.next_batch_size == 100
+
+    def test_next_batch__row_error_rate_rises(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        portions.next_batch(0, upload_status(rows_loaded=990, row_errors=10))
+        assert portions.next_batch_size == 150
+        # 100 of the next 1000 rows failed
+        portions.next_batch(100, upload_status(rows_loaded=1_890, row_errors=110))
+        assert portions.next_batch_size == 100
+
+    def test_next_batch__row_error_rate_steady(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        portions.next_batch(0, upload_status(rows_loaded=900, row_errors=100))
+        assert portions.next_batch_size == 100
+        portions.next_batch(100, upload_status(rows_loaded=1_800, row_errors=200))
+        assert portions.next_batch_size == 150
+
+    def test_next_batch__failures_shrink_portions(self):
+        portions = PortionGenerator(10_000, 100, 1_000)
+        portions.next_batch_size = 800
+        portions.next_batch(0, upload_status(sets_failed=1))
+        assert portions.next_batch_size == 400
+        # the same failure isn't counted twice
+        portions.next_batch(0, upload_status(sets_failed=1, inprogress_loader_jobs=4))
+        assert portions.next_batch_size == 440
+
+    def test_next_batch__capped(self):
+        portions = PortionGenerator(10_000, 100, 120)
+        portions.next_batch(0, upload_status())
+        assert portions.next_batch_size == 120
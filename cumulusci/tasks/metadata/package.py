@@ -1,10 +1,14 @@
+import hashlib
 import os
+import pickle
 import re
 import urllib.parse
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 import yaml
 
+import cumulusci
 from cumulusci.core.tasks import BaseTask
 from cumulusci.utils import elementtree_parse_file
 
@@ -41,6 +45,61 @@ class MetadataParserMissingError(Exception):
     pass
 
 
+class PackageXmlCache(object):
+    """Members parsed from the metadata files of one source directory.
+
+    Only parsers which read the contents of files use the cache. A file is
+    parsed again when its size or modification time has changed."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = {}
+        self._used = {}
+        try:
+            with self.path.open("rb") as f:
+                version, entries = pickle.load(f)
+            if version == cumulusci.__version__:
+                self.entries = entries
+        except Exception:
+            # Missing or unreadable, e.g. written by another Python version
+            pass
+
+    @classmethod
+    def for_directory(cls, cache_dir, directory):
+        digest = hashlib.sha256(os.path.abspath(directory).encode()).hexdigest()
+        return cls(Path(cache_dir, "package_xml", digest + ".pickle"))
+
+    def get_members(self, parser, item):
+        path = os.path.abspath(os.path.join(parser.directory, item))
+        stat = os.stat(path)
+        key = (parser.cache_key, path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self.entries.get(key)
+        if entry and entry[0] == signature:
+            members = entry[1]
+        else:
+            members = parser._parse_item(item)
+        self._used[key] = (signature, members)
+        return list(members)
+
+    def save(self):
+        """Write the entries used since loading, dropping files that are gone."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "wb", dir=self.path.parent, suffix=".tmp", delete=False
+            ) as f:
+                pickle.dump(
+                    (cumulusci.__version__, self._used),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(f.name, self.path)
+        except OSError:
+            pass
+
+
 class PackageXmlGenerator(object):
     def __init__(
         self,
@@ -52,6 +111,7 @@ class PackageXmlGenerator(object):
         install_class=None,
         uninstall_class=None,
         types=None,
+        cache=None,
     ):
         with open(
             __location__ + "/metadata_map.yml", "r", encoding="utf-8"
@@ -65,11 +125,15 @@ class PackageXmlGenerator(object):
         self.install_class = install_class
         self.uninstall_class = uninstall_class
         self.types = types or []
+        self.cache = cache
 
     def __call__(self):
         if not self.types:
             self.parse_types()
-        return self.render_xml()
+        package_xml = self.render_xml()
+        if self.cache:
+            self.cache.save()
+        return package_xml
 
     def parse_types(self):
         for item in sorted(os.listdir(self.directory)):
@@ -94,6 +158,7 @@ class PackageXmlGenerator(object):
                     self.delete,  # Parse for deletion?
                     **options  # Extra kwargs
                 )
+                parser.cache = self.cache
                 self.types.append(parser)
 
     def render_xml(self):
@@ -133,12 +198,16 @@ class PackageXmlGenerator(object):
 
 
 class BaseMetadataParser(object):
+    # Identifies the parsing rules for a PackageXmlCache; None if not cached
+    cache_key = None
+
     def __init__(self, metadata_type, directory, extension, delete):
         self.metadata_type = metadata_type
         self.directory = directory
         self.extension = extension
         self.delete = delete
         self.members = []
+        self.cache = None
 
         if self.delete:
             self.delete_excludes = self.get_delete_excludes()
@@ -187,7 +256,10 @@ class BaseMetadataParser(object):
         return False
 
     def parse_item(self, item):
-        members = self._parse_item(item)
+        if self.cache and self.cache_key:
+            members = self.cache.get_members(self, item)
+        else:
+            members = self._parse_item(item)
         if members:
             for member in members:
                 # Translate filename namespace tokens into in-file namespace tokens
@@ -281,6 +353,15 @@ class MetadataXmlElementParser(BaseMetadataParser):
             name_xpath = "./sf:fullName"
         self.name_xpath = name_xpath
 
+    @property
+    def cache_key(self):
+        return (
+            type(self).__name__,
+            self.metadata_type,
+            self.item_xpath,
+            self.name_xpath,
+        )
+
     def _parse_item(self, item):
         root = elementtree_parse_file(self.directory + "/" + item)
         members = []
@@ -424,6 +505,13 @@ class UpdatePackageXml(BaseTask):
             if not package_name:
                 package_name = self.project_config.project__package__name
 
+        # Reuse members parsed by earlier runs for files which haven't changed
+        cache = None
+        if self.project_config.repo_root:
+            cache = PackageXmlCache.for_directory(
+                self.project_config.cache_dir, self.options["path"]
+            )
+
         self.package_xml = PackageXmlGenerator(
             directory=self.options.get("path"),
             api_version=self.project_config.project__package__api_version,
@@ -432,6 +520,7 @@ class UpdatePackageXml(BaseTask):
             delete=self.options.get("delete", False),
             install_class=self.project_config.project__package__install_class,
             uninstall_class=self.project_config.project__package__uninstall_class,
+            cache=cache,
         )
 
     def _run_task(self):
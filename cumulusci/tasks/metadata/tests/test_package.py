@@ -22,6 +22,7 @@ from cumulusci.tasks.metadata.package import (
     MetadataParserMissingError,
     MetadataXmlElementParser,
     MissingNameElementError,
+    PackageXmlCache,
     PackageXmlGenerator,
     ParserConfigurationError,
     RecordTypeParser,
@@ -339,8 +340,81 @@ class TestDocumentParser:
         assert ["folder/doc"] == parser._parse_subitem("folder", "doc")
 
 
+class TestPackageXmlCache:
+    def write_labels(self, path, *names):
+        labels = "".join(
+            f"<labels><fullName>{name}</fullName></labels>" for name in names
+        )
+        (path / "labels").mkdir(exist_ok=True)
+        (path / "labels" / "custom.labels").write_text(
+            f'<CustomLabels xmlns="http://soap.sforce.com/2006/04/metadata">{labels}'
+            "</CustomLabels>"
+        )
+
+    def generate(self, path, cache_path):
+        cache = PackageXmlCache(cache_path)
+        return PackageXmlGenerator(str(path / "src"), "50.0", cache=cache)()
+
+    def test_get_members(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        self.write_labels(src, "Label1", "Label2")
+        (src / "classes").mkdir()
+        (src / "classes" / "Test.cls").write_text("")
+        cache_path = tmp_path / "cache.pickle"
+
+        with mock.patch.object(
+            CustomLabelsParser,
+            "_parse_item",
+            autospec=True,
+            side_effect=CustomLabelsParser._parse_item,
+        ) as parse_item:
+            package_xml = self.generate(tmp_path, cache_path)
+            assert self.generate(tmp_path, cache_path) == package_xml
+            assert len(parse_item.mock_calls) == 1
+
+            self.write_labels(src, "Label1", "Label2", "Label3")
+            package_xml = self.generate(tmp_path, cache_path)
+            assert len(parse_item.mock_calls) == 2
+
+        assert "<members>Label3</members>" in package_xml
+        assert "<members>Test</members>" in package_xml
+        assert package_xml == PackageXmlGenerator(str(src), "50.0")()
+
+    def test_save__drops_missing_files(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        self.write_labels(src, "Label1")
+        cache_path = tmp_path / "cache.pickle"
+        self.generate(tmp_path, cache_path)
+        assert len(PackageXmlCache(cache_path).entries) == 1
+
+        (src / "labels" / "custom.labels").unlink()
+        self.generate(tmp_path, cache_path)
+        assert PackageXmlCache(cache_path).entries == {}
+
+    def test_load__unreadable(self, tmp_path):
+        cache_path = tmp_path / "cache.pickle"
+        cache_path.write_bytes(b"garbage")
+        assert PackageXmlCache(cache_path).entries == {}
+
+    def test_load__other_version(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        self.write_labels(src, "Label1")
+        cache_path = tmp_path / "cache.pickle"
+        self.generate(tmp_path, cache_path)
+        with mock.patch("cumulusci.__version__", "0.0.0"):
+            assert PackageXmlCache(cache_path).entries == {}
+
+    def test_for_directory(self, tmp_path):
+        cache = PackageXmlCache.for_directory(tmp_path, "src")
+        assert cache.path.parent == tmp_path / "package_xml"
+        assert cache.path != PackageXmlCache.for_directory(tmp_path, "force-app").path
+
+
 class TestUpdatePackageXml:
-    def test_run_task(self):
+    def test_run_task(self, tmp_path):
         src_path = os.path.join(
             __location__, "package_metadata", "namespaced_report_folder"
         )
@@ -355,6 +429,8 @@ class TestUpdatePackageXml:
                         "package": {"name": "Test Package", "api_version": "36.0"}
                     }
                 },
+                cache_dir=tmp_path,
+                repo_info={"root": path},
             )
             task_config = TaskConfig(
                 {"options": {"path": src_path, "output": output_path, "managed": True}}
@@ -365,3 +441,4 @@ class TestUpdatePackageXml:
             with open(output_path, "r") as f:
                 result = f.read()
             assert expected == result
+            assert list((tmp_path / "package_xml").glob("*.pickle"))
@@ -2,6 +2,7 @@ from cumulusci.tasks.metadata_etl.base import (
     BaseMetadataETLTask,
     BaseMetadataSynthesisTask,
     BaseMetadataTransformTask,
+    MetadataETLBatch,
     MetadataSingleEntityTransformTask,
     MetadataOperation,
     UpdateMetadataFirstChildTextTask,
@@ -17,6 +18,7 @@ flake8 = (
     BaseMetadataETLTask,
     BaseMetadataSynthesisTask,
     BaseMetadataTransformTask,
+    MetadataETLBatch,
     MetadataSingleEntityTransformTask,
     AddRelatedLists,
     AddPermissionSetPermissions,
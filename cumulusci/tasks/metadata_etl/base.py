@@ -1,6 +1,8 @@
 import enum
+import shutil
 import tempfile
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict
 from pathlib import Path
 from urllib.parse import quote, unquote
 
@@ -20,6 +22,149 @@ class MetadataOperation(enum.Enum):
     RETRIEVE = "retrieve"
 
 
+class MetadataETLBatch:
+    """Runs consecutive metadata ETL tasks with one retrieve and one deploy.
+
+    Flows with `batch_metadata_etl: True` add the tasks of consecutive steps
+    to a batch. The metadata of all of them is retrieved when the first one
+    runs, each task transforms the metadata as the tasks before it left it,
+    and their changes are deployed together when the flow calls finish()
+    after the last of them. If a task fails, the flow calls finish() right
+    away, so the changes of the tasks before it are deployed as they would
+    have been without the batch, and the tasks after it start over."""
+
+    def __init__(self):
+        self.tasks = []
+        self._tempdir = None
+        self._pending = []
+        self._package_xmls = []
+
+    @staticmethod
+    def can_batch(task) -> bool:
+        """Tasks that retrieve, transform and deploy in the standard way.
+
+        Tasks using a wildcard are left out, as they would also transform
+        the components retrieved for the other tasks of the batch."""
+        cls = type(task)
+        return (
+            isinstance(task, BaseMetadataTransformTask)
+            and task.retrieve
+            and task.deploy
+            and cls._run_task is BaseMetadataETLTask._run_task
+            and cls._retrieve is BaseMetadataETLTask._retrieve
+            and cls._deploy is BaseMetadataETLTask._deploy
+            and not any("*" in names for names in task._get_entities().values())
+        )
+
+    @staticmethod
+    def _deploy_settings(task) -> tuple:
+        return (
+            task.api_version,
+            task.options.get("namespace_inject"),
+            task.options.get("managed"),
+            task.options.get("namespaced_org"),
+        )
+
+    def add(self, task) -> bool:
+        """Add a task, if it can share the retrieve and deploy of the others."""
+        if not self.can_batch(task) or (
+            self.tasks
+            and self._deploy_settings(task) != self._deploy_settings(self.tasks[0])
+        ):
+            return False
+        self.tasks.append(task)
+        return True
+
+    def start(self):
+        for task in self.tasks:
+            task.batch = self
+
+    def run(self, task):
+        """Run a task of the batch (called from its _run_task())"""
+        if self._tempdir is None:
+            self._retrieve(task)
+        task.retrieve_dir = self.retrieve_dir
+        task.deploy_dir = Path(self._tempdir.name, f"deploy_{len(self._pending)}")
+        task.deploy_dir.mkdir()
+        task._transform()
+        self._add_changes(task)
+
+    def finish(self):
+        """Deploy the changes of the tasks that have run"""
+        try:
+            if self._pending:
+                task = self._pending[-1]
+                task.logger.info(
+                    f"Loading transformed metadata of {len(self._pending)} tasks..."
+                )
+                Path(self.deploy_dir, "package.xml").write_text(
+                    merge_package_xml(self._package_xmls, task.api_version),
+                    encoding="utf-8",
+                )
+                result = task._deploy_path(self.deploy_dir)
+                for pending_task in self._pending:
+                    pending_task._post_deploy(result)
+        finally:
+            # Any tasks after this start over with a new retrieve
+            if self._tempdir is not None:
+                self._tempdir.cleanup()
+            self._tempdir = None
+            self._pending = []
+            self._package_xmls = []
+
+    def _retrieve(self, task):
+        tasks = self.tasks[self.tasks.index(task) :]
+        task.logger.info(f"Extracting existing metadata for {len(tasks)} tasks...")
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.retrieve_dir = Path(self._tempdir.name, "retrieve")
+        self.deploy_dir = Path(self._tempdir.name, "deploy")
+        self.deploy_dir.mkdir()
+        package_xml = merge_package_xml(
+            [t._generate_package_xml(MetadataOperation.RETRIEVE) for t in tasks],
+            task.api_version,
+        )
+        api_retrieve = ApiRetrieveUnpackaged(task, package_xml, task.api_version)
+        api_retrieve().extractall(self.retrieve_dir)
+
+    def _add_changes(self, task):
+        # Later tasks transform the metadata as this one left it
+        for path in task.deploy_dir.rglob("*"):
+            if path.is_file():
+                relative_path = path.relative_to(task.deploy_dir)
+                for directory in (self.retrieve_dir, self.deploy_dir):
+                    (directory / relative_path).parent.mkdir(
+                        parents=True, exist_ok=True
+                    )
+                    shutil.copyfile(path, directory / relative_path)
+        self._package_xmls.append(task._generate_package_xml(MetadataOperation.DEPLOY))
+        self._pending.append(task)
+
+
+def merge_package_xml(package_xmls, api_version) -> str:
+    """Combine the types listed in several package.xml files into one."""
+    members = defaultdict(set)
+    for package_xml in package_xmls:
+        package = metadata_tree.fromstring(package_xml.encode("utf-8"))
+        for types in package.findall("types"):
+            members[types.find("name").text].update(
+                member.text for member in types.findall("members")
+            )
+
+    types = ""
+    for name, api_names in members.items():
+        if not api_names:
+            continue
+        types += "    <types>\n"
+        for api_name in sorted(api_names):
+            types += f"        <members>{api_name}</members>\n"
+        types += f"        <name>{name}</name>\n    </types>\n"
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<Package xmlns="http://soap.sforce.com/2006/04/metadata">
+{types}    <version>{api_version}</version>
+</Package>
+"""
+
+
 class BaseMetadataETLTask(BaseSalesforceTask, metaclass=ABCMeta):
     """Abstract base class for all Metadata ETL tasks. Concrete tasks should
     generally subclass BaseMetadataSynthesisTask, BaseMetadataTransformTask,
@@ -27,6 +172,9 @@ class BaseMetadataETLTask(BaseSalesforceTask, metaclass=ABCMeta):
 
     deploy = False
     retrieve = False
+    # Used by flows to share one retrieve and deploy between steps
+    batch_class = MetadataETLBatch
+    batch = None
 
     task_options = {
         "managed": {
@@ -136,7 +284,9 @@ class BaseMetadataETLTask(BaseSalesforceTask, metaclass=ABCMeta):
         target_profile_xml.write_text(
             self._generate_package_xml(MetadataOperation.DEPLOY), encoding="utf-8"
         )
+        return self._deploy_path(self.deploy_dir)
 
+    def _deploy_path(self, path):
         # import is here to avoid an import cycle
         from cumulusci.tasks.salesforce import Deploy
 
@@ -145,7 +295,7 @@ class BaseMetadataETLTask(BaseSalesforceTask, metaclass=ABCMeta):
             TaskConfig(
                 {
                     "options": {
-                        "path": self.deploy_dir,
+                        "path": path,
                         "namespace_inject": self.options.get("namespace_inject"),
                         "unmanaged": not self.options["managed"],
                         "namespaced_org": self.options["namespaced_org"],
@@ -164,6 +314,8 @@ class BaseMetadataETLTask(BaseSalesforceTask, metaclass=ABCMeta):
         pass
 
     def _run_task(self):
+        if self.batch is not None:
+            return self.batch.run(self)
         with tempfile.TemporaryDirectory() as tempdir:
             self._create_directories(tempdir)
             if self.retrieve:
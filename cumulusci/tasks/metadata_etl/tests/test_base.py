@@ -10,9 +10,11 @@ from cumulusci.tasks.metadata_etl import (
     BaseMetadataETLTask,
     BaseMetadataSynthesisTask,
     BaseMetadataTransformTask,
+    MetadataETLBatch,
     MetadataSingleEntityTransformTask,
     UpdateMetadataFirstChildTextTask,
 )
+from cumulusci.tasks.metadata_etl.base import merge_package_xml
 from cumulusci.tasks.salesforce.tests.util import create_task
 from cumulusci.utils.xml.metadata_tree import fromstring
 
@@ -387,6 +389,134 @@ class TestMetadataSingleEntityTransformTask:
                 task._transform()
 
 
+class AddApplicationLabel(MetadataSingleEntityTransformTask):
+    entity = "CustomApplication"
+    post_deploy_results = None
+
+    def _transform_entity(self, metadata, api_name):
+        if self.options.get("fail"):
+            raise CumulusCIException("Failed")
+        metadata.append("label", self.options["label"])
+        return metadata
+
+    def _post_deploy(self, result):
+        self.post_deploy_results = result
+
+
+APPLICATION_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<CustomApplication xmlns="http://soap.sforce.com/2006/04/metadata">
+</CustomApplication>"""
+
+
+class TestMetadataETLBatch:
+    def _task(self, **options):
+        return create_task(
+            AddApplicationLabel,
+            {"managed": False, "api_version": "47.0", "api_names": "Test", **options},
+        )
+
+    def _run(self, batch):
+        def extractall(path):
+            (path / "applications").mkdir(parents=True)
+            (path / "applications" / "Test.app").write_text(APPLICATION_XML)
+
+        deployed = []
+
+        def deploy(path):
+            deployed.append(
+                {
+                    str(p.relative_to(path)): p.read_text()
+                    for p in path.rglob("*")
+                    if p.is_file()
+                }
+            )
+            return "Success"
+
+        with mock.patch(
+            "cumulusci.tasks.metadata_etl.base.ApiRetrieveUnpackaged"
+        ) as api_retrieve, mock.patch.object(
+            AddApplicationLabel, "_deploy_path", side_effect=deploy
+        ):
+            api_retrieve.return_value.return_value.extractall.side_effect = extractall
+            # as the flow runs them
+            for task in batch.tasks:
+                try:
+                    task._run_task()
+                except CumulusCIException:
+                    batch.finish()
+            batch.finish()
+        return api_retrieve, deployed
+
+    def test_run(self):
+        tasks = [self._task(label="One"), self._task(label="Two")]
+        batch = MetadataETLBatch()
+        assert all(batch.add(task) for task in tasks)
+        batch.start()
+
+        api_retrieve, deployed = self._run(batch)
+
+        api_retrieve.assert_called_once()
+        assert len(deployed) == 1
+        app = deployed[0]["applications/Test.app"]
+        assert "<label>One</label>" in app and "<label>Two</label>" in app
+        assert "<members>Test</members>" in deployed[0]["package.xml"]
+        assert [task.post_deploy_results for task in tasks] == ["Success"] * 2
+
+    def test_run__failure(self):
+        tasks = [
+            self._task(label="One"),
+            self._task(label="Two", fail=True),
+            self._task(label="Three"),
+        ]
+        batch = MetadataETLBatch()
+        assert all(batch.add(task) for task in tasks)
+        batch.start()
+
+        api_retrieve, deployed = self._run(batch)
+
+        # The first task's changes are deployed when the second one fails,
+        # and the third one starts over.
+        assert api_retrieve.call_count == 2
+        assert len(deployed) == 2
+        assert "<label>One</label>" in deployed[0]["applications/Test.app"]
+        assert "<label>Three</label>" in deployed[1]["applications/Test.app"]
+        assert "<label>One</label>" not in deployed[1]["applications/Test.app"]
+
+    def test_add(self):
+        batch = MetadataETLBatch()
+        assert batch.add(self._task())
+        assert not batch.add(self._task(api_version="48.0"))
+        assert not batch.add(self._task(managed=True))
+        assert not batch.add(create_task(MetadataSynthesisTask, {"managed": False}))
+        assert not batch.add(self._task(api_names="Other,*"))
+
+    def test_merge_package_xml(self):
+        first = """<?xml version="1.0" encoding="UTF-8"?>
+<Package xmlns="http://soap.sforce.com/2006/04/metadata">
+    <types>
+        <members>Test</members>
+        <name>CustomApplication</name>
+    </types>
+    <version>47.0</version>
+</Package>"""
+        second = first.replace("Test", "Other").replace(
+            "<version>", "<types><name>Layout</name></types><version>"
+        )
+        assert (
+            merge_package_xml([first, second], "47.0")
+            == """<?xml version="1.0" encoding="UTF-8"?>
+<Package xmlns="http://soap.sforce.com/2006/04/metadata">
+    <types>
+        <members>Other</members>
+        <members>Test</members>
+        <name>CustomApplication</name>
+    </types>
+    <version>47.0</version>
+</Package>
+"""
+        )
+
+
 class TestUpdateMetadataFirstChildTextTask:
     def test_init_options__namespace_injected_in_value(self):
         options = {
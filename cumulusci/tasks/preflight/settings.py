@@ -2,6 +2,7 @@ from simple_salesforce.exceptions import SalesforceMalformedRequest
 
 from cumulusci.core.tasks import BaseSalesforceTask
 from cumulusci.core.utils import process_bool_arg
+from cumulusci.tasks.preflight.snapshot import get_preflight_snapshot
 from cumulusci.tasks.salesforce.BaseSalesforceApiTask import BaseSalesforceApiTask
 
 
@@ -38,7 +39,9 @@ class CheckSettingsValue(BaseSalesforceApiTask):
         field = self.options["settings_field"]
         entity = self.options["settings_type"]
         try:
-            results = self.tooling.query(f"SELECT {field} FROM {entity}")["records"]
+            results = get_preflight_snapshot(self).tooling_query(
+                self.tooling, f"SELECT {field} FROM {entity}"
+            )
         except SalesforceMalformedRequest as e:
             self.logger.error(
                 f"The settings value {entity}.{field} could not be queried: {e}"
@@ -0,0 +1,129 @@
+import threading
+from urllib.parse import quote_plus
+
+from cumulusci.core.exceptions import CumulusCIException
+
+_snapshots_lock = threading.Lock()
+
+
+class PreflightSnapshot:
+    """Org data read by preflight checks, fetched in a single batch request.
+
+    The licenses, permission sets, permission set assignments and global
+    describe of an org are requested together with the Composite Batch API
+    the first time any preflight check needs one of them. Tooling API queries
+    for Settings values can't be known in advance, so they are run on demand
+    and remembered for the lifetime of the snapshot.
+    """
+
+    def __init__(self, sf, user_id: str):
+        self.sf = sf
+        self.user_id = user_id
+        self._lock = threading.Lock()
+        self._results = None
+        self._errors = {}
+        self._tooling_results = {}
+
+    def _fetch(self):
+        requests = {
+            "licenses": _query_url("SELECT LicenseDefinitionKey FROM UserLicense"),
+            "permission_set_licenses": _query_url(
+                "SELECT PermissionSetLicenseKey FROM PermissionSetLicense"
+            ),
+            "permission_sets": _query_url("SELECT Name FROM PermissionSet"),
+            "permission_set_assignments": _query_url(
+                "SELECT PermissionSet.Name FROM PermissionSetAssignment "
+                f"WHERE AssigneeId = '{self.user_id}'"
+            ),
+            "describe": "sobjects",
+        }
+        response = self.sf.restful(
+            "composite/batch",
+            method="POST",
+            json={
+                "haltOnError": False,
+                "batchRequests": [
+                    {"method": "GET", "url": f"v{self.sf.sf_version}/{url}"}
+                    for url in requests.values()
+                ],
+            },
+        )
+        results = {}
+        for name, result in zip(requests, response["results"]):
+            if result["statusCode"] >= 400:
+                self._errors[name] = result["result"]
+            else:
+                results[name] = result["result"]
+        self._results = results
+
+    def _get(self, name: str):
+        with self._lock:
+            if self._results is None:
+                self._fetch()
+        if name in self._errors:
+            raise CumulusCIException(
+                f"Could not retrieve {name.replace('_', ' ')}: {self._errors[name]}"
+            )
+        return self._results[name]
+
+    def _records(self, name: str) -> list:
+        result = self._get(name)
+        records = list(result["records"])
+        while not result["done"]:
+            result = self.sf.query_more(
+                result["nextRecordsUrl"], identifier_is_url=True
+            )
+            records.extend(result["records"])
+        return records
+
+    @property
+    def licenses(self) -> list:
+        return [r["LicenseDefinitionKey"] for r in self._records("licenses")]
+
+    @property
+    def permission_set_licenses(self) -> list:
+        return [
+            r["PermissionSetLicenseKey"]
+            for r in self._records("permission_set_licenses")
+        ]
+
+    @property
+    def permission_sets(self) -> list:
+        return [r["Name"] for r in self._records("permission_sets")]
+
+    @property
+    def permission_set_assignments(self) -> list:
+        return [
+            r["PermissionSet"]["Name"]
+            for r in self._records("permission_set_assignments")
+        ]
+
+    @property
+    def describe(self) -> dict:
+        return self._get("describe")
+
+    def tooling_query(self, tooling, query: str) -> list:
+        """Run a Tooling API query, or return its records from an earlier run."""
+        if query not in self._tooling_results:
+            self._tooling_results[query] = tooling.query(query)["records"]
+        return self._tooling_results[query]
+
+
+def _query_url(query: str) -> str:
+    return f"query?q={quote_plus(query)}"
+
+
+def get_preflight_snapshot(task) -> PreflightSnapshot:
+    """Return the preflight snapshot for a task's org, user and API version.
+
+    Tasks run by the same flow share snapshots. A task run on its own
+    gets a new one."""
+    if task.flow is None:
+        return PreflightSnapshot(task.sf, task.org_config.user_id)
+    org_config = task.org_config
+    key = (org_config.org_id, org_config.username, task.sf.sf_version)
+    with _snapshots_lock:
+        snapshots = task.flow.preflight_snapshots
+        if key not in snapshots:
+            snapshots[key] = PreflightSnapshot(task.sf, org_config.user_id)
+        return snapshots[key]
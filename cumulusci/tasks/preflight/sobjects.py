@@ -2,6 +2,7 @@ from simple_salesforce.exceptions import SalesforceMalformedRequest
 
 from cumulusci.core.exceptions import TaskOptionsError
 from cumulusci.core.utils import process_bool_arg
+from cumulusci.tasks.preflight.snapshot import get_preflight_snapshot
 from cumulusci.tasks.salesforce import BaseSalesforceApiTask
 
 
@@ -20,7 +21,9 @@ class CheckSObjectsAvailable(BaseSalesforceApiTask):
     api_version = "48.0"
 
     def _run_task(self):
-        self.return_values = {entry["name"] for entry in self.sf.describe()["sobjects"]}
+        self.return_values = {
+            entry["name"] for entry in get_preflight_snapshot(self).describe["sobjects"]
+        }
 
         self.logger.info(
             "Completed sObjects preflight check with result {}".format(
@@ -79,7 +82,9 @@ class CheckSObjectPerms(BaseSalesforceApiTask):
             }
 
     def _run_task(self):
-        describe = {s["name"]: s for s in self.sf.describe()["sobjects"]}
+        describe = {
+            s["name"]: s for s in get_preflight_snapshot(self).describe["sobjects"]
+        }
 
         success = True
 
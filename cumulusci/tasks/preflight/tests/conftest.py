@@ -0,0 +1,24 @@
+import pytest
+
+
+@pytest.fixture
+def batch_response():
+    """Build a Composite Batch API response for a PreflightSnapshot"""
+
+    def batch_response(**results):
+        defaults = {
+            "licenses": {"done": True, "records": []},
+            "permission_set_licenses": {"done": True, "records": []},
+            "permission_sets": {"done": True, "records": []},
+            "permission_set_assignments": {"done": True, "records": []},
+            "describe": {"sobjects": []},
+        }
+        defaults.update(results)
+        return {
+            "hasErrors": False,
+            "results": [
+                {"statusCode": 200, "result": result} for result in defaults.values()
+            ],
+        }
+
+    return batch_response
@@ -8,56 +8,80 @@ from cumulusci.tasks.preflight.licenses import (
 from cumulusci.tasks.salesforce.tests.util import create_task
 
 
+def _batch_urls(sf):
+    return [r["url"] for r in sf.restful.call_args[1]["json"]["batchRequests"]]
+
+
 class TestLicensePreflights:
-    def test_license_preflight(self):
+    def test_license_preflight(self, batch_response):
         task = create_task(GetAvailableLicenses, {})
         task._init_api = Mock()
-        task._init_api.return_value.query.return_value = {
-            "totalSize": 2,
-            "records": [
-                {"LicenseDefinitionKey": "TEST1"},
-                {"LicenseDefinitionKey": "TEST2"},
-            ],
-        }
+        task._init_api.return_value.sf_version = "52.0"
+        task._init_api.return_value.restful.return_value = batch_response(
+            licenses={
+                "totalSize": 2,
+                "done": True,
+                "records": [
+                    {"LicenseDefinitionKey": "TEST1"},
+                    {"LicenseDefinitionKey": "TEST2"},
+                ],
+            }
+        )
         task()
 
-        task._init_api.return_value.query.assert_called_once_with(
-            "SELECT LicenseDefinitionKey FROM UserLicense"
+        assert (
+            "v52.0/query?q=SELECT+LicenseDefinitionKey+FROM+UserLicense"
+            in _batch_urls(task._init_api.return_value)
         )
         assert task.return_values == ["TEST1", "TEST2"]
 
-    def test_psl_preflight(self):
+    def test_psl_preflight(self, batch_response):
         task = create_task(GetAvailablePermissionSetLicenses, {})
         task._init_api = Mock()
-
-        task._init_api.return_value.query.return_value = {
-            "totalSize": 2,
-            "records": [
-                {"PermissionSetLicenseKey": "TEST1"},
-                {"PermissionSetLicenseKey": "TEST2"},
-            ],
-        }
+        task._init_api.return_value.sf_version = "52.0"
+        task._init_api.return_value.restful.return_value = batch_response(
+            permission_set_licenses={
+                "totalSize": 2,
+                "done": True,
+                "records": [
+                    {"PermissionSetLicenseKey": "TEST1"},
+                    {"PermissionSetLicenseKey": "TEST2"},
+                ],
+            }
+        )
         task()
 
-        task._init_api.return_value.query.assert_called_once_with(
-            "SELECT PermissionSetLicenseKey FROM PermissionSetLicense"
+        assert (
+            "v52.0/query?q=SELECT+PermissionSetLicenseKey+FROM+PermissionSetLicense"
+            in _batch_urls(task._init_api.return_value)
         )
         assert task.return_values == ["TEST1", "TEST2"]
 
-    def test_permsets_preflight(self):
+    def test_permsets_preflight(self, batch_response):
         task = create_task(GetAvailablePermissionSets, {})
         task._init_api = Mock()
-
-        task._init_api.return_value.query_all.return_value = {
-            "totalSize": 2,
-            "records": [
-                {"Name": "TEST1"},
-                {"Name": "TEST2"},
-            ],
+        task._init_api.return_value.sf_version = "52.0"
+        task._init_api.return_value.restful.return_value = batch_response(
+            permission_sets={
+                "totalSize": 3,
+                "done": False,
+                "nextRecordsUrl": "/services/data/v52.0/query/01g-2000",
+                "records": [
+                    {"Name": "TEST1"},
+                    {"Name": "TEST2"},
+                ],
+            }
+        )
+        task._init_api.return_value.query_more.return_value = {
+            "done": True,
+            "records": [{"Name": "TEST3"}],
         }
         task()
 
-        task._init_api.return_value.query_all.assert_called_once_with(
-            "SELECT Name FROM PermissionSet"
+        assert "v52.0/query?q=SELECT+Name+FROM+PermissionSet" in _batch_urls(
+            task._init_api.return_value
         )
-        assert task.return_values == ["TEST1", "TEST2"]
+        task._init_api.return_value.query_more.assert_called_once_with(
+            "/services/data/v52.0/query/01g-2000", identifier_is_url=True
+        )
+        assert task.return_values == ["TEST1", "TEST2", "TEST3"]
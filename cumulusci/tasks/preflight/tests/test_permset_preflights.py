@@ -5,32 +5,37 @@ from cumulusci.tasks.salesforce.tests.util import create_task
 
 
 class TestPermsetPreflights:
-    def test_assigned_permset_preflight(self):
+    def test_assigned_permset_preflight(self, batch_response):
         task = create_task(GetPermissionSetAssignments, {})
         task._init_api = Mock()
-        task._init_api.return_value.query_all.return_value = {
-            "totalSize": 2,
-            "done": True,
-            "records": [
-                {
-                    "PermissionSet": {
-                        "Label": "Document Checklist",
-                        "Name": "DocumentChecklist",
+        task._init_api.return_value.sf_version = "52.0"
+        task._init_api.return_value.restful.return_value = batch_response(
+            permission_set_assignments={
+                "totalSize": 2,
+                "done": True,
+                "records": [
+                    {
+                        "PermissionSet": {
+                            "Label": "Document Checklist",
+                            "Name": "DocumentChecklist",
+                        },
                     },
-                },
-                {
-                    "PermissionSet": {
-                        "Label": "Einstein Analytics Plus Admin",
-                        "Name": "EinsteinAnalyticsPlusAdmin",
+                    {
+                        "PermissionSet": {
+                            "Label": "Einstein Analytics Plus Admin",
+                            "Name": "EinsteinAnalyticsPlusAdmin",
+                        },
                     },
-                },
-            ],
-        }
+                ],
+            }
+        )
         task()
 
-        task._init_api.return_value.query_all.assert_called_once_with(
-            "SELECT PermissionSet.Name FROM PermissionSetAssignment WHERE AssigneeId = 'USER_ID'"
-        )
+        batch = task._init_api.return_value.restful.call_args[1]["json"]
+        assert (
+            "v52.0/query?q=SELECT+PermissionSet.Name+FROM+PermissionSetAssignment"
+            "+WHERE+AssigneeId+%3D+%27USER_ID%27"
+        ) in [r["url"] for r in batch["batchRequests"]]
         assert task.return_values == [
             "DocumentChecklist",
             "EinsteinAnalyticsPlusAdmin",
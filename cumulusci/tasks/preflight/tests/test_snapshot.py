@@ -0,0 +1,82 @@
+from unittest import mock
+
+import pytest
+
+from cumulusci.core.exceptions import CumulusCIException
+from cumulusci.tasks.preflight.snapshot import PreflightSnapshot, get_preflight_snapshot
+
+
+def _task(sf, flow, username="test@example.com"):
+    task = mock.Mock(sf=sf, flow=flow)
+    task.org_config.org_id = "00D000000000001"
+    task.org_config.username = username
+    task.org_config.user_id = "005000000000001"
+    return task
+
+
+class TestPreflightSnapshot:
+    def test_fetches_in_one_batch(self, batch_response):
+        sf = mock.Mock(sf_version="52.0")
+        sf.restful.return_value = batch_response(
+            licenses={"done": True, "records": [{"LicenseDefinitionKey": "SFDC"}]},
+            describe={"sobjects": [{"name": "Account"}]},
+        )
+        preflight = PreflightSnapshot(sf, "005000000000001")
+        sf.restful.assert_not_called()
+
+        assert preflight.licenses == ["SFDC"]
+        assert preflight.permission_sets == []
+        assert preflight.describe == {"sobjects": [{"name": "Account"}]}
+        sf.restful.assert_called_once()
+        requests = sf.restful.call_args[1]["json"]["batchRequests"]
+        assert len(requests) == 5
+        assert {"method": "GET", "url": "v52.0/sobjects"} in requests
+
+    def test_error(self, batch_response):
+        sf = mock.Mock(sf_version="52.0")
+        response = batch_response()
+        response["results"][0] = {
+            "statusCode": 400,
+            "result": [{"errorCode": "INVALID_TYPE"}],
+        }
+        sf.restful.return_value = response
+        preflight = PreflightSnapshot(sf, "005000000000001")
+
+        assert preflight.permission_sets == []
+        with pytest.raises(CumulusCIException, match="Could not retrieve licenses"):
+            preflight.licenses
+
+    def test_tooling_query(self):
+        tooling = mock.Mock()
+        tooling.query.return_value = {"records": [{"IsChatterEnabled": True}]}
+        preflight = PreflightSnapshot(mock.Mock(), "005000000000001")
+
+        query = "SELECT IsChatterEnabled FROM ChatterSettings"
+        assert preflight.tooling_query(tooling, query) == [{"IsChatterEnabled": True}]
+        assert preflight.tooling_query(tooling, query) == [{"IsChatterEnabled": True}]
+        tooling.query.assert_called_once_with(query)
+
+
+def test_get_preflight_snapshot(batch_response):
+    sf = mock.Mock(sf_version="52.0")
+    sf.restful.return_value = batch_response()
+    flow = mock.Mock(preflight_snapshots={})
+
+    preflight = get_preflight_snapshot(_task(sf, flow))
+    assert (
+        get_preflight_snapshot(_task(mock.Mock(sf_version="52.0"), flow)) is preflight
+    )
+    assert get_preflight_snapshot(_task(sf, flow, "other@example.com")) is not preflight
+    assert get_preflight_snapshot(_task(mock.Mock(sf_version="48.0"), flow)) is not (
+        preflight
+    )
+    assert get_preflight_snapshot(_task(sf, mock.Mock(preflight_snapshots={}))) is not (
+        preflight
+    )
+
+
+def test_get_preflight_snapshot__no_flow():
+    sf = mock.Mock(sf_version="52.0")
+    assert get_preflight_snapshot(_task(sf, None)) is not get_preflight_snapshot(
+        _task(sf, None)
+    )
@@ -13,14 +13,14 @@ from cumulusci.tasks.salesforce.tests.util import create_task
 
 
 class TestCheckSObjectsAvailable:
-    def test_sobject_preflight(self):
+    def test_sobject_preflight(self, batch_response):
         task = create_task(CheckSObjectsAvailable, {})
 
         task._init_task = Mock()
         task.sf = Mock()
-        task.sf.describe.return_value = {
-            "sobjects": [{"name": "Network"}, {"name": "Account"}]
-        }
+        task.sf.restful.return_value = batch_response(
+            describe={"sobjects": [{"name": "Network"}, {"name": "Account"}]}
+        )
 
         task()
 
@@ -28,7 +28,7 @@ class TestCheckSObjectsAvailable:
 
 
 class TestCheckSObjectPerms:
-    def test_sobject_perms_preflight(self):
+    def test_sobject_perms_preflight(self, batch_response):
         task = create_task(
             CheckSObjectPerms,
             {
@@ -41,18 +41,20 @@ class TestCheckSObjectPerms:
 
         task._init_task = Mock()
         task.sf = Mock()
-        task.sf.describe.return_value = {
-            "sobjects": [
-                {"name": "Network", "createable": False},
-                {"name": "Account", "createable": True},
-            ]
-        }
+        task.sf.restful.return_value = batch_response(
+            describe={
+                "sobjects": [
+                    {"name": "Network", "createable": False},
+                    {"name": "Account", "createable": True},
+                ]
+            }
+        )
 
         task()
 
         assert task.return_values is True
 
-    def test_sobject_perms_preflight__negative(self):
+    def test_sobject_perms_preflight__negative(self, batch_response):
         task = create_task(
             CheckSObjectPerms,
             {
@@ -65,18 +67,20 @@ class TestCheckSObjectPerms:
 
         task._init_task = Mock()
         task.sf = Mock()
-        task.sf.describe.return_value = {
-            "sobjects": [
-                {"name": "Network", "createable": False},
-                {"name": "Account", "createable": False},
-            ]
-        }
+        task.sf.restful.return_value = batch_response(
+            describe={
+                "sobjects": [
+                    {"name": "Network", "createable": False},
+                    {"name": "Account", "createable": False},
+                ]
+            }
+        )
 
         task()
 
         assert task.return_values is False
 
-    def test_sobject_perms_preflight__missing(self):
+    def test_sobject_perms_preflight__missing(self, batch_response):
         task = create_task(
             CheckSObjectPerms,
             {
@@ -89,7 +93,9 @@ class TestCheckSObjectPerms:
 
         task._init_task = Mock()
         task.sf = Mock()
-        task.sf.describe.return_value = {"sobjects": [{"name": "Network"}]}
+        task.sf.restful.return_value = batch_response(
+            describe={"sobjects": [{"name": "Network"}]}
+        )
 
         task()
 
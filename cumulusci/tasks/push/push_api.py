@@ -500,6 +500,28 @@ class SalesforcePushApi(object):
             push_jobs[push_job.sf_id] = push_job
         return push_jobs
 
+    def get_push_job_changes(self, request_id, since=None):
+        """Return the PackagePushJob rows of a request modified since a timestamp.
+
+        Not cached, since it is meant to be polled. ``since`` is a SOQL
+        datetime literal; rows modified at exactly that time are included
+        so callers should deduplicate by Id."""
+        sobject = "PackagePushJob"
+        field_names = [
+            "Id",
+            "SubscriberOrganizationKey",
+            "Status",
+            "SystemModstamp",
+        ]
+        where = f"PackagePushRequestId = '{request_id}'"
+        if since:
+            where += f" AND SystemModstamp >= {since}"
+        where = self.format_where_clause(where, obj=sobject)
+        query = f"SELECT {', '.join(field_names)} FROM {sobject}{where} ORDER BY SystemModstamp"
+        return self.return_query_records(
+            query, field_names=field_names, sobject=sobject
+        )
+
     @lru_cache(32)
     def get_push_errors(self, where=None, limit=None):
         sobject = "PackagePushError"
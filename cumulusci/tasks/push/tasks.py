@@ -1,5 +1,6 @@
 import csv
 import time
+from collections import Counter
 from datetime import datetime, timedelta
 
 from dateutil import tz
@@ -18,6 +19,11 @@ from cumulusci.tasks.salesforce import BaseSalesforceApiTask
 class BaseSalesforcePushTask(BaseSalesforceApiTask):
     completed_statuses = ["Succeeded", "Failed", "Canceled"]
     api_version = "38.0"
+    # Bounds (in seconds) for the adaptive poll interval used by
+    # _monitor_push_status, and how often it logs progress when idle.
+    monitor_min_interval = 10
+    monitor_max_interval = 60
+    monitor_progress_interval = 300
 
     def _init_task(self):
         super(BaseSalesforcePushTask, self)._init_task()
@@ -200,6 +206,87 @@ class BaseSalesforcePushTask(BaseSalesforceApiTask):
 
         self._get_push_request_job_results()
 
+    def _monitor_push_status(self, request_id):
+        """Track a push request by polling only the jobs changed since the last poll.
+
+        Keeps running counts of jobs by status, polls more often while jobs
+        are completing and backs off while nothing changes, and logs a
+        progress line whenever the counts change (or every
+        monitor_progress_interval seconds otherwise)."""
+        self._get_push_request_query(request_id)
+
+        job_statuses = {}
+        since = None
+        interval = self.monitor_min_interval
+        start = last_report = time.monotonic()
+        last_counts = None
+        while True:
+            for job in self.push_report.get_push_job_changes(request_id, since):
+                job_statuses[job["Id"]] = job["Status"]
+                since = self._soql_datetime(job["SystemModstamp"])
+
+            counts = Counter(job_statuses.values())
+            total = len(job_statuses)
+            completed = sum(counts[status] for status in self.completed_statuses)
+            now = time.monotonic()
+            if (
+                counts != last_counts
+                or now - last_report >= self.monitor_progress_interval
+            ):
+                self._log_push_progress(counts, total, completed, now - start)
+                last_report = now
+
+            if not total:
+                self.logger.info("Push request has no jobs to monitor.")
+                break
+            if completed == total:
+                break
+
+            if last_counts is not None:
+                prev_completed = sum(
+                    last_counts[status] for status in self.completed_statuses
+                )
+                if completed > prev_completed:
+                    interval = max(self.monitor_min_interval, interval // 2)
+                else:
+                    interval = min(self.monitor_max_interval, interval * 2)
+            last_counts = counts
+            time.sleep(interval)
+
+        self._get_push_request_job_results()
+
+    def _log_push_progress(self, counts, total, completed, elapsed):
+        summary = ", ".join(
+            f"{count} {status}" for status, count in sorted(counts.items())
+        )
+        message = f"Push progress: {completed}/{total} jobs complete"
+        if total:
+            message += f" ({completed * 100 // total}%)"
+        if summary:
+            message += f" [{summary}]"
+        if 0 < completed < total and elapsed > 0:
+            remaining = (total - completed) / (completed / elapsed)
+            message += f", about {timedelta(seconds=int(remaining))} remaining"
+        self.logger.info(message)
+
+    def _soql_datetime(self, value):
+        """Convert an API timestamp to a SOQL datetime literal (UTC)."""
+        return isoparse(value).astimezone(tz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class MonitorPushRequest(BaseSalesforcePushTask):
+    """Reports the progress of an existing push request until it completes."""
+
+    task_options = {
+        "request_id": {
+            "description": "The PackagePushRequest Id (ID prefix `0DV`) to monitor.",
+            "required": True,
+        },
+    }
+
+    def _run_task(self):
+        self._monitor_push_status(self.options["request_id"])
+
 
 class SchedulePushOrgList(BaseSalesforcePushTask):
 
@@ -241,6 +328,12 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
                 + " Defaults to 200."
             )
         },
+        "monitor": {
+            "description": (
+                "If True, report progress of the push by polling only the jobs"
+                + " that changed since the last poll. Defaults to False"
+            )
+        },
     }
 
     def _init_task(self):
@@ -268,6 +361,7 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
             self.options["batch_size"] = 200
         if "csv" not in self.options and "csv_field_name" in self.options:
             raise TaskOptionsError("Please provide a csv file for this task to run.")
+        self.options["monitor"] = process_bool_arg(self.options.get("monitor", False))
 
     def _get_orgs(self):
         if "csv" in self.options:
@@ -352,7 +446,10 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
 
         # Report the status if start time is less than 1 minute from now
         if start_time - utcnow < timedelta(minutes=1):
-            self._report_push_status(self.request_id)
+            if self.options["monitor"]:
+                self._monitor_push_status(self.request_id)
+            else:
+                self._report_push_status(self.request_id)
         else:
             self.logger.info("Exiting early since request is in the future")
 
@@ -395,6 +492,12 @@ class SchedulePushOrgQuery(SchedulePushOrgList):
         "dry_run": {
             "description": "If True, log how many orgs were selected but skip creating a PackagePushRequest.  Defaults to False"
         },
+        "monitor": {
+            "description": (
+                "If True, report progress of the push by polling only the jobs"
+                + " that changed since the last poll. Defaults to False"
+            )
+        },
     }
 
     def _init_options(self, kwargs):
@@ -406,6 +509,7 @@ class SchedulePushOrgQuery(SchedulePushOrgList):
         if "batch_size" not in self.options:
             self.options["batch_size"] = 200
         self.options["dry_run"] = process_bool_arg(self.options.get("dry_run", False))
+        self.options["monitor"] = process_bool_arg(self.options.get("monitor", False))
 
     def _get_orgs(self):
         subscriber_where = self.options.get("subscriber_where")
@@ -478,6 +478,26 @@ def test_sf_push_get_push_jobs_by_id(sf_push_api, package_push_job):
     assert package_expected == package_result
 
 
+def test_sf_push_get_push_job_changes(sf_push_api):
+    sobject = "PackagePushJob"
+    field_names = ["Id", "SubscriberOrganizationKey", "Status", "SystemModstamp"]
+    sf_push_api.return_query_records = mock.MagicMock()
+
+    sf_push_api.get_push_job_changes("0DV000000000001")
+    sf_push_api.return_query_records.assert_called_with(
+        "SELECT Id, SubscriberOrganizationKey, Status, SystemModstamp FROM PackagePushJob WHERE PackagePushRequestId = '0DV000000000001' ORDER BY SystemModstamp",
+        field_names=field_names,
+        sobject=sobject,
+    )
+
+    sf_push_api.get_push_job_changes("0DV000000000001", "2020-07-02T08:03:49Z")
+    sf_push_api.return_query_records.assert_called_with(
+        "SELECT Id, SubscriberOrganizationKey, Status, SystemModstamp FROM PackagePushJob WHERE PackagePushRequestId = '0DV000000000001' AND SystemModstamp >= 2020-07-02T08:03:49Z ORDER BY SystemModstamp",
+        field_names=field_names,
+        sobject=sobject,
+    )
+
+
 def test_sf_push_get_push_errors(sf_push_api):
     query = "SELECT Id, PackagePushJobId, ErrorSeverity, ErrorType, ErrorTitle, ErrorMessage, ErrorDetails FROM PackagePushError WHERE Name='foo'"
     sf_push_api.return_query_records = mock.MagicMock()
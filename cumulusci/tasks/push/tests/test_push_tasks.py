@@ -1,6 +1,7 @@
 import datetime
 import logging
 import os
+from collections import Counter
 from unittest import mock
 
 import pytest
@@ -20,6 +21,7 @@ from cumulusci.tasks.push.push_api import (
 )
 from cumulusci.tasks.push.tasks import (
     BaseSalesforcePushTask,
+    MonitorPushRequest,
     SchedulePushOrgList,
     SchedulePushOrgQuery,
 )
@@ -442,6 +444,87 @@ def test_get_push_request_job_results(
     assert "Push complete: 1 succeeded, 1 failed, 1 canceled" in caplog.text
 
 
+def _push_job_change(job_id, status, modstamp):
+    return {
+        "Id": job_id,
+        "SubscriberOrganizationKey": ORG,
+        "Status": status,
+        "SystemModstamp": modstamp,
+    }
+
+
+@mock.patch("time.sleep")
+def test_monitor_push_status(sleep, caplog):
+    caplog.set_level(logging.INFO)
+    task = create_task(BaseSalesforcePushTask, options={})
+    task._get_push_request_query = mock.Mock()
+    task._get_push_request_job_results = mock.Mock()
+    task.push_report = mock.Mock()
+    task.push_report.get_push_job_changes.side_effect = [
+        [
+            _push_job_change("0DX1", "Pending", "2020-07-02T08:03:49.000+0000"),
+            _push_job_change("0DX2", "Pending", "2020-07-02T08:03:49.000+0000"),
+        ],
+        [],
+        [_push_job_change("0DX1", "Succeeded", "2020-07-02T08:10:00.000+0000")],
+        [
+            _push_job_change("0DX1", "Succeeded", "2020-07-02T08:10:00.000+0000"),
+            _push_job_change("0DX2", "Failed", "2020-07-02T08:12:30.000Z"),
+        ],
+    ]
+
+    task._monitor_push_status("0DV1R000000k9dEWAQ")
+
+    task._get_push_request_query.assert_called_once_with("0DV1R000000k9dEWAQ")
+    task._get_push_request_job_results.assert_called_once()
+    assert [call.args for call in task.push_report.get_push_job_changes.mock_calls] == [
+        ("0DV1R000000k9dEWAQ", None),
+        ("0DV1R000000k9dEWAQ", "2020-07-02T08:03:49Z"),
+        ("0DV1R000000k9dEWAQ", "2020-07-02T08:03:49Z"),
+        ("0DV1R000000k9dEWAQ", "2020-07-02T08:10:00Z"),
+    ]
+    # backs off while idle, speeds up again once jobs complete
+    assert [call.args[0] for call in sleep.mock_calls] == [10, 20, 10]
+    assert "Push progress: 0/2 jobs complete (0%) [2 Pending]" in caplog.text
+    assert "Push progress: 1/2 jobs complete (50%) [1 Pending, 1 Succeeded]" in (
+        caplog.text
+    )
+    assert "Push progress: 2/2 jobs complete (100%) [1 Failed, 1 Succeeded]" in (
+        caplog.text
+    )
+
+
+def test_monitor_push_status__no_jobs(caplog):
+    caplog.set_level(logging.INFO)
+    task = create_task(BaseSalesforcePushTask, options={})
+    task._get_push_request_query = mock.Mock()
+    task._get_push_request_job_results = mock.Mock()
+    task.push_report = mock.Mock()
+    task.push_report.get_push_job_changes.return_value = []
+
+    task._monitor_push_status("0DV1R000000k9dEWAQ")
+
+    assert "Push request has no jobs to monitor." in caplog.text
+    task._get_push_request_job_results.assert_called_once()
+
+
+def test_log_push_progress__estimates_remaining_time(caplog):
+    caplog.set_level(logging.INFO)
+    task = create_task(BaseSalesforcePushTask, options={})
+    task._log_push_progress(Counter({"Succeeded": 25, "InProgress": 75}), 100, 25, 600)
+    assert (
+        "Push progress: 25/100 jobs complete (25%) [75 InProgress, 25 Succeeded],"
+        " about 0:30:00 remaining" in caplog.text
+    )
+
+
+def test_monitor_push_request_task():
+    task = create_task(MonitorPushRequest, options={"request_id": "0DV000000000001"})
+    task._monitor_push_status = mock.Mock()
+    task._run_task()
+    task._monitor_push_status.assert_called_once_with("0DV000000000001")
+
+
 def test_schedule_push_org_query_get_org_error():
     task = create_task(
         SchedulePushOrgQuery,
@@ -657,3 +740,25 @@ def test_schedule_push_org_list_run_task_many_orgs_now(org_file):
     task.push.create_push_request.return_value = ("0DV000000000001", 1001)
     task._run_task()
     task.sf.query_all.assert_called_with(query)
+
+
+def test_schedule_push_org_list_run_task__monitor(org_file):
+    task = create_task(
+        SchedulePushOrgList,
+        options={
+            "orgs": ORG_FILE,
+            "version": VERSION,
+            "namespace": NAMESPACE,
+            "start_time": "now",
+            "monitor": "True",
+        },
+    )
+    task.push = mock.MagicMock()
+    task.sf = mock.MagicMock()
+    task.sf.query_all.return_value = PACKAGE_OBJS
+    task.push.create_push_request.return_value = ("0DV000000000001", 2)
+    task._monitor_push_status = mock.Mock()
+    task._report_push_status = mock.Mock()
+    task._run_task()
+    task._monitor_push_status.assert_called_once_with("0DV000000000001")
+    task._report_push_status.assert_not_called()
@@ -147,9 +147,12 @@ class ParentPullRequestNotesGenerator(BaseReleaseNotesGenerator):
     def aggregate_child_change_notes(self, pull_request):
         """Given a pull request, aggregate all change notes from child pull requests.
         Child pull requests are pull requests that have a base branch
-        equal to the the given pull request's head."""
+        equal to the the given pull request's head.
+
+        Only merged child pull requests are aggregated, so open ones are not
+        listed at all, and the parent is only updated if its body changed."""
         self.change_notes = get_pull_requests_with_base_branch(
-            self.repo, pull_request.head.ref, state="all"
+            self.repo, pull_request.head.ref, state="closed"
         )
         self.change_notes = [
             note
@@ -174,6 +177,8 @@ class ParentPullRequestNotesGenerator(BaseReleaseNotesGenerator):
         if self.empty_change_notes:
             body.extend(render_empty_pr_section(self.empty_change_notes))
         new_body = "\r\n".join(body)
+        if new_body == pull_request.body:
+            return
 
         if not pull_request.update(body=new_body):
             raise CumulusCIException(
@@ -1,6 +1,7 @@
 import logging
 import re
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 import github3.exceptions
 
@@ -183,6 +184,8 @@ class GithubIssuesParser(IssuesParser):
         "beta": "Included in beta release",
         "prod": "Included in production release",
     }
+    # Number of issues fetched from GitHub at once when rendering
+    max_workers = 8
 
     def __new__(cls, release_notes_generator, title, issue_regex=None):
         if not release_notes_generator.has_issues:
@@ -200,6 +203,7 @@ class GithubIssuesParser(IssuesParser):
         self.pr_url = None
         self.publish = release_notes_generator.do_publish
         self.github = release_notes_generator.github
+        self._issues = {}
 
     def _add_line(self, line):
         # find issue numbers per line
@@ -229,6 +233,7 @@ class GithubIssuesParser(IssuesParser):
 
     def _render_content(self):
         content = []
+        self._prefetch_issues(item["issue_number"] for item in self.content)
         for item in sorted(self.content, key=lambda k: k["issue_number"]):
             issue = self._get_issue(item["issue_number"])
             txt = "#{}: {}".format(item["issue_number"], issue.title)
@@ -239,7 +244,18 @@ class GithubIssuesParser(IssuesParser):
                 self._add_issue_comment(issue)
         return "\r\n".join(content)
 
+    def _prefetch_issues(self, issue_numbers):
+        """Fetch the distinct issues not already cached concurrently."""
+        issue_numbers = set(issue_numbers) - set(self._issues)
+        if len(issue_numbers) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Consume the results so that errors are raised here
+            list(executor.map(self._get_issue, issue_numbers))
+
     def _get_issue(self, issue_number):
+        if issue_number in self._issues:
+            return self._issues[issue_number]
         try:
             issue = self.github.issue(
                 self.release_notes_generator.github_info["github_owner"],
@@ -248,6 +264,7 @@ class GithubIssuesParser(IssuesParser):
             )
         except github3.exceptions.NotFoundError:
             raise GithubApiNotFoundError("Issue #{} not found".format(issue_number))
+        self._issues[issue_number] = issue
         return issue
 
     def _process_change_note(self, pull_request):
@@ -4,6 +4,7 @@ from datetime import datetime
 from distutils.version import LooseVersion
 
 import pytz
+from github3.exceptions import NotFoundError
 
 from cumulusci.core.github import get_tag_by_name
 
@@ -119,26 +120,56 @@ class GithubChangeNotesProvider(BaseChangeNotesProvider):
             self._get_version_from_tag(self.release_notes_generator.current_tag)
         )
 
+        # Only list the refs under the production tag prefix rather than
+        # every tag in the repository.
+        prefix = self.github_info["prefix_prod"]
         versions = []
-        for tag in self.repo.tags():
-            if not tag.name.startswith(self.github_info["prefix_prod"]):
+        try:
+            refs = list(self.repo.refs("tags/" + prefix.rstrip("/")))
+        except NotFoundError:
+            # GitHub returns 404 when no refs match the prefix
+            return None
+        for ref in refs:
+            tag_name = ref.ref[len("refs/tags/") :]
+            if not tag_name.startswith(prefix):
                 continue
-            version = LooseVersion(self._get_version_from_tag(tag.name))
+            version = LooseVersion(self._get_version_from_tag(tag_name))
             if version >= current_version:
                 continue
             versions.append(version)
         if versions:
             versions.sort()
-            return "{}{}".format(self.github_info["prefix_prod"], versions[-1])
+            return "{}{}".format(prefix, versions[-1])
 
     def _get_pull_requests(self):
-        """Gets all pull requests from the repo since we can't do a filtered
-        date merged search"""
-        for pull in self.repo.pull_requests(
-            state="closed", base=self.github_info["default_branch"], direction="asc"
-        ):
+        """Gets the pull requests merged to the default branch between the tags.
+
+        GitHub can't filter pull requests by merge date, but a pull request
+        merged after the last tag was also updated after it. So when there is
+        a last tag, pull requests are listed most recently updated first and
+        the listing stops at the first one last updated before the last tag,
+        instead of paging through every closed pull request in the repo."""
+        if self.last_tag:
+            pulls = self.repo.pull_requests(
+                state="closed",
+                base=self.github_info["default_branch"],
+                sort="updated",
+                direction="desc",
+            )
+        else:
+            pulls = self.repo.pull_requests(
+                state="closed", base=self.github_info["default_branch"], direction="asc"
+            )
+
+        included = []
+        for pull in pulls:
+            if self.last_tag and pull.updated_at and pull.updated_at < self.end_date:
+                break
             if self._include_pull_request(pull):
-                yield pull
+                included.append(pull)
+
+        # Keep the notes in the order the pull requests were opened
+        yield from sorted(included, key=lambda pull: pull.number)
 
     def _include_pull_request(self, pull_request):
         """Checks if the given pull_request was merged to the default branch
@@ -1,6 +1,7 @@
 # coding=utf-8
 import json
 import os
+from datetime import datetime
 from unittest import mock
 
 import pytest
@@ -512,6 +513,37 @@ class TestParentPullRequestNotesGenerator(GithubApiTestMixin):
             generator.aggregate_child_change_notes(parent_pr)
         parent_pr.update.assert_called_once()
 
+    @mock.patch(
+        "cumulusci.tasks.release_notes.generator.get_pull_requests_with_base_branch"
+    )
+    def test_aggregate_child_change_notes__body_unchanged(
+        self, get_pull, generator, mock_util, gh_api
+    ):
+        self.init_github()
+        child_pr = ShortPullRequest(
+            self._get_expected_pull_request(
+                1, 1, "# Changes\r\n\r\n* Now, more code!", datetime.utcnow()
+            ),
+            gh_api,
+        )
+        get_pull.return_value = [child_pr]
+        parent_pr = ShortPullRequest(
+            self._get_expected_pull_request(
+                3,
+                3,
+                "# Changes\r\n\r\n* Now, more code! [[PR1](https://github.com/TestOwner/TestRepo/pulls/1)]",
+            ),
+            gh_api,
+        )
+        parent_pr.update = mock.Mock()
+
+        generator.aggregate_child_change_notes(parent_pr)
+
+        get_pull.assert_called_once_with(
+            generator.repo, parent_pr.head.ref, state="closed"
+        )
+        parent_pr.update.assert_not_called()
+
     @responses.activate
     def test_aggregate_child_change_notes__empty_change_note(
         self, generator, mock_util, gh_api
@@ -290,6 +290,32 @@ class TestGithubIssuesParser(GithubApiTestMixin):
         )
         assert parser.render() == expected_render
 
+    @responses.activate
+    def test_render_issues_fetched_once(self):
+        self.mock_util.mock_get_repo()
+        for issue_number in (1, 2, 3):
+            responses.add(
+                method=responses.GET,
+                url="{}/issues/{}".format(self.repo_api_url, issue_number),
+                json=self._get_expected_issue(issue_number),
+            )
+        generator = self._create_generator()
+        parser = GithubIssuesParser(generator, self.title)
+        parser.content = [
+            {"issue_number": n, "pr_number": self.pr_number, "pr_url": self.pr_url}
+            for n in (3, 1, 2, 1)
+        ]
+
+        rendered = parser.render()
+
+        assert rendered == "# Issues\r\n\r\n" + "\r\n".join(
+            ["#1: Found a bug", "#1: Found a bug", "#2: Found a bug", "#3: Found a bug"]
+        )
+        issue_calls = [
+            call for call in responses.calls if "/issues/" in call.request.url
+        ]
+        assert len(issue_calls) == 3
+
     @responses.activate
     def test_render_issue_number_invalid(self):
         api_url = "{}/issues/{}".format(self.repo_api_url, self.issue_number_invalid)
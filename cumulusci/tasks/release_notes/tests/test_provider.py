@@ -243,7 +243,15 @@ class TestGithubChangeNotesProvider(GithubApiTestMixin):
 
     def _mock_list_pull_requests_multiple_in_range(self):
         api_url = "{}/pulls".format(self.repo_api_url)
+        # Listed most recently updated first, as requested by the provider
         expected_response = [
+            self._get_expected_pull_request(
+                8,
+                108,
+                "pull 8",
+                datetime.utcnow(),
+                merge_commit_sha=self.current_tag_commit_sha,
+            ),
             self._get_expected_pull_request(
                 1, 101, "pull 1", datetime.utcnow() - timedelta(seconds=60)
             ),
@@ -253,13 +261,6 @@ class TestGithubChangeNotesProvider(GithubApiTestMixin):
             self._get_expected_pull_request(
                 3, 103, "pull 3", datetime.utcnow() - timedelta(seconds=120)
             ),
-            self._get_expected_pull_request(
-                4, 104, "pull 4", datetime.utcnow() - timedelta(days=4)
-            ),
-            self._get_expected_pull_request(
-                5, 105, "pull 5", datetime.utcnow() - timedelta(days=5)
-            ),
-            self._get_expected_pull_request(6, 106, "pull 6", None),
             self._get_expected_pull_request(
                 7,
                 107,
@@ -267,30 +268,30 @@ class TestGithubChangeNotesProvider(GithubApiTestMixin):
                 datetime.utcnow() - timedelta(seconds=180),
                 merge_commit_sha=self.last_tag_commit_sha,
             ),
+            self._get_expected_pull_request(6, 106, "pull 6", None),
             self._get_expected_pull_request(
-                8,
-                108,
-                "pull 8",
-                datetime.utcnow(),
-                merge_commit_sha=self.current_tag_commit_sha,
+                4, 104, "pull 4", datetime.utcnow() - timedelta(days=4)
+            ),
+            self._get_expected_pull_request(
+                5, 105, "pull 5", datetime.utcnow() - timedelta(days=5)
             ),
         ]
         responses.add(method=responses.GET, url=api_url, json=expected_response)
 
     def _mock_list_tags_multiple(self):
-        api_url = "{}/tags".format(self.repo_api_url)
+        api_url = "{}/git/refs/tags/release".format(self.repo_api_url)
         expected_response = [
-            self._get_expected_repo_tag(self.current_tag, self.current_tag_sha),
-            self._get_expected_repo_tag(self.beta_tag, self.beta_tag_sha),
-            self._get_expected_repo_tag(self.last_tag, self.last_tag_sha),
-            self._get_expected_repo_tag(self.last2_tag, self.last2_tag_sha),
+            self._get_expected_tag_ref(self.current_tag, self.current_tag_sha),
+            self._get_expected_tag_ref("release-candidate/1.4", self._random_sha()),
+            self._get_expected_tag_ref(self.last_tag, self.last_tag_sha),
+            self._get_expected_tag_ref(self.last2_tag, self.last2_tag_sha),
         ]
         responses.add(method=responses.GET, url=api_url, json=expected_response)
 
     def _mock_list_tags_single(self):
-        api_url = "{}/tags".format(self.repo_api_url)
+        api_url = "{}/git/refs/tags/release".format(self.repo_api_url)
         expected_response = [
-            self._get_expected_repo_tag(self.current_tag, self.current_tag_sha)
+            self._get_expected_tag_ref(self.current_tag, self.current_tag_sha)
         ]
         responses.add(method=responses.GET, url=api_url, json=expected_response)
 
@@ -336,6 +337,24 @@ class TestGithubChangeNotesProvider(GithubApiTestMixin):
         assert provider.last_tag is None
         assert provider.last_tag_info is None
 
+    @responses.activate
+    def test_current_tag_without_last_no_tags(self):
+        self.mock_util.mock_get_repo()
+        self._mock_current_tag_ref()
+        self._mock_current_tag()
+        self._mock_current_tag_commit()
+        responses.add(
+            method=responses.GET,
+            url="{}/git/refs/tags/release".format(self.repo_api_url),
+            status=http.client.NOT_FOUND,
+        )
+
+        generator = self._create_generator(self.current_tag)
+        provider = GithubChangeNotesProvider(generator, self.current_tag)
+
+        assert provider.last_tag is None
+        assert provider.last_tag_info is None
+
     @responses.activate
     def test_no_pull_requests_in_repo(self):
         self.mock_util.mock_get_repo()
@@ -426,6 +445,33 @@ class TestGithubChangeNotesProvider(GithubApiTestMixin):
         for pr, pr_body in zip(provider_list, pr_body_list):
             assert pr.body == pr_body
 
+    @responses.activate
+    def test_pull_requests_stop_listing_before_last_tag(self):
+        self.mock_util.mock_get_repo()
+        # Mock the tag calls
+        self._mock_current_tag_ref()
+        self._mock_current_tag()
+        self._mock_current_tag_commit()
+        self._mock_last_tag_ref()
+        self._mock_last_tag()
+        self._mock_last_tag_commit()
+        self._mock_list_pull_requests_multiple_in_range()
+
+        generator = self._create_generator(self.current_tag, self.last_tag)
+        provider = GithubChangeNotesProvider(generator, self.current_tag, self.last_tag)
+        provider._include_pull_request = mock.Mock(wraps=provider._include_pull_request)
+        list(provider())
+
+        pull_numbers = [
+            call.args[0].number for call in provider._include_pull_request.mock_calls
+        ]
+        assert pull_numbers == [108, 101, 102, 103, 107, 106]
+        pulls_request = next(
+            call.request for call in responses.calls if "/pulls" in call.request.url
+        )
+        assert "sort=updated" in pulls_request.url
+        assert "direction=desc" in pulls_request.url
+
     @responses.activate
     def test_pull_requests_with_no_last_tag(self):
         self.mock_util.mock_get_repo()
@@ -2,3 +2,4 @@ from cumulusci.tasks.robotframework.robotframework import Robot  # noqa: F401
 from cumulusci.tasks.robotframework.robotframework import RobotTestDoc  # noqa: F401
 from cumulusci.tasks.robotframework.libdoc import RobotLibDoc  # noqa: F401
 from cumulusci.tasks.robotframework.lint import RobotLint  # noqa: F401
+from cumulusci.tasks.robotframework.perf_history import RobotPerfCompare  # noqa: F401
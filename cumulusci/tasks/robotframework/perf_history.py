@@ -0,0 +1,225 @@
+import sqlite3
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from cumulusci.core.exceptions import CumulusCIFailure, TaskOptionsError
+from cumulusci.core.tasks import BaseTask
+from cumulusci.core.utils import process_bool_arg
+from cumulusci.utils.xml.robot_xml import PerfSummary
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    commit_sha TEXT,
+    org_shape TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    test TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metrics_run_id ON metrics (run_id);
+"""
+
+
+class PerfRun(NamedTuple):
+    id: int
+    timestamp: str
+    commit_sha: Optional[str]
+    org_shape: str
+
+
+class Regression(NamedTuple):
+    test: str
+    metric: str
+    value: float
+    mean: float
+    stdev: float
+
+
+class PerfHistory:
+    """A SQLite time series of the performance metrics reported by robot runs.
+
+    Each run records the metrics of every test that reported any, together
+    with the commit that was tested and the shape of the org it ran against
+    (e.g. the scratch org config name), so that runs are only compared with
+    runs against similar orgs."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(path))
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.close()
+
+    def add_run(
+        self,
+        summaries: Iterable[PerfSummary],
+        commit_sha: Optional[str],
+        org_shape: str,
+        timestamp: Optional[datetime] = None,
+    ) -> int:
+        timestamp = timestamp or datetime.utcnow()
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (timestamp, commit_sha, org_shape) VALUES (?, ?, ?)",
+                (timestamp.isoformat(), commit_sha, org_shape),
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO metrics (run_id, test, metric, value) VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, summary.test.longname, metric, value)
+                    for summary in summaries
+                    for metric, value in summary.metrics.items()
+                ],
+            )
+        return run_id
+
+    def get_runs(
+        self,
+        org_shape: Optional[str] = None,
+        before: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[PerfRun]:
+        """Return runs, most recent first, optionally filtered by org shape."""
+        query = "SELECT id, timestamp, commit_sha, org_shape FROM runs WHERE 1 = 1"
+        params = []
+        if org_shape is not None:
+            query += " AND org_shape = ?"
+            params.append(org_shape)
+        if before is not None:
+            query += " AND id < ?"
+            params.append(before)
+        query += " ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [PerfRun(*row) for row in self.connection.execute(query, params)]
+
+    def get_metrics(self, run_ids: Iterable[int]) -> Dict[Tuple[str, str], List[float]]:
+        """Return the values of each (test, metric) across the given runs."""
+        run_ids = list(run_ids)
+        metrics = {}
+        if not run_ids:
+            return metrics
+        rows = self.connection.execute(
+            "SELECT test, metric, value FROM metrics "
+            f"WHERE run_id IN ({', '.join('?' * len(run_ids))}) ORDER BY run_id",
+            run_ids,
+        )
+        for test, metric, value in rows:
+            metrics.setdefault((test, metric), []).append(value)
+        return metrics
+
+    def find_regressions(
+        self, run: PerfRun, baseline_runs: int, threshold: float, min_samples: int = 3
+    ) -> List[Regression]:
+        """Compare a run with the runs before it against the same org shape.
+
+        A metric regressed if it is more than `threshold` standard deviations
+        above its mean over the baseline. Higher values are assumed to be
+        worse. Metrics with fewer than `min_samples` baseline values are
+        not compared."""
+        baseline = self.get_metrics(
+            r.id
+            for r in self.get_runs(run.org_shape, before=run.id, limit=baseline_runs)
+        )
+        regressions = []
+        for (test, metric), values in self.get_metrics([run.id]).items():
+            previous = baseline.get((test, metric), [])
+            if len(previous) < min_samples:
+                continue
+            value = values[0]
+            mean = statistics.mean(previous)
+            stdev = statistics.stdev(previous)
+            if value > mean + threshold * stdev if stdev else value > mean:
+                regressions.append(Regression(test, metric, value, mean, stdev))
+        return regressions
+
+
+def get_perf_history(project_config) -> PerfHistory:
+    return PerfHistory(project_config.cache_dir / "robot" / "perf.db")
+
+
+class RobotPerfCompare(BaseTask):
+    task_docs = """
+    Compares the performance metrics of the most recent robot run with
+    the runs before it against the same org shape.
+
+    The robot task records the elapsed times and custom metrics of every
+    test that reports them (see the *Set Test Elapsed Time* and *Set Test
+    Metric* keywords) in .cci/robot/perf.db. A metric is flagged as a
+    regression when it is more than ``threshold`` standard deviations above
+    its mean over the previous ``baseline_runs`` runs.
+    """
+
+    task_options = {
+        "org_shape": {
+            "description": "Only compare runs against this org shape "
+            "(the scratch org config name or org type). "
+            "Defaults to the shape of the most recent run."
+        },
+        "baseline_runs": {
+            "description": "The number of earlier runs to compare with. Defaults to 10."
+        },
+        "threshold": {
+            "description": "The number of standard deviations above the baseline mean "
+            "at which a metric counts as a regression. Defaults to 3."
+        },
+        "fail_on_regression": {
+            "description": "If True, fail the task when any regression is found. "
+            "Defaults to False."
+        },
+    }
+
+    def _init_options(self, kwargs):
+        super()._init_options(kwargs)
+        try:
+            self.options["baseline_runs"] = int(self.options.get("baseline_runs", 10))
+            self.options["threshold"] = float(self.options.get("threshold", 3))
+        except ValueError:
+            raise TaskOptionsError(
+                "The baseline_runs and threshold options must be numbers."
+            )
+        self.options["fail_on_regression"] = process_bool_arg(
+            self.options.get("fail_on_regression") or False
+        )
+
+    def _run_task(self):
+        with get_perf_history(self.project_config) as history:
+            runs = history.get_runs(self.options.get("org_shape"), limit=1)
+            if not runs:
+                self.logger.info("No robot performance metrics have been recorded.")
+                return
+            run = runs[0]
+            self.logger.info(
+                f"Comparing run of {run.timestamp} (commit {run.commit_sha}, "
+                f"org shape {run.org_shape}) with up to "
+                f"{self.options['baseline_runs']} earlier runs"
+            )
+            regressions = history.find_regressions(
+                run, self.options["baseline_runs"], self.options["threshold"]
+            )
+
+        for regression in regressions:
+            self.logger.warning(
+                f"{regression.test} - {regression.metric}: {regression.value} "
+                f"(baseline {regression.mean:.2f} ± {regression.stdev:.2f})"
+            )
+        self.return_values["regressions"] = [r._asdict() for r in regressions]
+        if not regressions:
+            self.logger.info("No performance regressions found.")
+        elif self.options["fail_on_regression"]:
+            raise CumulusCIFailure(
+                f"{len(regressions)} performance regression"
+                f"{'' if len(regressions) == 1 else 's'} found."
+            )
@@ -1,3 +1,4 @@
+import contextlib
 import json
 import os
 import shlex
@@ -23,8 +24,9 @@ from cumulusci.core.utils import (
 )
 from cumulusci.robotframework.utils import set_pdb_trace
 from cumulusci.tasks.robotframework.debugger import DebugListener
+from cumulusci.tasks.robotframework.perf_history import get_perf_history
 from cumulusci.tasks.salesforce import BaseSalesforceTask
-from cumulusci.utils.xml.robot_xml import log_perf_summary_from_xml
+from cumulusci.utils.xml.robot_xml import get_results_from_xml, log_perf_summaries
 
 
 class Robot(BaseSalesforceTask):
@@ -75,7 +77,9 @@ class Robot(BaseSalesforceTask):
             "description": (
                 "Path to a file which defines the order in which parallel tests are run. "
                 "This maps directly to the pabot option of the same name. It is ignored "
-                "unless the processes argument is set to 2 or greater."
+                "unless the processes argument is set to 2 or greater. If not set, "
+                "the suites (or tests, with testlevelsplit) are ordered longest first "
+                "according to how long they took in earlier runs."
             ),
         },
         "processes": {
@@ -242,11 +246,17 @@ class Robot(BaseSalesforceTask):
             # the pabot option `--testlevelsplit` takes no arguments,
             # so we'll only add it if it's set to true and then remove
             # it from options so it doesn't get added later.
-            if self.options.pop("testlevelsplit", False):
+            testlevelsplit = self.options.pop("testlevelsplit", False)
+            if testlevelsplit:
                 cmd.append("--testlevelsplit")
 
             # the ordering option is pabot-specific and must come before
-            # all robot options:
+            # all robot options. Without one, we start the slowest suites
+            # (or tests) first so that workers finish at about the same time.
+            if not self.options.get("ordering", None):
+                self.options["ordering"] = self._write_ordering_file(
+                    output_dir, testlevelsplit
+                )
             if self.options.get("ordering", None):
                 cmd.extend(["--ordering", self.options.pop("ordering")])
 
@@ -304,7 +314,10 @@ class Robot(BaseSalesforceTask):
 
         output_xml = Path(options["outputdir"]) / "output.xml"
         if num_failed <= 250 and output_xml.exists():
-            log_perf_summary_from_xml(output_xml, self.logger.info)
+            results = get_results_from_xml(output_xml)
+            log_perf_summaries(results.perf_summaries, self.logger.info)
+            self._update_duration_history(results.durations)
+            self._record_perf_metrics(results.perf_summaries)
 
         # These numbers are from the robot framework user guide:
         # http://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#return-codes
@@ -323,6 +336,61 @@ class Robot(BaseSalesforceTask):
         elif num_failed >= 255:
             raise RobotTestFailure("Unexpected internal error")
 
+    @property
+    @contextlib.contextmanager
+    def _duration_history_file(self):
+        with self.project_config.open_cache("robot") as parent_dir:
+            yield parent_dir / "durations.json"
+
+    def _load_duration_history(self):
+        """Load the durations of suites and tests recorded by earlier runs."""
+        history = {}
+        with self._duration_history_file as history_file:
+            if history_file.exists():
+                with history_file.open("r", encoding="utf-8") as f:
+                    history = json.load(f)
+        return {
+            "suites": history.get("suites", {}),
+            "tests": history.get("tests", {}),
+        }
+
+    def _update_duration_history(self, durations):
+        """Record the durations of the suites and tests of a run."""
+        history = self._load_duration_history()
+        history["suites"].update(durations["suites"])
+        history["tests"].update(durations["tests"])
+        with self._duration_history_file as history_file:
+            with history_file.open("w", encoding="utf-8") as f:
+                json.dump(history, f)
+
+    def _record_perf_metrics(self, summaries):
+        """Add the performance metrics of this run to the project's perf history."""
+        if not summaries:
+            return
+        org_shape = self.org_config.config_name or self.org_config.org_type or "unknown"
+        with get_perf_history(self.project_config) as history:
+            history.add_run(summaries, self.project_config.repo_commit, org_shape)
+
+    def _write_ordering_file(self, output_dir, testlevelsplit):
+        """Write a pabot ordering file listing the longest running items first.
+
+        Returns the path of the file, or None if there is no history yet."""
+        kind = "test" if testlevelsplit else "suite"
+        durations = self._load_duration_history()[f"{kind}s"]
+        if not durations:
+            return None
+        output_dir.mkdir(parents=True, exist_ok=True)
+        ordering_file = output_dir / "pabot_ordering.txt"
+        ordering_file.write_text(
+            "".join(
+                f"--{kind} {name}\n"
+                for name in sorted(durations, key=durations.get, reverse=True)
+            ),
+            encoding="utf-8",
+        )
+        self.logger.info(f"Ordering {kind}s by previous run time: {ordering_file}")
+        return str(ordering_file)
+
 
 class RobotTestDoc(BaseTask):
     task_options = {
@@ -0,0 +1,118 @@
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from cumulusci.core.config import BaseProjectConfig
+from cumulusci.core.exceptions import CumulusCIFailure, TaskOptionsError
+from cumulusci.tasks.robotframework import RobotPerfCompare
+from cumulusci.tasks.robotframework.perf_history import PerfHistory
+from cumulusci.tasks.salesforce.tests.util import create_task
+from cumulusci.utils.xml.robot_xml import PerfSummary
+
+
+def summary(test, **metrics):
+    return PerfSummary(test, metrics, mock.Mock(longname=f"Perf.{test}"))
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    with mock.patch.object(
+        BaseProjectConfig, "cache_dir", new_callable=mock.PropertyMock
+    ) as cache_dir:
+        cache_dir.return_value = tmp_path
+        yield tmp_path
+
+
+@pytest.fixture
+def history(cache_dir):
+    with PerfHistory(cache_dir / "robot" / "perf.db") as history:
+        yield history
+
+
+def add_runs(history, elapsed_times, org_shape="dev"):
+    for i, elapsed_time in enumerate(elapsed_times):
+        history.add_run(
+            [summary("Insert", elapsed_time=elapsed_time, total_time=1.0)],
+            f"commit{i}",
+            org_shape,
+        )
+
+
+class TestPerfHistory:
+    def test_add_run(self, history):
+        run_id = history.add_run(
+            [summary("Insert", elapsed_time=3.5), summary("Update", rows=200)],
+            "abcdef",
+            "dev",
+            timestamp=datetime(2022, 1, 1),
+        )
+
+        assert history.get_runs() == [(run_id, "2022-01-01T00:00:00", "abcdef", "dev")]
+        assert history.get_metrics([run_id]) == {
+            ("Perf.Insert", "elapsed_time"): [3.5],
+            ("Perf.Update", "rows"): [200.0],
+        }
+
+    def test_get_runs__filtered(self, history):
+        add_runs(history, [1, 2, 3])
+        add_runs(history, [4], org_shape="qa")
+
+        assert [run.commit_sha for run in history.get_runs("dev")] == [
+            "commit2",
+            "commit1",
+            "commit0",
+        ]
+        assert [run.org_shape for run in history.get_runs(limit=1)] == ["qa"]
+        assert len(history.get_runs("dev", before=3)) == 2
+
+    def test_find_regressions(self, history):
+        add_runs(history, [10.0, 11.0, 10.5, 9.5, 10.0, 20.0])
+        add_runs(history, [50.0], org_shape="qa")
+
+        run = history.get_runs("dev", limit=1)[0]
+        regressions = history.find_regressions(run, baseline_runs=10, threshold=3)
+
+        assert [r[:3] for r in regressions] == [("Perf.Insert", "elapsed_time", 20.0)]
+        assert regressions[0].mean == 10.2
+
+    def test_find_regressions__within_noise(self, history):
+        add_runs(history, [10.0, 11.0, 10.5, 9.5, 10.0, 11.5])
+
+        run = history.get_runs("dev", limit=1)[0]
+        assert history.find_regressions(run, baseline_runs=10, threshold=3) == []
+
+    def test_find_regressions__not_enough_baseline(self, history):
+        add_runs(history, [10.0, 10.0, 20.0])
+
+        run = history.get_runs("dev", limit=1)[0]
+        assert history.find_regressions(run, baseline_runs=10, threshold=3) == []
+
+
+class TestRobotPerfCompare:
+    def test_no_history(self, cache_dir):
+        task = create_task(RobotPerfCompare, {})
+        task()
+        assert "regressions" not in task.return_values
+
+    def test_regression(self, history):
+        add_runs(history, [10.0, 11.0, 10.5, 9.5, 10.0, 20.0])
+
+        task = create_task(RobotPerfCompare, {"baseline_runs": 5})
+        task()
+
+        (regression,) = task.return_values["regressions"]
+        assert regression["test"] == "Perf.Insert"
+        assert regression["value"] == 20.0
+        assert regression["stdev"] == pytest.approx(0.57, abs=0.01)
+
+    def test_fail_on_regression(self, history):
+        add_runs(history, [10.0, 11.0, 10.5, 9.5, 10.0, 20.0])
+
+        task = create_task(RobotPerfCompare, {"fail_on_regression": True})
+        with pytest.raises(CumulusCIFailure, match="1 performance regression found"):
+            task()
+
+    def test_bad_threshold(self):
+        with pytest.raises(TaskOptionsError):
+            create_task(RobotPerfCompare, {"threshold": "high"})
@@ -2,14 +2,27 @@
 Tests for the robot task, specifically for options related to running tests in parallel
 """
 
+import json
 import sys
 from pathlib import Path
 from unittest import mock
 
+import pytest
+
+from cumulusci.core.config import BaseProjectConfig
 from cumulusci.tasks.robotframework import Robot
 from cumulusci.tasks.salesforce.tests.util import create_task
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path):
+    with mock.patch.object(
+        BaseProjectConfig, "cache_dir", new_callable=mock.PropertyMock
+    ) as cache_dir:
+        cache_dir.return_value = tmp_path / ".cci"
+        yield cache_dir.return_value
+
+
 class TestRobotParallel:
     """Tests for the robot task when running tests with pabot"""
 
@@ -139,3 +152,67 @@ class TestRobotParallel:
             stdout=sys.stdout,
             stderr=sys.stderr,
         )
+
+    @mock.patch("cumulusci.tasks.robotframework.robotframework.robot_run")
+    @mock.patch("cumulusci.tasks.robotframework.robotframework.subprocess.run")
+    def test_ordering_from_duration_history(
+        self, mock_subprocess_run, mock_robot_run, cache_dir, tmp_path
+    ):
+        """Verify that suites are ordered longest first when there is a history"""
+        history_file = cache_dir / "robot" / "durations.json"
+        history_file.parent.mkdir(parents=True)
+        history_file.write_text(
+            json.dumps(
+                {
+                    "suites": {"Tests.Fast": 1.5, "Tests.Slow": 90.0, "Tests.Mid": 10},
+                    "tests": {"Tests.Fast.Only": 1.5},
+                }
+            )
+        )
+        mock_subprocess_run.return_value = mock.Mock(returncode=0)
+        task = create_task(
+            Robot,
+            {
+                "suites": "tests",
+                "processes": "2",
+                "options": {"outputdir": str(tmp_path / "results")},
+            },
+        )
+        task()
+
+        cmd = mock_subprocess_run.call_args.args[0]
+        ordering_file = tmp_path / "results" / "pabot_ordering.txt"
+        assert cmd[cmd.index("--ordering") + 1] == str(ordering_file)
+        assert cmd.index("--ordering") < cmd.index("--pythonpath")
+        assert ordering_file.read_text().splitlines() == [
+            "--suite Tests.Slow",
+            "--suite Tests.Mid",
+            "--suite Tests.Fast",
+        ]
+
+    @mock.patch("cumulusci.tasks.robotframework.robotframework.robot_run")
+    @mock.patch("cumulusci.tasks.robotframework.robotframework.subprocess.run")
+    def test_ordering_from_duration_history__testlevelsplit(
+        self, mock_subprocess_run, mock_robot_run, cache_dir, tmp_path
+    ):
+        history_file = cache_dir / "robot" / "durations.json"
+        history_file.parent.mkdir(parents=True)
+        history_file.write_text(
+            json.dumps({"suites": {}, "tests": {"Tests.A.One": 1, "Tests.A.Two": 2}})
+        )
+        mock_subprocess_run.return_value = mock.Mock(returncode=0)
+        task = create_task(
+            Robot,
+            {
+                "suites": "tests",
+                "processes": "2",
+                "testlevelsplit": "true",
+                "options": {"outputdir": str(tmp_path)},
+            },
+        )
+        task()
+
+        assert (tmp_path / "pabot_ordering.txt").read_text().splitlines() == [
+            "--test Tests.A.Two",
+            "--test Tests.A.One",
+        ]
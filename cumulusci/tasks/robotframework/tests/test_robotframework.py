@@ -1,4 +1,5 @@
 import csv
+import json
 import os.path
 import re
 import shutil
@@ -19,9 +20,11 @@ from cumulusci.core.tests.utils import MockLoggerMixin
 from cumulusci.tasks.robotframework import Robot, RobotLibDoc, RobotTestDoc
 from cumulusci.tasks.robotframework.debugger import DebugListener
 from cumulusci.tasks.robotframework.libdoc import KeywordFile
+from cumulusci.tasks.robotframework.perf_history import PerfHistory
 from cumulusci.tasks.robotframework.robotframework import KeywordLogger
 from cumulusci.tasks.salesforce.tests.util import create_task
 from cumulusci.utils import temporary_dir, touch
+from cumulusci.utils.xml import robot_xml
 from cumulusci.utils.xml.robot_xml import log_perf_summary_from_xml
 
 
@@ -794,6 +797,42 @@ class TestRobotPerformanceKeywords:
             log_perf_summary_from_xml(Path(d) / "output.xml", logger_func)
             yield logger_func.mock_calls
 
+    def test_duration_history(self):
+        universal_config = UniversalConfig()
+        project_config = BaseProjectConfig(universal_config)
+        suite = Path(self.datadir) / "performance.robot"
+        with temporary_dir() as d:
+            project_config.repo_info["root"] = d
+            task = create_task(
+                Robot,
+                {
+                    "test": "Test FOR and IF statements",
+                    "suites": str(suite),
+                    "options": {"outputdir": d},
+                },
+                project_config=project_config,
+            )
+            task.logger = mock.Mock()
+            with mock.patch.object(
+                robot_xml, "ExecutionResult", wraps=robot_xml.ExecutionResult
+            ) as execution_result:
+                task()
+            # The output is parsed once for the log, durations and perf history
+            execution_result.assert_called_once()
+            assert " === Performance Results  === " in [
+                c.args[0] for c in task.logger.info.mock_calls
+            ]
+            with open(Path(d) / ".cci" / "robot" / "durations.json") as f:
+                history = json.load(f)
+            with PerfHistory(Path(d) / ".cci" / "robot" / "perf.db") as perf_history:
+                runs = perf_history.get_runs()
+                metrics = perf_history.get_metrics([runs[0].id])
+
+        assert list(history["suites"]) == ["Performance"]
+        assert list(history["tests"]) == ["Performance.Test FOR and IF statements"]
+        assert len(runs) == 1
+        assert metrics[("Performance.Test FOR and IF statements", "plugh")] == [4.0]
+
     def parse_metric(self, metric):
         name, value = metric.split(": ")
         value = value.strip("s ")  # strip seconds unit
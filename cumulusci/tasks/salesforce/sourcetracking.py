@@ -5,19 +5,26 @@ import os
 import re
 import time
 from collections import defaultdict
+from typing import Optional
+from xml.parsers import expat
+
+from lxml import etree
 
 from cumulusci.core.config import ScratchOrgConfig
 from cumulusci.core.sfdx import sfdx
 from cumulusci.core.utils import process_bool_arg, process_list_arg
-from cumulusci.tasks.metadata.package import PackageXmlGenerator
+from cumulusci.salesforce_api.metadata import ApiRetrieveUnpackaged
+from cumulusci.tasks.metadata.package import PackageXmlGenerator, metadata_sort_key
 from cumulusci.tasks.salesforce import BaseRetrieveMetadata, BaseSalesforceApiTask
 from cumulusci.utils import (
     inject_namespace,
     process_text_in_directory,
+    process_text_in_zipfile,
     temporary_dir,
     tokenize_namespace,
     touch,
 )
+from cumulusci.utils.xml import lxml_parse_string, metadata_tree
 
 
 class ListChanges(BaseSalesforceApiTask):
@@ -38,10 +45,18 @@ class ListChanges(BaseSalesforceApiTask):
         "snapshot": {
             "description": "If True, all matching items will be set to be ignored at their current revision number.  This will exclude them from the results unless a new edit is made."
         },
+        "watch": {
+            "description": "If True, keep polling the org and list new changes as they are made, until interrupted."
+        },
+        "poll_interval": {
+            "description": "Number of seconds to wait between polls in watch mode. Defaults to 10."
+        },
     }
 
     def _init_options(self, kwargs):
         super(ListChanges, self)._init_options(kwargs)
+        self.options["watch"] = process_bool_arg(self.options.get("watch", False))
+        self.options["poll_interval"] = int(self.options.get("poll_interval", 10))
         self.options["include"] = process_list_arg(self.options.get("include", [])) + [
             f"{mdtype}:" for mdtype in process_list_arg(self.options.get("types", []))
         ]
@@ -57,6 +72,12 @@ class ListChanges(BaseSalesforceApiTask):
         with self.project_config.open_cache("snapshot") as parent_dir:
             yield parent_dir / f"{self.org_config.name}.json"
 
+    @property
+    @contextlib.contextmanager
+    def _source_members_file(self):
+        with self.project_config.open_cache("snapshot") as parent_dir:
+            yield parent_dir / f"{self.org_config.name}.members.json"
+
     def _load_snapshot(self):
         """Load the snapshot of which component revisions have been retrieved."""
         self._snapshot = {}
@@ -65,6 +86,31 @@ class ListChanges(BaseSalesforceApiTask):
                 with sf.open("r", encoding="utf-8") as f:
                     self._snapshot = json.load(f)
 
+    def _load_source_members(self):
+        """Load the index of SourceMember revisions already queried from the org.
+
+        The index holds the current revision of every tracked member by type
+        and name, and the highest RevisionCounter seen, so that only members
+        changed since then need to be queried. It is discarded if it was
+        built for a different org."""
+        index = {}
+        with self._source_members_file as sf:
+            if sf.exists():
+                with sf.open("r", encoding="utf-8") as f:
+                    index = json.load(f)
+        if index.get("org_id") != self.org_config.org_id:
+            index = {}
+        self._source_members = {
+            "org_id": self.org_config.org_id,
+            "revision": index.get("revision", 0),
+            "members": index.get("members", {}),
+        }
+
+    def _store_source_members(self):
+        with self._source_members_file as sf:
+            with sf.open("w", encoding="utf-8") as f:
+                json.dump(self._source_members, f)
+
     def _run_task(self):
         self._load_snapshot()
         changes = self._get_changes()
@@ -89,21 +135,71 @@ class ListChanges(BaseSalesforceApiTask):
             self.logger.info("Storing snapshot of changes")
             self._store_snapshot(filtered)
 
-    def _get_changes(self):
-        """Get the SourceMember records that have changed since the last snapshot."""
+        if self.options["watch"]:
+            self._watch_changes()
+
+    def _watch_changes(self):
+        """Poll the org for members changed since the last poll and list them."""
+        self.logger.info(
+            f"Watching for changes every {self.options['poll_interval']} seconds."
+            " Press Ctrl+C to stop."
+        )
+        try:
+            while True:
+                time.sleep(self.options["poll_interval"])
+                filtered, _ = self._filter_changes(self._update_source_members())
+                for change in filtered:
+                    self.logger.info("{MemberType}: {MemberName}".format(**change))
+        except KeyboardInterrupt:
+            self.logger.info("Stopped watching for changes.")
+
+    def _update_source_members(self):
+        """Query the SourceMembers changed since the highest indexed revision.
+
+        Updates the index and returns the changed (non-obsolete) members."""
+        if not hasattr(self, "_source_members"):
+            self._load_source_members()
+        index = self._source_members
+        if index["revision"]:
+            where = f"RevisionCounter > {index['revision']}"
+        else:
+            where = "IsNameObsolete=false"
         sourcemembers = self.tooling.query_all(
-            "SELECT MemberName, MemberType, RevisionCounter FROM SourceMember "
-            "WHERE IsNameObsolete=false"
+            "SELECT MemberName, MemberType, RevisionCounter, IsNameObsolete "
+            f"FROM SourceMember WHERE {where}"
         )
-        changes = []
+
+        changed = []
         for sourcemember in sourcemembers["records"]:
-            mdtype = sourcemember["MemberType"]
-            name = sourcemember["MemberName"]
-            current_revnum = self._snapshot.get(mdtype, {}).get(name)
-            new_revnum = sourcemember["RevisionCounter"] or -1
-            if current_revnum and current_revnum == new_revnum:
-                continue
-            changes.append(sourcemember)
+            members = index["members"].setdefault(sourcemember["MemberType"], {})
+            revnum = sourcemember["RevisionCounter"] or -1
+            index["revision"] = max(index["revision"], revnum)
+            if sourcemember.get("IsNameObsolete"):
+                members.pop(sourcemember["MemberName"], None)
+            else:
+                members[sourcemember["MemberName"]] = revnum
+                changed.append(sourcemember)
+        if sourcemembers["records"]:
+            # Removals and a higher revision are worth keeping on their own
+            self._store_source_members()
+        return changed
+
+    def _get_changes(self):
+        """Get the SourceMember records that have changed since the last snapshot."""
+        self._update_source_members()
+        changes = []
+        for mdtype, members in self._source_members["members"].items():
+            for name, new_revnum in members.items():
+                current_revnum = self._snapshot.get(mdtype, {}).get(name)
+                if current_revnum and current_revnum == new_revnum:
+                    continue
+                changes.append(
+                    {
+                        "MemberType": mdtype,
+                        "MemberName": name,
+                        "RevisionCounter": None if new_revnum == -1 else new_revnum,
+                    }
+                )
         return changes
 
     def _filter_changes(self, changes):
@@ -164,8 +260,8 @@ retrieve_changes_task_options["namespace_tokenize"] = BaseRetrieveMetadata.task_
 ]
 
 
-def _write_manifest(changes, path, api_version):
-    """Write a package.xml for the specified changes and API version."""
+def _get_type_members(changes):
+    """Group changed components by the metadata type used to retrieve them."""
     type_members = defaultdict(list)
     for change in changes:
         mdtype = change["MemberType"]
@@ -173,24 +269,282 @@ def _write_manifest(changes, path, api_version):
         if mdtype.endswith("Folder"):
             mdtype = mdtype[: -len("Folder")]
         type_members[mdtype].append(change["MemberName"])
+    return type_members
 
+
+def _render_manifest(changes, api_version):
+    """Render a package.xml for the specified changes and API version."""
     generator = PackageXmlGenerator(
         ".",
         api_version,
-        types=[MetadataType(name, members) for name, members in type_members.items()],
+        types=[
+            MetadataType(name, members)
+            for name, members in _get_type_members(changes).items()
+        ],
     )
-    package_xml = generator()
+    return generator()
+
+
+def _write_manifest(changes, path, api_version):
+    """Write a package.xml for the specified changes and API version."""
+    package_xml = _render_manifest(changes, api_version)
     with open(os.path.join(path, "package.xml"), "w", encoding="utf-8") as f:
         f.write(package_xml)
 
 
+# Folders of metadata types whose files contain separately retrieved child
+# components. Other files, including XML static resources, documents and
+# email templates, are overwritten when they are retrieved.
+MERGED_METADATA_FOLDERS = {
+    "assignmentRules",
+    "autoResponseRules",
+    "escalationRules",
+    "labels",
+    "matchingRules",
+    "objects",
+    "sharingRules",
+    "workflows",
+}
+
+
+def _child_element_spans(content: bytes):
+    """Find the byte offsets of the top-level elements of an XML document.
+
+    Returns the offset just after the root element's start tag and a list of
+    (start, end) offsets of each of the root element's child elements.
+    """
+
+    def tag_end(offset):
+        return content.index(b">", offset) + 1
+
+    parser = expat.ParserCreate()
+    root_start_end = None
+    spans = []
+    depth = 0
+
+    def start_element(name, attrs):
+        nonlocal depth, root_start_end
+        if depth == 0:
+            root_start_end = tag_end(parser.CurrentByteIndex)
+        elif depth == 1:
+            start = parser.CurrentByteIndex
+            end = tag_end(start)
+            # an empty element tag (<tag/>) is complete; otherwise the end
+            # is found when the end tag is reached
+            spans.append([start, end if content[end - 2 : end] == b"/>" else None])
+        depth += 1
+
+    def end_element(name):
+        nonlocal depth
+        depth -= 1
+        if depth == 1 and spans[-1][1] is None:
+            spans[-1][1] = tag_end(parser.CurrentByteIndex)
+
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.Parse(content, True)
+    return root_start_end, [tuple(span) for span in spans]
+
+
+def _merge_metadata_xml(target_path, content: bytes) -> bytes:
+    """Merge a retrieved metadata XML file into the existing file at target_path.
+
+    Retrieving a child component (a field, a custom label, a workflow rule...)
+    returns its parent file containing only that child, so the file can't just
+    be overwritten. Top-level elements with a fullName replace the element with
+    the same tag and fullName (or are added after the others with that tag).
+    Other retrieved elements replace the existing elements with the same tag.
+
+    Elements are spliced in as text, so anything that wasn't retrieved is left
+    exactly as it was, including its formatting.
+    """
+    with open(target_path, "rb") as f:
+        original = f.read()
+    retrieved = lxml_parse_string(content).getroot()
+    root = lxml_parse_string(original).getroot()
+    if root.tag != retrieved.tag:
+        return content
+    full_name_tag = etree.QName(retrieved, "fullName").text
+
+    # The target is kept as the text before each top-level element (its
+    # indentation) and the element's text, with the tag and fullName of the
+    # element to match retrieved elements against.
+    head_end, spans = _child_element_spans(original)
+    entries = []
+    previous_end = head_end
+    for element, (start, end) in zip(
+        (e for e in root if isinstance(e.tag, str)), spans
+    ):
+        entries.append(
+            [
+                original[previous_end:start],
+                element.tag,
+                element.findtext(full_name_tag),
+                original[start:end],
+            ]
+        )
+        previous_end = end
+    head, tail = original[:head_end], original[previous_end:]
+
+    def new_entry(child, text, following=None, preceding=None):
+        # indent the new element like its neighbour
+        neighbour = following or preceding
+        gap = b"\n" + (
+            neighbour[0].rpartition(b"\n")[2] if neighbour is not None else b"    "
+        )
+        return [gap, child.tag, child.findtext(full_name_tag), text]
+
+    replaced_tags = set()
+    _, retrieved_spans = _child_element_spans(content)
+    for child, (start, end) in zip(
+        (e for e in retrieved if isinstance(e.tag, str)), retrieved_spans
+    ):
+        text = content[start:end]
+        existing = [entry for entry in entries if entry[1] == child.tag]
+        full_name = child.findtext(full_name_tag)
+        if full_name is not None:
+            match = next((e for e in existing if e[2] == full_name), None)
+            if match is not None:
+                match[3] = text
+                continue
+        elif child.tag not in replaced_tags:
+            replaced_tags.add(child.tag)
+            if existing:
+                index = entries.index(existing[0])
+                entries[index] = [existing[0][0], child.tag, None, text]
+                for entry in existing[1:]:
+                    entries.remove(entry)
+                continue
+
+        if existing:
+            index = entries.index(existing[-1]) + 1
+            entries.insert(index, new_entry(child, text, preceding=existing[-1]))
+        else:
+            # Salesforce orders a component's elements by tag name
+            localname = etree.QName(child).localname
+            index = next(
+                (
+                    i
+                    for i, entry in enumerate(entries)
+                    if etree.QName(entry[1]).localname > localname
+                ),
+                None,
+            )
+            if index is not None:
+                entries.insert(index, new_entry(child, text, following=entries[index]))
+            else:
+                preceding = entries[-1] if entries else None
+                entries.append(new_entry(child, text, preceding=preceding))
+
+    return head + b"".join(gap + text for gap, _, _, text in entries) + tail
+
+
+def _update_package_xml(path, type_members):
+    """Add any missing members to an existing package.xml"""
+    package = metadata_tree.parse(path)
+    for mdtype, members in sorted(type_members.items()):
+        types = package.find("types", name=mdtype)
+        if types is None:
+            following = next(
+                (
+                    t
+                    for t in package.findall("types")
+                    if t.find("name").text.upper() > mdtype.upper()
+                ),
+                package.find("version"),
+            )
+            if following is not None:
+                types = package.insert_before(following, "types")
+            else:
+                types = package.append("types")
+            types.append("name", mdtype)
+        for member in members:
+            existing = types.findall("members")
+            if any(m.text == member for m in existing):
+                continue
+            key = metadata_sort_key(member)
+            following = next(
+                (m for m in existing if metadata_sort_key(m.text) > key), None
+            )
+            if following is not None:
+                types.insert_before(following, "members", member)
+            else:
+                types.insert_before(types.find("name"), "members", member)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(package.tostring(xml_declaration=True))
+
+
+def retrieve_components_mdapi(
+    task,
+    components,
+    target: str,
+    extra_package_xml_opts: dict,
+    namespace_tokenize: Optional[str],
+    api_version: str,
+):
+    """Retrieve specified components from an org into a metadata format folder.
+
+    Unlike retrieve_components, this retrieves directly with the Metadata API
+    and merges only the retrieved files into the target folder, instead of
+    converting the whole folder to DX format and back with sfdx.
+    """
+    target = os.path.realpath(target)
+    package_xml_path = os.path.join(target, "package.xml")
+    new_package = not os.path.exists(package_xml_path) or not os.path.getsize(
+        package_xml_path
+    )
+    os.makedirs(target, exist_ok=True)
+
+    src_zip = ApiRetrieveUnpackaged(
+        task, _render_manifest(components, api_version), api_version
+    )()
+    if namespace_tokenize:
+        src_zip = process_text_in_zipfile(
+            src_zip,
+            functools.partial(tokenize_namespace, namespace=namespace_tokenize),
+        )
+
+    for name in src_zip.namelist():
+        if name == "package.xml" or name.endswith("/"):
+            continue
+        content = src_zip.read(name)
+        path = os.path.join(target, name)
+        if os.path.exists(path) and name.split("/")[0] in MERGED_METADATA_FOLDERS:
+            content = _merge_metadata_xml(path, content)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+    if new_package:
+        package_xml_opts = {
+            "directory": target,
+            "api_version": api_version,
+            **extra_package_xml_opts,
+        }
+        package_xml = PackageXmlGenerator(**package_xml_opts)()
+        with open(package_xml_path, "w", encoding="utf-8") as f:
+            f.write(package_xml)
+    else:
+        type_members = _get_type_members(components)
+        if namespace_tokenize:
+            type_members = {
+                mdtype: [
+                    tokenize_namespace("", member, namespace_tokenize)[1]
+                    for member in members
+                ]
+                for mdtype, members in type_members.items()
+            }
+        _update_package_xml(package_xml_path, type_members)
+
+
 def retrieve_components(
     components,
     org_config,
     target: str,
     md_format: bool,
     extra_package_xml_opts: dict,
-    namespace_tokenize: str,
+    namespace_tokenize: Optional[str],
     api_version: str,
 ):
     """Retrieve specified components from an org into a target folder.
@@ -351,15 +705,25 @@ class RetrieveChanges(ListChanges, BaseSalesforceApiTask):
                 }
             )
 
-        retrieve_components(
-            filtered,
-            self.org_config,
-            target,
-            md_format=self.md_format,
-            namespace_tokenize=self.options.get("namespace_tokenize"),
-            api_version=self.options["api_version"],
-            extra_package_xml_opts=package_xml_opts,
-        )
+        if self.md_format:
+            retrieve_components_mdapi(
+                self,
+                filtered,
+                target,
+                namespace_tokenize=self.options.get("namespace_tokenize"),
+                api_version=self.options["api_version"],
+                extra_package_xml_opts=package_xml_opts,
+            )
+        else:
+            retrieve_components(
+                filtered,
+                self.org_config,
+                target,
+                md_format=False,
+                namespace_tokenize=self.options.get("namespace_tokenize"),
+                api_version=self.options["api_version"],
+                extra_package_xml_opts=package_xml_opts,
+            )
 
         if self.options["snapshot"]:
             self.logger.info("Storing snapshot of changes")
@@ -1,5 +1,8 @@
 import io
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
@@ -54,6 +57,30 @@ class TestBaseSalesforceTask:
         assert update_config_called
         self.project_config.keychain.set_org.assert_called_once()
 
+    def test_update_credentials__threads(self):
+        refreshing = []
+        overlapped = []
+
+        def refresh_oauth_token(keychain):
+            refreshing.append(True)
+            overlapped.append(len(refreshing) > 1)
+            threading.Event().wait(0.05)
+            self.org_config.config["access_token"] = "TOKEN"
+            self.org_config.config["access_token_issued_at"] = time.time()
+            self.org_config.config.update({"userinfo": {}, "org_type": "Scratch"})
+            refreshing.pop()
+
+        self.org_config.refresh_oauth_token = refresh_oauth_token
+        tasks = [
+            BaseSalesforceTask(self.project_config, self.task_config, self.org_config)
+            for _ in range(4)
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda task: task._update_credentials(), tasks))
+
+        assert overlapped == [False]
+        self.project_config.keychain.set_org.assert_called_once()
+
 
 class TestBaseSalesforceApiTask:
     def test_sf_instance(self):
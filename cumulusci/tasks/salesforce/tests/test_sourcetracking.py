@@ -1,6 +1,8 @@
+import io
 import json
 import os
 import pathlib
+import zipfile
 from unittest import mock
 
 from cumulusci.core.config import OrgConfig
@@ -9,10 +11,41 @@ from cumulusci.tasks.salesforce.sourcetracking import (
     RetrieveChanges,
     SnapshotChanges,
     _write_manifest,
+    retrieve_components,
+    retrieve_components_mdapi,
 )
 from cumulusci.tests.util import create_project_config
 from cumulusci.utils import temporary_dir
 
+OBJECT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
+    {}
+</CustomObject>
+"""
+
+PACKAGE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Package xmlns="http://soap.sforce.com/2006/04/metadata">
+    <fullName>Test Package</fullName>
+    <types>
+        <members>Foo</members>
+        <name>ApexClass</name>
+    </types>
+    <types>
+        <members>Account.Existing__c</members>
+        <members>Account.Zebra__c</members>
+        <name>CustomField</name>
+    </types>
+    <version>52.0</version>
+</Package>
+"""
+
+
+def _make_zip(files):
+    zf = zipfile.ZipFile(io.BytesIO(), "w")
+    for name, content in files.items():
+        zf.writestr(name, content)
+    return zf
+
 
 class TestListChanges:
     """List the changes from a scratch org"""
@@ -92,6 +125,132 @@ class TestListChanges:
             task._run_task()
             assert "Found no changes." in messages
 
+    def test_run_task__incremental(self, create_task_fixture):
+        with temporary_dir():
+            task = create_task_fixture(ListChanges)
+            task._init_task()
+            task.tooling = mock.Mock()
+            task.logger = mock.Mock()
+            task.tooling.query_all.return_value = {
+                "totalSize": 2,
+                "records": [
+                    {
+                        "MemberType": "CustomObject",
+                        "MemberName": "Test__c",
+                        "RevisionCounter": 1,
+                        "IsNameObsolete": False,
+                    },
+                    {
+                        "MemberType": "CustomObject",
+                        "MemberName": "Deleted__c",
+                        "RevisionCounter": 2,
+                        "IsNameObsolete": False,
+                    },
+                ],
+            }
+            task._run_task()
+            assert "IsNameObsolete=false" in task.tooling.query_all.call_args[0][0]
+
+            task = create_task_fixture(ListChanges)
+            task._init_task()
+            task.tooling = mock.Mock()
+            messages = []
+            task.logger = mock.Mock()
+            task.logger.info = messages.append
+            task.tooling.query_all.return_value = {
+                "totalSize": 2,
+                "records": [
+                    {
+                        "MemberType": "CustomObject",
+                        "MemberName": "Deleted__c",
+                        "RevisionCounter": 3,
+                        "IsNameObsolete": True,
+                    },
+                    {
+                        "MemberType": "ApexClass",
+                        "MemberName": "Foo",
+                        "RevisionCounter": 4,
+                        "IsNameObsolete": False,
+                    },
+                ],
+            }
+            task._run_task()
+            assert "RevisionCounter > 2" in task.tooling.query_all.call_args[0][0]
+            assert "CustomObject: Test__c" in messages
+            assert "ApexClass: Foo" in messages
+            assert "CustomObject: Deleted__c" not in messages
+            assert task._source_members["revision"] == 4
+
+    def test_run_task__incremental_other_org(self, create_task_fixture):
+        with temporary_dir():
+            task = create_task_fixture(ListChanges)
+            task._init_task()
+            task._source_members = {
+                "org_id": "00D000000000002",
+                "revision": 5,
+                "members": {"ApexClass": {"Foo": 5}},
+            }
+            task._store_source_members()
+            task._load_source_members()
+            assert task._source_members["revision"] == 0
+            assert task._source_members["members"] == {}
+
+    def test_update_source_members__only_obsolete(self, create_task_fixture):
+        with temporary_dir():
+            task = create_task_fixture(ListChanges)
+            task._init_task()
+            task._source_members = {
+                "org_id": task.org_config.org_id,
+                "revision": 1,
+                "members": {"ApexClass": {"Foo": 1}},
+            }
+            task.tooling = mock.Mock()
+            task.tooling.query_all.return_value = {
+                "totalSize": 1,
+                "records": [
+                    {
+                        "MemberType": "ApexClass",
+                        "MemberName": "Foo",
+                        "RevisionCounter": 2,
+                        "IsNameObsolete": True,
+                    }
+                ],
+            }
+            assert task._update_source_members() == []
+
+            task._load_source_members()
+            assert task._source_members["revision"] == 2
+            assert task._source_members["members"] == {"ApexClass": {}}
+
+    @mock.patch("cumulusci.tasks.salesforce.sourcetracking.time.sleep")
+    def test_run_task__watch(self, sleep, create_task_fixture):
+        with temporary_dir():
+            task = create_task_fixture(ListChanges, {"watch": True})
+            task._init_task()
+            task.tooling = mock.Mock()
+            messages = []
+            task.logger = mock.Mock()
+            task.logger.info = messages.append
+            task.tooling.query_all.side_effect = [
+                {"totalSize": 0, "records": []},
+                {
+                    "totalSize": 1,
+                    "records": [
+                        {
+                            "MemberType": "ApexClass",
+                            "MemberName": "Foo",
+                            "RevisionCounter": 1,
+                            "IsNameObsolete": False,
+                        }
+                    ],
+                },
+            ]
+            sleep.side_effect = [None, KeyboardInterrupt]
+            task._run_task()
+            assert "ApexClass: Foo" in messages
+            assert "Stopped watching for changes." in messages
+            sleep.assert_called_with(10)
+
     def test_filter_changes__include(self, create_task_fixture):
         foo = {
             "MemberType": "CustomObject",
@@ -144,9 +303,16 @@ class TestRetrieveChanges:
             assert not task.md_format
             assert task.options["path"] == "force-app"
 
-    def test_run_task(self, sfdx, create_task_fixture):
-        sfdx_calls = []
-        sfdx.side_effect = lambda cmd, *args, **kw: sfdx_calls.append(cmd)
+    @mock.patch("cumulusci.tasks.salesforce.sourcetracking.ApiRetrieveUnpackaged")
+    def test_run_task(self, ApiRetrieveUnpackaged, sfdx, create_task_fixture):
+        ApiRetrieveUnpackaged.return_value.return_value = _make_zip(
+            {
+                "package.xml": "<Package />",
+                "objects/Test__c.object": OBJECT_XML.format(
+                    "<fields><fullName>ns__Field__c</fullName></fields>"
+                ),
+            }
+        )
 
         with temporary_dir():
             task = create_task_fixture(
@@ -167,12 +333,43 @@ class TestRetrieveChanges:
 
             task._run_task()
 
-            assert sfdx_calls == [
-                "force:mdapi:convert",
-                "force:source:retrieve",
-                "force:source:convert",
-            ]
-            assert os.path.exists(os.path.join("src", "package.xml"))
+            sfdx.assert_not_called()
+            package_xml = ApiRetrieveUnpackaged.call_args[0][1]
+            assert "<members>Test__c</members>" in package_xml
+            retrieved = pathlib.Path("src", "objects", "Test__c.object").read_text()
+            assert "<fullName>%%%NAMESPACE%%%Field__c</fullName>" in retrieved
+            package_xml = pathlib.Path("src", "package.xml").read_text()
+            assert "<members>Test__c</members>" in package_xml
+
+    def test_run_task__sfdx_format(self, sfdx, create_task_fixture):
+        sfdx_calls = []
+        sfdx.side_effect = lambda cmd, *args, **kw: sfdx_calls.append(cmd)
+
+        with temporary_dir():
+            project_config = create_project_config()
+            project_config.project__source_format = "sfdx"
+            with open("sfdx-project.json", "w") as f:
+                json.dump(
+                    {"packageDirectories": [{"path": "force-app", "default": True}]}, f
+                )
+            task = create_task_fixture(RetrieveChanges, {}, project_config)
+            task._init_task()
+            task.tooling = mock.Mock()
+            task.tooling.query_all.return_value = {
+                "totalSize": 1,
+                "records": [
+                    {
+                        "MemberType": "CustomObject",
+                        "MemberName": "Test__c",
+                        "RevisionCounter": 1,
+                    }
+                ],
+            }
+            task._reset_sfdx_snapshot = mock.Mock()
+
+            task._run_task()
+
+            assert sfdx_calls == ["force:source:retrieve"]
 
     def test_run_task__no_changes(self, sfdx, create_task_fixture):
         with temporary_dir() as path:
@@ -235,3 +432,149 @@ def test_write_manifest__folder():
         )
         package_xml = pathlib.Path(path, "package.xml").read_text()
         assert "<name>Report</name>" in package_xml
+
+
+@mock.patch("cumulusci.tasks.salesforce.sourcetracking.ApiRetrieveUnpackaged")
+def test_retrieve_components_mdapi__merges_into_existing_files(ApiRetrieveUnpackaged):
+    ApiRetrieveUnpackaged.return_value.return_value = _make_zip(
+        {
+            "package.xml": "<Package />",
+            "classes/Bar.cls": "public class Bar {}",
+            "staticresources/Data.resource": "<?xml version='1.0'?><data>new</data>",
+            "objects/Account.object": OBJECT_XML.format(
+                "<fields><fullName>Existing__c</fullName><label>New</label></fields>"
+                "<fields><fullName>Added__c</fullName><label>Added</label></fields>"
+                "<listViews><fullName>All</fullName></listViews>"
+            ),
+        }
+    )
+    components = [
+        {"MemberType": "ApexClass", "MemberName": "Bar"},
+        {"MemberType": "CustomField", "MemberName": "Account.Existing__c"},
+        {"MemberType": "CustomField", "MemberName": "Account.Added__c"},
+        {"MemberType": "ListView", "MemberName": "Account.All"},
+    ]
+    with temporary_dir() as path:
+        target = pathlib.Path(path, "src")
+        (target / "objects").mkdir(parents=True)
+        (target / "staticresources").mkdir()
+        (target / "staticresources" / "Data.resource").write_text(
+            "<?xml version='1.0'?><data><old/></data>"
+        )
+        (target / "package.xml").write_text(PACKAGE_XML)
+        (target / "objects" / "Account.object").write_text(
+            """<?xml version="1.0" encoding="UTF-8"?>
+<CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
+    <enableHistory>true</enableHistory>
+    <fields>
+        <fullName>Existing__c</fullName>
+        <label>Old</label>
+    </fields>
+    <!-- keep -->
+    <fields>
+        <fullName>Other__c</fullName>
+        <label>Other &amp; "quoted"</label>
+    </fields>
+    <searchLayouts></searchLayouts>
+</CustomObject>
+"""
+        )
+
+        retrieve_components_mdapi(
+            mock.Mock(),
+            components,
+            str(target),
+            extra_package_xml_opts={},
+            namespace_tokenize=None,
+            api_version="52.0",
+        )
+
+        assert (target / "classes" / "Bar.cls").read_text() == "public class Bar {}"
+        assert (
+            target / "staticresources" / "Data.resource"
+        ).read_text() == "<?xml version='1.0'?><data>new</data>"
+        assert (target / "objects" / "Account.object").read_text() == (
+            """<?xml version="1.0" encoding="UTF-8"?>
+<CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
+    <enableHistory>true</enableHistory>
+    <fields><fullName>Existing__c</fullName><label>New</label></fields>
+    <!-- keep -->
+    <fields>
+        <fullName>Other__c</fullName>
+        <label>Other &amp; "quoted"</label>
+    </fields>
+    <fields><fullName>Added__c</fullName><label>Added</label></fields>
+    <listViews><fullName>All</fullName></listViews>
+    <searchLayouts></searchLayouts>
+</CustomObject>
+"""
+        )
+        assert (target / "package.xml").read_text() == (
+            """<?xml version="1.0" encoding="UTF-8"?>
+<Package xmlns="http://soap.sforce.com/2006/04/metadata">
+    <fullName>Test Package</fullName>
+    <types>
+        <members>Bar</members>
+        <members>Foo</members>
+        <name>ApexClass</name>
+    </types>
+    <types>
+        <members>Account.Added__c</members>
+        <members>Account.Existing__c</members>
+        <members>Account.Zebra__c</members>
+        <name>CustomField</name>
+    </types>
+    <types>
+        <members>Account.All</members>
+        <name>ListView</name>
+    </types>
+    <version>52.0</version>
+</Package>
+"""
+        )
+
+
+@mock.patch("cumulusci.tasks.salesforce.sourcetracking.ApiRetrieveUnpackaged")
+def test_retrieve_components_mdapi__new_target(ApiRetrieveUnpackaged):
+    ApiRetrieveUnpackaged.return_value.return_value = _make_zip(
+        {
+            "package.xml": "<Package />",
+            "classes/Bar.cls": "public class Bar {}",
+            "classes/Bar.cls-meta.xml": "<?xml version='1.0'?><ApexClass />",
+        }
+    )
+    with temporary_dir() as path:
+        target = pathlib.Path(path, "src")
+        retrieve_components_mdapi(
+            mock.Mock(),
+            [{"MemberType": "ApexClass", "MemberName": "Bar"}],
+            str(target),
+            extra_package_xml_opts={"package_name": "Test Package"},
+            namespace_tokenize=None,
+            api_version="52.0",
+        )
+        package_xml = (target / "package.xml").read_text()
+        assert "<fullName>Test Package</fullName>" in package_xml
+        assert "<members>Bar</members>" in package_xml
+
+
+@mock.patch("cumulusci.tasks.salesforce.sourcetracking.sfdx")
+def test_retrieve_components__md_format(sfdx):
+    sfdx_calls = []
+    sfdx.side_effect = lambda cmd, *args, **kw: sfdx_calls.append(cmd)
+    org_config = mock.Mock(access_token="TOKEN", instance_url="https://test")
+    with temporary_dir() as path:
+        retrieve_components(
+            [{"MemberType": "ApexClass", "MemberName": "Bar"}],
+            org_config,
+            str(pathlib.Path(path, "src")),
+            md_format=True,
+            extra_package_xml_opts={},
+            namespace_tokenize="ns",
+            api_version="52.0",
+        )
+    assert sfdx_calls == [
+        "force:mdapi:convert",
+        "force:source:retrieve",
+        "force:source:convert",
+    ]
@@ -289,10 +289,11 @@ class ProfileGrantAllAccess(MetadataSingleEntityTransformTask, BaseSalesforceApi
             if layout_option:
                 # Look for page layout definitions in the record type
                 found_layout = False
-                for elem in tree.findall("layoutAssignments"):
-                    if elem.find("recordType").text == rt["record_type"]:
-                        elem.layout.text = layout_option
-                        found_layout = True
+                for elem in tree.findall(
+                    "layoutAssignments", recordType=rt["record_type"]
+                ):
+                    elem.layout.text = layout_option
+                    found_layout = True
 
                 if not found_layout:
                     assignment = tree.append(tag="layoutAssignments")
@@ -11,7 +11,6 @@ import textwrap
 import zipfile
 from datetime import datetime
 
-import requests
 import sarge
 
 from .xml import (  # noqa
@@ -124,6 +123,8 @@ removeXmlElement = remove_xml_element_directory
 
 
 def download_extract_zip(url, target=None, subfolder=None, headers=None):
+    import requests
+
     if not headers:
         headers = {}
     resp = requests.get(url, headers=headers)
@@ -1,4 +1,5 @@
 import os
+import time
 import urllib.request
 import webbrowser
 from contextlib import contextmanager
@@ -289,6 +290,38 @@ class FSResource:
 
 open_fs_resource = FSResource.open_fs_resource
 
+
+@contextmanager
+def lock_file(path: Union[str, Path], timeout: float = 120, poll_interval=0.1):
+    """Hold an exclusive lock, shared across processes, while in the context.
+
+    The lock is a file created atomically at `path`. A lock file older than
+    `timeout` seconds is assumed to be left over from a crashed process and is
+    broken, so waiting for the lock takes roughly `timeout` seconds at most."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - path.stat().st_mtime > timeout:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+            time.sleep(poll_interval)
+        else:
+            break
+    try:
+        os.close(fd)
+        yield path
+    finally:
+        try:
+            path.unlink()
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+
 if __name__ == "__main__":  # pragma: no cover
     import doctest
 
@@ -30,6 +30,9 @@ class SharedConfig(BaseModel):
     redirect_logging: bool
     connected_app: T.Optional[BaseConfig]  # a connected app service
     outbox_dir: Path  # where do jobs go when they are done
+    # attributes set on each task after it is created, for internal
+    # handles which should not be exposed as task options
+    task_attributes: T.Mapping[str, T.Any] = {}
 
     class Config:
         arbitrary_types_allowed = True
@@ -55,11 +58,30 @@ class WorkerConfig(SharedConfig):
             ),
             "connected_app": self.connected_app.config if self.connected_app else None,
             "redirect_logging": self.redirect_logging,
+            "task_attributes": dict(self.task_attributes),
             "project_config": {
                 "project": {"package": self.project_config.config["project"]["package"]}
             },
         }
 
+    def job_dict(self):
+        """The parts of the config which differ from job to job."""
+        return {
+            "task_options": self.task_options,
+            "working_dir": str(self.working_dir),
+            "outbox_dir": str(self.outbox_dir),
+        }
+
+    def for_job(self, job_dict) -> "WorkerConfig":
+        """Make a config for another job from the output of `job_dict`"""
+        return self.copy(
+            update={
+                "task_options": job_dict["task_options"],
+                "working_dir": Path(job_dict["working_dir"]),
+                "outbox_dir": Path(job_dict["outbox_dir"]),
+            }
+        )
+
     @staticmethod
     def from_dict(worker_config_json):  # todo: rename to `worker_config_dct`
         """Read from a dict of basic data structures/types, similar to JSON."""
@@ -86,6 +108,7 @@ class WorkerConfig(SharedConfig):
             if worker_config_json["connected_app"]
             else None,
             redirect_logging=worker_config_json["redirect_logging"],
+            task_attributes=worker_config_json.get("task_attributes", {}),
         )
 
 
@@ -124,6 +147,16 @@ class TaskWorker:
             logger=logger,
         )
 
+    def report_progress(self, results: dict):
+        """Pass partial results from a running task to the controller"""
+        self.results_reporter.put(
+            {
+                "status": "progress",
+                "results": results,
+                "directory": str(self.working_dir),
+            }
+        )
+
     def save_exception(self, e):
         """Write an exception to disk for later analysis"""
         exception_file = self.working_dir / "exception.txt"
@@ -134,6 +167,10 @@ class TaskWorker:
         with self.make_logger() as (logger, logfile):
             try:
                 self.subtask = self._make_task(self.task_class, logger)
+                if self.results_reporter and hasattr(self.subtask, "progress_reporter"):
+                    self.subtask.progress_reporter = self.report_progress
+                for name, value in self.task_attributes.items():
+                    setattr(self.subtask, name, value)
                 self.subtask()
                 logger.info(str(self.subtask.return_values))
                 logger.info("SubTask Success!")
@@ -153,7 +190,13 @@ class TaskWorker:
                 with self.filesystem_lock:
                     shutil.move(str(self.working_dir), str(self.failures_dir))
                 if self.results_reporter:
-                    self.results_reporter.put({"status": "error", "error": str(e)})
+                    self.results_reporter.put(
+                        {
+                            "status": "error",
+                            "error": str(e),
+                            "directory": str(self.working_dir),
+                        }
+                    )
                 raise
 
         try:
@@ -186,6 +229,35 @@ def run_task_in_worker(worker_dict: dict, results_reporter: Queue, filesystem_lo
     return worker.run()
 
 
+def run_tasks_in_pooled_worker(
+    worker_dict: dict,
+    jobs: Queue,
+    results_reporter: Queue,
+    filesystem_lock,
+    max_jobs: int,
+):
+    """Run the job in worker_dict, then further jobs from the `jobs` queue.
+
+    The project and org configs are only set up once. The worker exits
+    after `max_jobs` jobs, or when it receives None instead of a job."""
+    assert filesystem_lock
+    worker = TaskWorker(worker_dict, results_reporter, filesystem_lock)
+    for job_number in range(max_jobs):
+        if job_number:
+            job_dict = jobs.get()
+            if job_dict is None:
+                break
+            worker.worker_config = worker.worker_config.for_job(job_dict)
+        try:
+            worker.run()
+        except Exception:
+            # The failure is recorded in the job's directory. If the
+            # directory couldn't be moved out of the way, exit: the queue
+            # only recovers the jobs of workers which have died.
+            if worker.working_dir.exists():
+                raise
+
+
 def simplify(x):
     if isinstance(x, Path):
         return str(x)
@@ -227,6 +299,20 @@ class ParallelWorker:
     def is_alive(self) -> bool:
         return self.process.is_alive()
 
+    @property
+    def current_job(self) -> Path:
+        return self.worker_config.working_dir
+
+    @property
+    def busy(self) -> bool:
+        return self.is_alive()
+
+    @property
+    def abandoned_job(self) -> T.Optional[Path]:
+        """The job directory left behind if the worker died during the job"""
+        if not self.is_alive() and self.current_job.exists():
+            return self.current_job
+
     def terminate(self):
         # Note that this will throw an exception for threads
         # and should be used carefully for processes because
@@ -236,3 +322,62 @@ class ParallelWorker:
 
     def __repr__(self):
         return f"<Worker {self.worker_config.task_class.__name__} {self.worker_config.working_dir.name} Alive: {self.is_alive()}>"
+
+
+class PooledWorker(ParallelWorker):
+    """A long-lived worker which runs one job at a time
+
+    Unlike a plain ParallelWorker, which runs a single job, it waits for
+    further jobs after the first one. After `max_jobs` jobs it exits so
+    that it can be replaced by a fresh worker."""
+
+    def __init__(
+        self,
+        spawn_class,
+        worker_config: WorkerConfig,
+        results_reporter: Queue,
+        filesystem_lock,
+        jobs: Queue,
+        max_jobs: int,
+    ):
+        super().__init__(spawn_class, worker_config, results_reporter, filesystem_lock)
+        self.jobs = jobs
+        self.max_jobs = max_jobs
+        self.jobs_started = 1
+
+    def start(self):
+        dct = self.worker_config.as_dict()
+        self._validate_worker_config_is_simple(dct)
+        self.process = self.spawn_class(
+            target=run_tasks_in_pooled_worker,
+            args=[
+                dct,
+                self.jobs,
+                self.results_reporter,
+                self.filesystem_lock,
+                self.max_jobs,
+            ],
+            daemon=True,
+        )
+        self.process.start()
+
+    @property
+    def busy(self) -> bool:
+        # Workers move the job directory out of the in-progress
+        # directory as the last step of each job.
+        return self.is_alive() and self.current_job.exists()
+
+    @property
+    def accepts_jobs(self) -> bool:
+        return self.is_alive() and not self.busy and self.jobs_started < self.max_jobs
+
+    def push(self, worker_config: WorkerConfig):
+        """Hand another job to the idle worker"""
+        assert self.accepts_jobs
+        self.worker_config = worker_config
+        self.jobs_started += 1
+        self.jobs.put(worker_config.job_dict())
+
+    def stop(self):
+        """Let the worker exit once it is idle"""
+        self.jobs.put(None)
@@ -3,6 +3,7 @@
    """
 
 import logging
+import queue
 import shutil
 import typing as T
 from multiprocessing import get_context
@@ -11,7 +12,7 @@ from queue import Queue
 from tempfile import gettempdir
 from threading import Thread
 
-from .parallel_worker import ParallelWorker, SharedConfig, WorkerConfig
+from .parallel_worker import ParallelWorker, PooledWorker, SharedConfig, WorkerConfig
 
 logger = logging.getLogger(__file__)
 logger.setLevel(logging.DEBUG)
@@ -30,6 +31,9 @@ class WorkerQueueConfig(SharedConfig):
     # callable to generate task options
     make_task_options: T.Callable[..., T.Mapping[str, T.Any]]
     rename_directory: T.Optional[T.Callable]
+    # If set, workers are kept alive to run further jobs, up to this many
+    # each. Otherwise every job gets a new worker.
+    max_jobs_per_worker: T.Optional[int] = None
 
     def __init__(self, **kwargs):
         kwargs.setdefault("failures_dir", kwargs["parent_dir"] / "failures")
@@ -128,7 +132,11 @@ class WorkerQueue:
 
     @property
     def num_busy_workers(self) -> int:
-        return len([w for w in self.workers if w.is_alive()])
+        return len(self.busy_workers)
+
+    @property
+    def busy_workers(self) -> list:
+        return [w for w in self.workers if w.busy]
 
     @property
     def queued_job_dirs(self):
@@ -221,20 +229,63 @@ class WorkerQueue:
             **worker_config_data,
         )
 
-        worker = ParallelWorker(
-            self.config.spawn_class,
-            worker_config,
-            self.results_reporter,
-            self.filesystem_lock,
-        )
+        if not self.config.max_jobs_per_worker:
+            worker = ParallelWorker(
+                self.config.spawn_class,
+                worker_config,
+                self.results_reporter,
+                self.filesystem_lock,
+            )
+        else:
+            idle_worker = next((w for w in self.workers if w.accepts_jobs), None)
+            if idle_worker:
+                idle_worker.push(worker_config)
+                return
+            worker = PooledWorker(
+                self.config.spawn_class,
+                worker_config,
+                self.results_reporter,
+                self.filesystem_lock,
+                self._make_job_queue(),
+                self.config.max_jobs_per_worker,
+            )
         worker.start()
         self.workers.append(worker)
 
+    def _make_job_queue(self):
+        if self.config.spawn_class is self.Process:
+            return self.context.Queue()
+        return queue.Queue()
+
+    def _remove_dead_workers(self):
+        """Forget workers which have exited.
+
+        A worker which died in the middle of a job, e.g. because it was
+        killed, leaves its job behind in the in-progress directory. Those
+        jobs are moved to the failures directory."""
+        for worker in self.workers:
+            job_dir = worker.abandoned_job
+            if job_dir:
+                logger.info(f"Worker exited during job {job_dir}")
+                (job_dir / "exception.txt").write_text(
+                    f"Worker exited during job {job_dir.name}"
+                )
+                self.failures_dir.mkdir(exist_ok=True)
+                with self.filesystem_lock:
+                    shutil.move(str(job_dir), str(self.failures_dir))
+        self.workers = [w for w in self.workers if w.is_alive()]
+
+    def shutdown(self):
+        """Stop idle pooled workers. Busy workers stop after their job."""
+        for worker in self.workers:
+            if isinstance(worker, PooledWorker):
+                worker.stop()
+
     def tick(self):
         """Things are moved from place to place in the 'tick'.
         The tick runs in the parent/controller/original process
         so there are no threading/locking issues."""
-        self.workers = [w for w in self.workers if w.is_alive()]
+        self._remove_dead_workers()
 
         for idx, job_dir in zip(range(self.num_free_workers), self.queued_job_dirs):
             logger.info(f"Starting job {job_dir}")
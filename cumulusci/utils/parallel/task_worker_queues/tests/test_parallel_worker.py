@@ -1,8 +1,11 @@
+import time
 from contextlib import contextmanager
 from logging import getLogger
 from multiprocessing import Lock
 from pathlib import Path
+from queue import Queue
 from tempfile import TemporaryDirectory
+from threading import Thread
 from unittest import mock
 
 import pytest
@@ -294,6 +297,82 @@ class TestWorkerQueue:
             assert q2.outbox_jobs == ["foo"]
 
 
+class TestPooledWorkerQueue:
+    def wait_for(self, q, condition):
+        for _ in range(100):
+            q.tick()
+            if condition():
+                return
+            time.sleep(0.05)
+        raise AssertionError("Timed out")  # pragma: no cover
+
+    @contextmanager
+    def configure_pooled_queue(self, parent_dir, spawn_class=Thread, **kwargs):
+        config = WorkerQueueConfig(
+            project_config=dummy_project_config,
+            org_config=dummy_org_config,
+            connected_app=None,
+            redirect_logging=True,
+            spawn_class=mock.Mock(wraps=spawn_class),
+            parent_dir=Path(parent_dir),
+            name="start",
+            task_class=Sleep,
+            make_task_options=lambda *args, **kwargs: {"seconds": 0},
+            queue_size=3,
+            num_workers=1,
+            **kwargs,
+        )
+        q = WorkerQueue(config, filesystem_lock=Lock())
+        yield q
+        q.shutdown()
+
+    def test_workers_are_reused(self, tmpdir):
+        with self.configure_pooled_queue(tmpdir, max_jobs_per_worker=2) as q:
+            for name in ["a", "b", "c"]:
+                q.push(name=name)
+                self.wait_for(q, lambda: not q.busy_workers)
+
+            assert sorted(q.outbox_jobs) == ["a", "b", "c"]
+            # recycled after two jobs
+            assert len(q.config.spawn_class.mock_calls) == 2
+
+    def test_idle_workers_stop(self, tmpdir):
+        with self.configure_pooled_queue(tmpdir, max_jobs_per_worker=10) as q:
+            q.push(name="a")
+            self.wait_for(q, lambda: not q.busy_workers)
+            assert q.workers
+            q.shutdown()
+            self.wait_for(q, lambda: not q.workers)
+
+    def test_abandoned_job(self, tmpdir):
+        with self.configure_pooled_queue(
+            tmpdir, spawn_class=DelaySpawner, max_jobs_per_worker=10
+        ) as q:
+            q.push(name="a")
+            assert q.num_busy_workers == 1
+            # the worker dies without finishing its job
+            q.workers[0].process.terminate()
+            q.tick()
+
+            assert q.failed_jobs == ["a"]
+            assert "exited" in (q.failures_dir / "a" / "exception.txt").read_text()
+            assert not q.workers
+
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_job_cannot_be_moved(self, tmpdir):
+        with self.configure_pooled_queue(
+            tmpdir, max_jobs_per_worker=10
+        ) as q, mock.patch(
+            "cumulusci.utils.parallel.task_worker_queues.parallel_worker.shutil"
+        ) as shutil:
+            shutil.move.side_effect = OSError("Cannot move")
+            q.push(name="a")
+            # the worker exits instead of waiting for another job
+            self.wait_for(q, lambda: not q.workers)
+
+            assert q.failed_jobs == ["a"]
+
+
 class TestParallelWorker:
     def test_terminate_parallel_worker(self):
         with TemporaryDirectory() as failures_dir, TemporaryDirectory() as outbox_dir, TemporaryDirectory() as working_dir:
@@ -314,6 +393,14 @@ class TestParallelWorker:
             assert "Alive: False" in repr(worker)
 
 
+class ReportingSleep(Sleep):
+    progress_reporter = None
+
+    def _run_task(self):
+        self.progress_reporter({"slept": 0})
+        super()._run_task()
+
+
 class TestTaskWorker:
     def test_worker__cannot_move_to_outdir(self):
         with TemporaryDirectory() as failures_dir, TemporaryDirectory() as outbox_dir, TemporaryDirectory() as working_dir:
@@ -334,6 +421,54 @@ class TestTaskWorker:
                     p.run()
             assert Path(working_dir, "exception.txt").exists()
 
+    def test_worker__reports_progress(self):
+        with TemporaryDirectory() as parent_dir:
+            working_dir = Path(parent_dir, "1_10")
+            working_dir.mkdir()
+            config = WorkerConfig(
+                project_config=dummy_project_config,
+                org_config=dummy_org_config,
+                connected_app=None,
+                redirect_logging=True,
+                task_class=ReportingSleep,
+                task_options={"seconds": 0},
+                failures_dir=Path(parent_dir, "failures"),
+                outbox_dir=Path(parent_dir, "outbox"),
+                working_dir=working_dir,
+            )
+            results_reporter = Queue()
+            TaskWorker(config.as_dict(), results_reporter, Lock()).run()
+
+            progress = results_reporter.get(block=False)
+            assert progress == {
+                "status": "progress",
+                "results": {"slept": 0},
+                "directory": str(working_dir),
+            }
+            assert results_reporter.get(block=False)["status"] == "success"
+
+    def test_worker__sets_task_attributes(self):
+        with TemporaryDirectory() as parent_dir:
+            working_dir = Path(parent_dir, "1_10")
+            working_dir.mkdir()
+            config = WorkerConfig(
+                project_config=dummy_project_config,
+                org_config=dummy_org_config,
+                connected_app=None,
+                redirect_logging=True,
+                task_class=Sleep,
+                task_options={"seconds": 0},
+                task_attributes={"shared_state_id": "abc"},
+                failures_dir=Path(parent_dir, "failures"),
+                outbox_dir=Path(parent_dir, "outbox"),
+                working_dir=working_dir,
+            )
+            worker = TaskWorker(config.as_dict(), None, Lock())
+            worker.run()
+
+            assert worker.subtask.shared_state_id == "abc"
+            assert "shared_state_id" not in worker.subtask.options
+
 
 # Frankly these tests are primarily for coverage-counting purposes.
 # Meaningful tests of keychain stuff are by definition integration
@@ -16,6 +16,7 @@ from cumulusci.utils import fileutils, temporary_dir
 from cumulusci.utils.fileutils import (
     FSResource,
     load_from_source,
+    lock_file,
     open_fs_resource,
     view_file,
 )
@@ -253,3 +254,29 @@ class TestFSResourceError:
     def test_fs_resource_init_error(self):
         with pytest.raises(NotImplementedError):
             FSResource()
+
+
+class TestLockFile:
+    def test_lock_file(self, tmp_path):
+        path = tmp_path / "locks" / "test.lock"
+        with lock_file(path):
+            assert path.exists()
+        assert not path.exists()
+
+    def test_lock_file__waits(self, tmp_path):
+        path = tmp_path / "test.lock"
+        path.touch()
+        with mock.patch("cumulusci.utils.fileutils.time.sleep") as sleep:
+            sleep.side_effect = lambda _: path.unlink()
+            with lock_file(path):
+                pass
+        sleep.assert_called_once()
+
+    def test_lock_file__breaks_stale_lock(self, tmp_path):
+        path = tmp_path / "test.lock"
+        path.touch()
+        os.utime(path, (0, 0))
+        with mock.patch("cumulusci.utils.fileutils.time.sleep"):
+            with lock_file(path, timeout=10):
+                assert path.exists()
+        assert not path.exists()
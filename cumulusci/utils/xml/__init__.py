@@ -2,8 +2,6 @@ import typing as T
 import xml.etree.ElementTree as etree
 from pathlib import Path
 
-from lxml import etree as lxml_etree
-
 UTF8 = "UTF-8"
 
 
@@ -19,11 +17,13 @@ def elementtree_parse_file(path: T.Union[str, Path, T.IO]) -> etree.ElementTree:
     return tree
 
 
-def lxml_parse_file(path: T.Union[str, Path, T.IO]) -> lxml_etree._ElementTree:
+def lxml_parse_file(path: T.Union[str, Path, T.IO]):
     """Parse a file from filename, Path or stream using lxml for richer API
 
     Use this if you need advanced xpath and parent-pointer features.
     Otherwise prefer elementree_parse_file for performance and simplicity reasons."""
+    from lxml import etree as lxml_etree
+
     parser = lxml_etree.XMLParser(
         resolve_entities=False, load_dtd=False, no_network=True
     )
@@ -40,11 +40,12 @@ def lxml_parse_file(path: T.Union[str, Path, T.IO]) -> lxml_etree._ElementTree:
 elementtree_parse_string = etree.fromstring
 
 
-def lxml_parse_string(string: str) -> lxml_etree._ElementTree:
+def lxml_parse_string(string: str):
     """Parse a string using lxml for richer API
 
     Use this if you need advanced xpath and parent-pointer features.
     Otherwise prefer elementree_parse_string for performance and simplicity reasons."""
+    from lxml import etree as lxml_etree
 
     parser = lxml_etree.XMLParser(
         resolve_entities=False, load_dtd=False, no_network=True
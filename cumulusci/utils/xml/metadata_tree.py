@@ -15,7 +15,8 @@ Or to give a more Salesforce-y example:
 Account
 """
 
-from typing import Generator, Union
+import itertools
+from typing import Dict, Generator, Tuple, Union
 
 from lxml import etree
 
@@ -24,6 +25,18 @@ from .salesforce_encoding import serialize_xml_for_salesforce
 
 METADATA_NAMESPACE = "http://soap.sforce.com/2006/04/metadata"
 
+# Keyed lookups (e.g. `find("fieldPermissions", field="Account.Name")`) are
+# answered from an index once the same kind of lookup is repeated. An index
+# is stale once an element with one of the tags it depends on is added,
+# removed or has its text changed, which is tracked with a generation number
+# per tag. Only changes made through MetadataElement are tracked.
+_generations = itertools.count()
+_tag_generations: Dict[str, int] = {}
+
+
+def _touch(tag: str):
+    _tag_generations[tag] = next(_generations)
+
 
 def parse(source):
     """Parse a file by path or file object into a Metadata Tree
@@ -85,7 +98,7 @@ class MetadataElement:
     There are also methods for finding, appending, inserting and removing nodes, which have their own documentation.
     '''
 
-    __slots__ = ["_element", "_parent", "_ns", "tag"]
+    __slots__ = ["_element", "_parent", "_ns", "tag", "_indexes"]
 
     def __init__(self, element: etree._Element, parent: etree._Element = None):
         assert isinstance(element, etree._Element)
@@ -93,6 +106,7 @@ class MetadataElement:
         self._parent = parent
         self._ns = next(iter(element.nsmap.values()))
         self.tag = element.tag.split("}")[1]
+        self._indexes = None
 
     @property
     def text(self):
@@ -103,6 +117,7 @@ class MetadataElement:
     @text.setter
     def text(self, text):
         self._element.text = text
+        _touch(self.tag)
 
     def _wrap_element(self, child: etree._Element):
         return MetadataElement(child, self._element)
@@ -185,6 +200,7 @@ class MetadataElement:
             self._element.insert(index + 1, newchild._element)
         else:
             self._element.append(newchild._element)
+        _touch(tag)
         return newchild
 
     def insert(self, index: int, tag: str, text: str = None):
@@ -204,6 +220,7 @@ class MetadataElement:
         """
         newchild = self._create_child(tag, text)
         self._element.insert(index, newchild._element)
+        _touch(tag)
         return newchild
 
     def insert_before(self, oldElement: "MetadataElement", tag: str, text: str = None):
@@ -224,15 +241,60 @@ class MetadataElement:
     def remove(self, metadata_element: "MetadataElement") -> None:
         """Remove an element from its parent (self)"""
         self._element.remove(metadata_element._element)
+        _touch(metadata_element.tag)
 
     def find(self, tag, **kwargs):
         """Find a single direct child-elements with name `tag`"""
+        if kwargs:
+            matches = self._find_indexed(tag, kwargs)
+            if matches is not None:
+                return self._wrap_element(matches[0]) if matches else None
         return next(self._findall(tag, kwargs), None)
 
     def findall(self, tag, **kwargs):
         """Find all direct child-elements with name `tag`"""
+        if kwargs:
+            matches = self._find_indexed(tag, kwargs)
+            if matches is not None:
+                return [self._wrap_element(e) for e in matches]
         return list(self._findall(tag, kwargs))
 
+    def _find_indexed(self, type, kwargs: dict):
+        """Look up the children matching `kwargs` in an index.
+
+        Returns None if there is no usable index yet, in which case the
+        caller scans the children. The index is built the second time
+        the same tag is looked up by the same names."""
+        names = tuple(sorted(kwargs))
+        key = (type, names)
+        generations = tuple(_tag_generations.get(tag) for tag in (type,) + names)
+        if self._indexes is None:
+            self._indexes = {}
+        index = self._indexes.get(key)
+        if index is None or index[0] != generations:
+            # Seen for the first time, or stale: scan, and index next time
+            self._indexes[key] = (generations, None)
+            return None
+        if index[1] is None:
+            self._indexes[key] = index = (generations, self._build_index(type, names))
+        try:
+            return index[1].get(tuple(kwargs[name] for name in names), [])
+        except TypeError:  # unhashable values can't match text anyway
+            return None
+
+    def _build_index(self, type, names: Tuple[str, ...]) -> Dict[tuple, list]:
+        # Same rules as _sub_element_matches_spec
+        def value(e: etree._Element, name: str):
+            subelement = e.find(self._add_namespace(name))
+            if subelement is not None:
+                return subelement.text
+            return e.text if name == "text" else None
+
+        index = {}
+        for e in self._element.findall(self._add_namespace(type)):
+            index.setdefault(tuple(value(e, name) for name in names), []).append(e)
+        return index
+
     def _sub_element_matches_spec(self, e: etree._Element, name: str, value):
         matching_subelement = e.find(self._add_namespace(name))
         if matching_subelement is None and name != "text":
@@ -1,5 +1,5 @@
 import re
-from typing import Callable, Dict, NamedTuple
+from typing import Callable, Dict, List, NamedTuple
 
 from robot.api import ExecutionResult, ResultVisitor
 from robot.result.model import TestCase
@@ -61,6 +61,37 @@ def log_perf_summary_from_xml(
     result.visit(perf_summarizer)
 
 
+def log_perf_summaries(
+    summaries: List[PerfSummary],
+    logger_func: Callable,
+    formatter_func: Callable = _perf_formatter,
+):
+    """Like log_perf_summary_from_xml, for summaries that were already collected."""
+    pl = _perf_logger(logger_func, formatter_func)
+    next(pl)  # start the generator
+    for summary in summaries:
+        pl.send(summary)
+
+
+class RobotResults(NamedTuple):
+    perf_summaries: List[PerfSummary]
+    # Elapsed seconds keyed by long name, under "suites" and "tests"
+    durations: Dict[str, Dict[str, float]]
+
+
+def get_results_from_xml(robot_xml) -> RobotResults:
+    """Return the perf summaries and durations of a run, parsing its output once.
+
+    Only suites that have tests of their own are included in the durations."""
+    result = ExecutionResult(robot_xml)
+    collector = ResultCollector()
+    result.visit(collector)
+    return RobotResults(
+        collector.perf_summaries,
+        {"suites": collector.durations.suites, "tests": collector.durations.tests},
+    )
+
+
 def _perf_logger(logger_func: Callable, formatter_func: Callable):
     """Generator that connects visitor to logger"""
     # ensure we have at least one result before printing header
@@ -111,3 +142,40 @@ class PerfSummarizer(ResultVisitor):
         metrics["total_time"] = test.elapsedtime / 1000
 
         self.callable(PerfSummary(test.name, metrics, test))
+
+
+class DurationCollector(ResultVisitor):
+    """Robot ResultVisitor that records how long each suite and test ran"""
+
+    def __init__(self):
+        self.suites = {}
+        self.tests = {}
+
+    def end_suite(self, suite):
+        if suite.tests:
+            self.suites[suite.longname] = suite.elapsedtime / 1000
+
+    def end_test(self, test):
+        self.tests[test.longname] = test.elapsedtime / 1000
+
+
+class ResultCollector(ResultVisitor):
+    """Robot ResultVisitor that combines PerfSummarizer and DurationCollector"""
+
+    def __init__(self):
+        self.perf_summaries = []
+        self.perf_summarizer = PerfSummarizer(self.perf_summaries.append)
+        self.durations = DurationCollector()
+
+    def start_test(self, test):
+        self.perf_summarizer.start_test(test)
+
+    def end_message(self, message):
+        self.perf_summarizer.end_message(message)
+
+    def end_test(self, test):
+        self.perf_summarizer.end_test(test)
+        self.durations.end_test(test)
+
+    def end_suite(self, suite):
+        self.durations.end_suite(suite)
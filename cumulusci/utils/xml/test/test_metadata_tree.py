@@ -1,9 +1,15 @@
 from io import BytesIO
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
-from cumulusci.utils.xml.metadata_tree import METADATA_NAMESPACE, fromstring, parse
+from cumulusci.utils.xml.metadata_tree import (
+    METADATA_NAMESPACE,
+    MetadataElement,
+    fromstring,
+    parse,
+)
 
 standard_xml = f"""<Data xmlns='{METADATA_NAMESPACE}'>
                 <foo>Foo</foo>
@@ -165,6 +171,59 @@ class TestMetadataTree:
         assert Data.find("text").text == "Baz"
         assert Data.find("text", text="Baz").text == "Baz"
 
+    def test_matching__indexed(self):
+        Data = fromstring(standard_xml)
+        for _ in range(2):
+            assert Data.find("bar", name="Bar2").label.text == "Label2"
+            assert Data.find("bar", name=None) is None
+            assert Data.findall("foo", text="Foo2") == [Data.find("foo", text="Foo2")]
+            assert Data.find("bar", name="Bar1", label="Label2") is None
+            assert Data.find("bar", name=["unhashable"]) is None
+
+        Data.find("bar", name="Bar2").find("name").text = "Bar3"
+        assert Data.find("bar", name="Bar2") is None
+        assert Data.find("bar", name="Bar3").label.text == "Label2"
+
+        Data.find("foo", text="Foo").text = "Foo2"
+        assert len(Data.findall("foo", text="Foo2")) == 2
+
+        new = Data.append("bar")
+        new.append("name", "Bar3")
+        assert Data.findall("bar", name="Bar3")[1] == new
+        Data.remove(new)
+        assert len(Data.findall("bar", name="Bar3")) == 1
+        Data.find("bar", name="Bar3").remove(Data.find("bar", name="Bar3").name)
+        assert Data.find("bar", name="Bar3") is None
+        assert len(Data.findall("bar", name=None)) == 1
+
+    def test_matching__large_profile(self):
+        count = 20_000
+        permissions = "".join(
+            f"<fieldPermissions><editable>false</editable><field>Account.Field{i}__c"
+            "</field><readable>false</readable></fieldPermissions>"
+            for i in range(count)
+        )
+        Profile = fromstring(
+            f"<Profile xmlns='{METADATA_NAMESPACE}'>{permissions}</Profile>"
+        )
+
+        matches_spec = MetadataElement._sub_element_matches_spec
+        calls = []
+
+        def counting_matches_spec(*args):
+            calls.append(args)
+            return matches_spec(*args)
+
+        with mock.patch.object(
+            MetadataElement, "_sub_element_matches_spec", counting_matches_spec
+        ):
+            for i in range(count - 1, 0, -100):
+                elem = Profile.find("fieldPermissions", field=f"Account.Field{i}__c")
+                elem.editable.text = "true"
+        # Only the first lookup scans the children
+        assert len(calls) == count
+        assert len(Profile.findall("fieldPermissions", editable="true")) == 200
+
     def test_equality(self):
         Data = fromstring(standard_xml)
         assert Data.foo == Data.foo[0]
@@ -0,0 +1,111 @@
+"""Snapshots of parsed and validated cumulusci.yml files.
+
+Parsing and validating the YAML configuration takes a noticeable part of
+the start-up time of every cci command, and the configuration rarely
+changes between commands. Snapshots are pickles named after a hash of
+the YAML text and the CumulusCI version, so an edited file or an upgrade
+never reads a stale snapshot.
+"""
+
+import hashlib
+import os
+import pickle
+import typing as T
+from io import StringIO
+from logging import Logger
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+import cumulusci
+from cumulusci.utils.yaml.cumulusci_yml import (
+    _log_yaml_errors,
+    cci_safe_load,
+    default_logger,
+)
+
+# Older snapshots are removed once there are more than this many.
+MAX_SNAPSHOTS = 200
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(f"{cumulusci.__version__}\n{text}".encode()).hexdigest()
+
+
+class ConfigCache:
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def load_yaml(
+        self,
+        source: T.Union[str, Path, StringIO],
+        context: T.Optional[str] = None,
+        logger: T.Optional[Logger] = None,
+    ) -> T.Tuple[dict, str]:
+        """Like cci_safe_load, but reuse an earlier result for the same YAML.
+
+        Returns the data and a digest identifying the YAML. Validation
+        warnings are logged every time, whether or not a snapshot was used."""
+        if isinstance(source, StringIO):
+            text = source.getvalue()
+        else:
+            text = Path(source).read_text(encoding="utf-8")
+            context = context or str(source)
+        digest = _digest(text)
+
+        snapshot = self._read(digest)
+        if snapshot is None:
+            errors = []
+            data = cci_safe_load(StringIO(text), context, on_error=errors.append)
+            snapshot = (data, errors)
+            self._write(digest, snapshot)
+
+        data, errors = snapshot
+        if errors:
+            _log_yaml_errors(logger or default_logger, errors)
+        return data, digest
+
+    def merged(self, digests: T.Sequence[str], merge: T.Callable[[], dict]) -> dict:
+        """Return the result of `merge`, or its snapshot for the same inputs.
+
+        `digests` must identify everything that the merged config depends on."""
+        digest = _digest("merged " + " ".join(digests))
+        config = self._read(digest)
+        if config is None:
+            config = merge()
+            self._write(digest, config)
+        return config
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / f"{digest}.pickle"
+
+    def _read(self, digest: str):
+        path = self._path(digest)
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)
+            # Snapshots in use are kept when old ones are pruned.
+            os.utime(path)
+            return value
+        except Exception:
+            # Missing or unreadable, e.g. written by another Python version
+            return None
+
+    def _write(self, digest: str, value):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "wb", dir=self.directory, suffix=".tmp", delete=False
+            ) as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Other cci processes may be reading the same snapshot
+            os.replace(f.name, self._path(digest))
+            self._prune()
+        except OSError as e:
+            default_logger.debug(f"Could not save configuration snapshot: {e}")
+
+    def _prune(self):
+        snapshots = sorted(
+            self.directory.glob("*.pickle"), key=lambda path: path.stat().st_mtime
+        )
+        for path in snapshots[:-MAX_SNAPSHOTS]:
+            path.unlink(missing_ok=True)
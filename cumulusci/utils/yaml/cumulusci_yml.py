@@ -74,6 +74,7 @@ class Flow(CCIDictModel):
     description: str = None
     steps: Dict[str, Step] = None
     group: str = None
+    batch_metadata_etl: bool = False
 
 
 class Package(CCIDictModel):
@@ -0,0 +1,64 @@
+from io import StringIO
+from unittest import mock
+
+from cumulusci.utils.yaml import config_cache
+from cumulusci.utils.yaml.config_cache import ConfigCache
+
+
+class TestConfigCache:
+    def test_load_yaml(self, tmp_path):
+        cache = ConfigCache(tmp_path / "cache")
+        path = tmp_path / "cumulusci.yml"
+        path.write_text("project:\n  name: Test\n")
+
+        with mock.patch.object(
+            config_cache, "cci_safe_load", wraps=config_cache.cci_safe_load
+        ) as cci_safe_load:
+            data, digest = cache.load_yaml(path)
+            assert cache.load_yaml(path) == (data, digest)
+            assert data == {"project": {"name": "Test"}}
+            assert len(cci_safe_load.mock_calls) == 1
+
+            path.write_text("project:\n  name: Changed\n")
+            changed_data, changed_digest = cache.load_yaml(path)
+            assert changed_data == {"project": {"name": "Changed"}}
+            assert changed_digest != digest
+            assert len(cci_safe_load.mock_calls) == 2
+
+    def test_load_yaml__returns_copies(self, tmp_path):
+        cache = ConfigCache(tmp_path)
+        data, _ = cache.load_yaml(StringIO("project:\n  name: Test\n"))
+        data["project"]["name"] = "Mutated"
+        data, _ = cache.load_yaml(StringIO("project:\n  name: Test\n"))
+        assert data == {"project": {"name": "Test"}}
+
+    def test_load_yaml__warnings_repeated(self, tmp_path):
+        cache = ConfigCache(tmp_path)
+        logger = mock.Mock()
+        for _ in range(2):
+            cache.load_yaml(StringIO("xyz: abc\n"), "foo.yml", logger=logger)
+        warnings = [str(c) for c in logger.warning.mock_calls]
+        assert len([w for w in warnings if "xyz" in w]) == 2
+
+    def test_load_yaml__unreadable_snapshot(self, tmp_path):
+        cache = ConfigCache(tmp_path)
+        _, digest = cache.load_yaml(StringIO("project: {}\n"))
+        (tmp_path / f"{digest}.pickle").write_bytes(b"garbage")
+        assert cache.load_yaml(StringIO("project: {}\n")) == ({"project": {}}, digest)
+
+    def test_merged(self, tmp_path):
+        cache = ConfigCache(tmp_path)
+        merge = mock.Mock(return_value={"merged": True})
+        assert cache.merged(["a", "b"], merge) == {"merged": True}
+        assert cache.merged(["a", "b"], merge) == {"merged": True}
+        merge.assert_called_once()
+        cache.merged(["a", "c"], merge)
+        assert len(merge.mock_calls) == 2
+
+    def test_prune(self, tmp_path):
+        cache = ConfigCache(tmp_path)
+        with mock.patch.object(config_cache, "MAX_SNAPSHOTS", 2):
+            for i in range(3):
+                cache.merged([str(i)], lambda: {})
+        assert len(list(tmp_path.glob("*.pickle"))) == 2
+        assert not list(tmp_path.glob("*.tmp"))